@@ -1,7 +1,16 @@
-from typing import Optional, List
+from array import array
+from math import ceil, exp
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+import argparse
+import csv
+import json
 import sys
+import zlib
 
 class Product:
+    # fixed attribute set, so no per-instance __dict__
+    __slots__ = ("product_id", "name", "category", "price", "stock")
 
     def __init__(self, product_id: str, name: str, category: str, price: float, stock: int):
         self.product_id = product_id
@@ -19,67 +28,662 @@ class Product:
     def __str__(self) -> str:
         return f"[{self.product_id}] {self.name} ({self.category}) - RM{self.price:.2f}, Stock: {self.stock}"
 
+# called as listener(old, new) after every change: (None, p) for a new product,
+# (old, p) when an id is replaced and (old, None) when it is removed
+ChangeListener = Callable[[Optional[Product], Optional[Product]], None]
+
+
 class Node:
     def __init__(self, product: Product, next_node: Optional['Node'] = None):
         self.product = product
         self.next = next_node
 
+def _is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    if n % 2 == 0:
+        return n == 2
+    i = 3
+    while i * i <= n:
+        if n % i == 0:
+            return False
+        i += 2
+    return True
+
+
+def _next_prime(n: int) -> int:
+    while not _is_prime(n):
+        n += 1
+    return n
+
+
+def _next_power_of_two(n: int) -> int:
+    size = 1
+    while size < n:
+        size <<= 1
+    return size
+
+
+# --- hash strategies ---
+# a strategy maps a string key to a non-negative int (the built-in hash may also be
+# negative; Python's % and & still give a valid bucket for it, without abs() folding
+# h and -h together). Only "builtin" depends on PYTHONHASHSEED.
+_MASK64 = (1 << 64) - 1
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+
+
+def fnv1a_64(key: str) -> int:
+    """64-bit FNV-1a over the utf-8 bytes of key. Same value in every process."""
+    h = _FNV_OFFSET
+    for b in key.encode("utf-8"):
+        h = ((h ^ b) * _FNV_PRIME) & _MASK64
+    return h
+
+
+def _fmix64(h: int) -> int:
+    # murmur3 / xxHash-style final avalanche, so every input bit reaches the low bits
+    h ^= h >> 33
+    h = (h * 0xFF51AFD7ED558CCD) & _MASK64
+    h ^= h >> 33
+    h = (h * 0xC4CEB9FE1A85EC53) & _MASK64
+    h ^= h >> 33
+    return h
+
+
+def fnv1a_mix64(key: str) -> int:
+    """FNV-1a followed by a 64-bit mix; safest choice for power-of-two masking."""
+    return _fmix64(fnv1a_64(key))
+
+
+def crc32_hash(key: str) -> int:
+    """zlib CRC-32: deterministic and runs in C, but only 32 bits wide."""
+    return zlib.crc32(key.encode("utf-8"))
+
+
+HashFunction = Callable[[str], int]
+
+HASH_FUNCTIONS: Dict[str, HashFunction] = {
+    "builtin": hash,
+    "fnv1a": fnv1a_64,
+    "fnv1a-mix": fnv1a_mix64,
+    "crc32": crc32_hash,
+}
+
+# how a hash value becomes a bucket: modulo a prime size or mask a power-of-two size
+INDEXING = ("modulo", "mask")
+
+
+def resolve_hash_function(hash_fn: Union[str, HashFunction]) -> HashFunction:
+    if callable(hash_fn):
+        return hash_fn
+    try:
+        return HASH_FUNCTIONS[hash_fn]
+    except KeyError:
+        raise ValueError(f"unknown hash function {hash_fn!r}, expected one of {sorted(HASH_FUNCTIONS)}") from None
+
+
+# buckets (or slots) visited per scan() call unless the caller asks otherwise
+SCAN_COUNT = 256
+# a position-based scan cursor packs, from the top: how many times the scan has started
+# over, a tag for the table layout it walks (bucket count or resize epoch), the position
+_CURSOR_SHIFT = 32
+_CURSOR_FIELD = (1 << _CURSOR_SHIFT) - 1
+# a scan overtaken by resizes starts over at most this many times, then carries on from
+# where it was, so it still ends while the table keeps resizing (see HashTable.scan)
+SCAN_MAX_RESTARTS = 4
+# a reverse-binary scan cursor (power-of-two tables) counts in this many bits
+_CURSOR_BITS = 64
+_CURSOR_ALL = (1 << _CURSOR_BITS) - 1
+
+
+def _make_cursor(tag: int, pos: int, restarts: int = 0) -> int:
+    return (((restarts << _CURSOR_SHIFT) | (tag & _CURSOR_FIELD)) << _CURSOR_SHIFT) | pos
+
+
+def _split_cursor(cursor: int) -> Tuple[int, int, int]:
+    # (tag, pos, restarts)
+    if cursor < 0:
+        raise ValueError("scan cursor must be >= 0")
+    return (cursor >> _CURSOR_SHIFT) & _CURSOR_FIELD, cursor & _CURSOR_FIELD, cursor >> (2 * _CURSOR_SHIFT)
+
+
+# each byte value with its bits in reverse order
+_REVERSED_BYTES = bytes(int(f"{b:08b}"[::-1], 2) for b in range(256))
+
+
+def _reverse_bits(v: int) -> int:
+    # reverse the 64-bit value: reverse the bits of each byte, then the byte order
+    return int.from_bytes(v.to_bytes(8, "big").translate(_REVERSED_BYTES), "little")
+
+
+def _next_reverse_cursor(v: int, mask: int) -> int:
+    # add one to the cursor's bits under mask, carrying from the highest bit down
+    # (Redis SCAN): the bits above the mask are set so the carry passes through them
+    v = _reverse_bits(v | (_CURSOR_ALL ^ mask)) + 1
+    return _reverse_bits(v & _CURSOR_ALL)
+
+
 class HashTable:
-    def __init__(self, size: int = 1031):
+    # grow once count/size goes above MAX_LOAD, shrink (never below the
+    # starting size) once it drops under MIN_LOAD after removals
+    MAX_LOAD = 0.75
+    MIN_LOAD = 0.125
+    # old buckets migrated per operation while an incremental rehash is running
+    REHASH_STEP = 4
+
+    def __init__(self, size: int = 1031, max_load: float = MAX_LOAD, min_load: float = MIN_LOAD,
+                 auto_shrink: bool = True, hash_fn: Union[str, HashFunction] = "builtin",
+                 indexing: str = "modulo"):
+        if indexing not in INDEXING:
+            raise ValueError(f"indexing must be one of {INDEXING}")
+        self.hash_fn = resolve_hash_function(hash_fn)
+        self.indexing = indexing
+        self._pow2 = indexing == "mask"
+        # the starting size follows the same rule as every resize: a prime for
+        # modulo, a power of two for masking
+        size = self._size_for(size)
         self.size = size
         self.buckets: List[Optional[Node]] = [None] * size
         self.count = 0
+        self.max_load = max_load
+        self.min_load = min_load
+        self.auto_shrink = auto_shrink
+        self._min_size = size
+        # incremental rehash state: while _old_buckets is set, entries in
+        # old buckets [_rehash_pos:] have not been moved into self.buckets yet
+        self._old_buckets: Optional[List[Optional[Node]]] = None
+        self._old_size = 0
+        self._rehash_pos = 0
+        # counters so resizing can be observed from outside
+        self.grow_count = 0
+        self.shrink_count = 0
+        self.max_chain_length = 0
+        # live items() iterators; resizes their cursor cannot follow wait until they finish
+        self._iterators = 0
+        self._listeners: List[ChangeListener] = []
+
+    # --- change listeners (secondary indexes, caches, logs hook in here) ---
+    def add_listener(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ChangeListener) -> None:
+        self._listeners.remove(listener)
+
+    def _notify(self, old: Optional[Product], new: Optional[Product]) -> None:
+        for listener in self._listeners:
+            listener(old, new)
+
+    def _slot(self, h: int, size: int) -> int:
+        return h & (size - 1) if self._pow2 else h % size
+
     def _hash(self, key: str) -> int:
-        return abs(hash(key)) % self.size
+        return self._slot(self.hash_fn(key), self.size)
+
+    def _old_hash(self, key: str) -> int:
+        return self._slot(self.hash_fn(key), self._old_size)
+
+    def _size_for(self, n: int) -> int:
+        # smallest valid bucket count >= n for the indexing mode
+        return _next_power_of_two(n) if self._pow2 else _next_prime(n)
+
+    def _grown_size(self) -> int:
+        # double: a power of two is already valid, a prime table takes the next prime above 2n
+        return self.size * 2 if self._pow2 else _next_prime(self.size * 2 + 1)
+
+    def _shrunk_size(self) -> int:
+        # halve, the mirror image of _grown_size
+        return self.size // 2 if self._pow2 else _next_prime(self.size // 2)
+
+    def _bucket_indexes(self, keys: Iterable[str], size: int) -> List[int]:
+        # hash a whole batch up front
+        hash_fn = self.hash_fn
+        if self._pow2:
+            mask = size - 1
+            return [hash_fn(key) & mask for key in keys]
+        return [hash_fn(key) % size for key in keys]
+
+    @property
+    def resize_count(self) -> int:
+        return self.grow_count + self.shrink_count
+
+    @property
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def is_rehashing(self) -> bool:
+        return self._old_buckets is not None
+
+    # --- resizing ---
+    def _start_resize(self, new_size: int) -> None:
+        if self._old_buckets is not None:
+            # a new resize while the previous one is still running: finish it first
+            self._rehash_step(self._old_size)
+        self._old_buckets = self.buckets
+        self._old_size = self.size
+        self._rehash_pos = 0
+        self.size = new_size
+        self.buckets = [None] * new_size
+
+    def _rehash_step(self, steps: int = REHASH_STEP) -> None:
+        old = self._old_buckets
+        if old is None:
+            return
+        buckets = self.buckets
+        pos = self._rehash_pos
+        end = min(pos + steps, self._old_size)
+        while pos < end:
+            node = old[pos]
+            old[pos] = None
+            while node is not None:
+                nxt = node.next
+                idx = self._hash(node.product.product_id)
+                node.next = buckets[idx]
+                buckets[idx] = node
+                node = nxt
+            pos += 1
+        self._rehash_pos = pos
+        if pos >= self._old_size:
+            self._old_buckets = None
+            self._old_size = 0
+            self._rehash_pos = 0
+
+    def _resize_deferred(self, growing: bool) -> bool:
+        # a reverse-binary cursor (mask indexing) follows a grow but may repeat entries
+        # across a shrink; a modulo cursor follows neither
+        return self._iterators > 0 and (not self._pow2 or not growing)
+
+    def _maybe_grow(self) -> None:
+        if self.count > self.size * self.max_load and not self._resize_deferred(True):
+            self.grow_count += 1
+            self._start_resize(self._grown_size())
+
+    def _maybe_shrink(self) -> None:
+        if not self.auto_shrink or self.size <= self._min_size:
+            return
+        if self.count < self.size * self.min_load and not self._resize_deferred(False):
+            self.shrink_count += 1
+            self._start_resize(max(self._min_size, self._shrunk_size()))
+
+    def _old_bucket_index(self, key: str) -> int:
+        # index into _old_buckets if key may still live there, otherwise -1
+        if self._old_buckets is None:
+            return -1
+        idx = self._old_hash(key)
+        return idx if idx >= self._rehash_pos else -1
 
     def insert(self, product: Product) -> None:
         # Prevent duplicate product_id: replace existing
-        idx = self._hash(product.product_id)
+        self._rehash_step()
+        key = product.product_id
+        old_idx = self._old_bucket_index(key)
+        if old_idx >= 0:
+            node = self._old_buckets[old_idx]
+            while node is not None:
+                if node.product.product_id == key:
+                    old = node.product
+                    node.product = product
+                    if self._listeners:
+                        self._notify(old, product)
+                    return
+                node = node.next
+        idx = self._hash(key)
         node = self.buckets[idx]
+        chain = 1
         while node is not None:
-            if node.product.product_id == product.product_id:
+            if node.product.product_id == key:
                 # replace existing product record
+                old = node.product
                 node.product = product
+                if self._listeners:
+                    self._notify(old, product)
                 return
             node = node.next
+            chain += 1
         # otherwise prepend
         node = Node(product, self.buckets[idx])
         self.buckets[idx] = node
         self.count += 1
+        if chain > self.max_chain_length:
+            self.max_chain_length = chain
+        self._maybe_grow()
+        if self._listeners:
+            self._notify(None, product)
 
     def search(self, product_id: str) -> Optional[Product]:
+        self._rehash_step()
         idx = self._hash(product_id)
         node = self.buckets[idx]
         while node:
             if node.product.product_id == product_id:
                 return node.product
             node = node.next
+        old_idx = self._old_bucket_index(product_id)
+        if old_idx >= 0:
+            node = self._old_buckets[old_idx]
+            while node:
+                if node.product.product_id == product_id:
+                    return node.product
+                node = node.next
         return None
 
-    def remove(self, product_id: str) -> bool:
-        idx = self._hash(product_id)
+    def _unlink(self, buckets: List[Optional[Node]], idx: int, product_id: str) -> Optional[Product]:
+        # detach product_id from its chain and return the removed product
         prev = None
-        node = self.buckets[idx]
+        node = buckets[idx]
         while node:
             if node.product.product_id == product_id:
                 if prev is None:
-                    self.buckets[idx] = node.next
+                    buckets[idx] = node.next
                 else:
                     prev.next = node.next
-                self.count -= 1
-                return True
+                return node.product
             prev = node
             node = node.next
-        return False
+        return None
 
-    def display_all(self) -> None:
-        print("\n Baby Shop Inventory:\n")
-        any_item = False
+    def remove(self, product_id: str) -> bool:
+        self._rehash_step()
+        removed = self._unlink(self.buckets, self._hash(product_id), product_id)
+        if removed is None:
+            old_idx = self._old_bucket_index(product_id)
+            if old_idx >= 0:
+                removed = self._unlink(self._old_buckets, old_idx, product_id)
+        if removed is None:
+            return False
+        self.count -= 1
+        self._maybe_shrink()
+        if self._listeners:
+            self._notify(removed, None)
+        return True
+
+    # --- bulk operations ---
+    def _finish_rehash(self) -> None:
+        if self._old_buckets is not None:
+            self._rehash_step(self._old_size)
+
+    def reserve(self, n: int) -> None:
+        """Make room for n entries in one rebuild instead of growing step by step."""
+        self._finish_rehash()
+        needed = int(n / self.max_load) + 1
+        if needed <= self.size or self._resize_deferred(True):
+            return
+        # at least double, so a stream of chunked batches still rebuilds only O(log n) times
+        new_size = self._size_for(max(needed, self._grown_size()))
+        self.grow_count += 1
+        old = self.buckets
+        self.size = new_size
+        self.buckets = [None] * new_size
+        self._old_buckets = old
+        self._old_size = len(old)
+        self._rehash_pos = 0
+        self._rehash_step(self._old_size)
+
+    def insert_many(self, products: Iterable[Product]) -> int:
+        """Insert (or replace) every product. Return how many new ids were added."""
+        if not isinstance(products, list):
+            products = list(products)
+        self.reserve(self.count + len(products))
+        buckets = self.buckets
+        size = self.size
+        added = 0
+        longest = self.max_chain_length
+        notify = self._notify if self._listeners else None
+        indexes = self._bucket_indexes([p.product_id for p in products], size)
+        for product, idx in zip(products, indexes):
+            key = product.product_id
+            node = buckets[idx]
+            chain = 1
+            while node is not None:
+                if node.product.product_id == key:
+                    old = node.product
+                    node.product = product
+                    if notify:
+                        notify(old, product)
+                    break
+                node = node.next
+                chain += 1
+            else:
+                buckets[idx] = Node(product, buckets[idx])
+                added += 1
+                if chain > longest:
+                    longest = chain
+                if notify:
+                    notify(None, product)
+        self.count += added
+        self.max_chain_length = longest
+        self._maybe_grow()
+        return added
+
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        """Look up every id; results come back in input order (None for misses)."""
+        self._finish_rehash()
+        if not isinstance(product_ids, list):
+            product_ids = list(product_ids)
+        buckets = self.buckets
+        results: List[Optional[Product]] = []
+        append = results.append
+        for key, idx in zip(product_ids, self._bucket_indexes(product_ids, self.size)):
+            node = buckets[idx]
+            while node is not None:
+                if node.product.product_id == key:
+                    append(node.product)
+                    break
+                node = node.next
+            else:
+                append(None)
+        return results
+
+    def remove_many(self, product_ids: Iterable[str]) -> List[bool]:
+        """Remove every id; results come back in input order (False if not found)."""
+        self._finish_rehash()
+        if not isinstance(product_ids, list):
+            product_ids = list(product_ids)
+        buckets = self.buckets
+        unlink = self._unlink
+        indexes = self._bucket_indexes(product_ids, self.size)
+        removed = [unlink(buckets, idx, key) for key, idx in zip(product_ids, indexes)]
+        results = [p is not None for p in removed]
+        self.count -= sum(results)
+        self._maybe_shrink()
+        if self._listeners:
+            for p in removed:
+                if p is not None:
+                    self._notify(p, None)
+        return results
+
+    def _all_buckets(self) -> List[Optional[Node]]:
+        if self._old_buckets is None:
+            return self.buckets
+        return self._old_buckets[self._rehash_pos:] + self.buckets
+
+    # --- iteration ---
+    def scan(self, cursor: int = 0, count: int = SCAN_COUNT) -> Tuple[int, List[Product]]:
+        """Visit about `count` buckets from `cursor`; returns (next_cursor, products).
+
+        Start with cursor 0 and stop when 0 comes back. Inserts and removes between
+        calls are fine, and a running incremental rehash is never forced to finish.
+        With mask indexing the cursor counts in reverse binary and walks both tables
+        while a rehash runs, so no product present throughout is missed even if the
+        table grows or shrinks in between; one may come back twice only after a
+        shrink. Prime sizes (modulo) have no such structure: a running rehash is
+        advanced `count` buckets per call before the walk goes on, and the cursor
+        remembers the bucket count it walks, which fixes where every key lives. If
+        the table is a different size by then, the walk starts over (products come
+        back again) up to SCAN_MAX_RESTARTS times; after that it carries on from the
+        same fraction of the new table, so the scan ends even under endless resizing,
+        but a product may be missed. items() holds off both kinds of resize.
+        """
+        if self._pow2:
+            return self._scan_masked(cursor, count)
+        return self._scan_modulo(cursor, count)
+
+    def _scan_masked(self, cursor: int, count: int) -> Tuple[int, List[Product]]:
+        if cursor < 0:
+            raise ValueError("scan cursor must be >= 0")
+        page: List[Product] = []
+
+        def collect(node: Optional[Node]) -> None:
+            while node:
+                page.append(node.product)
+                node = node.next
+
+        v = cursor
+        budget = max(count, 1)
+        while budget > 0:
+            old = self._old_buckets
+            if old is None:
+                # r counts the visiting order; an aligned run of 2^c steps of r is the
+                # strided slice buckets[v::size >> c], so whole pages are taken at once
+                bits = self.size.bit_length() - 1
+                r = _reverse_bits(v & (self.size - 1)) >> (_CURSOR_BITS - bits)
+                c = min(budget.bit_length() - 1, (r & -r).bit_length() - 1 if r else bits)
+                for node in self.buckets[v & (self.size - 1)::self.size >> c]:
+                    collect(node)
+                budget -= 1 << c
+                r += 1 << c
+                v = 0 if r == self.size else _reverse_bits(r) >> (_CURSOR_BITS - bits)
+            else:
+                # bucket v of the smaller table, then every bucket of the larger one its
+                # entries can be split into (same low bits), so a migration between calls
+                # never moves an entry past the cursor
+                small, large = (old, self.buckets) if len(old) < len(self.buckets) else (self.buckets, old)
+                m0, m1 = len(small) - 1, len(large) - 1
+                collect(small[v & m0])
+                while True:
+                    collect(large[v & m1])
+                    v = _next_reverse_cursor(v, m1)
+                    if not v & (m0 ^ m1):
+                        break
+                budget -= 1
+            if v == 0:
+                break
+        return v, page
+
+    def _scan_modulo(self, cursor: int, count: int) -> Tuple[int, List[Product]]:
+        size, pos, restarts = _split_cursor(cursor)
+        if self._old_buckets is not None:
+            # drain the old table a page at a time rather than all at once; the cursor
+            # is handed back unchanged (a new scan gets one for the new size at 0)
+            self._rehash_step(max(count, 1))
+            if self._old_buckets is not None:
+                return cursor or _make_cursor(self.size, 0), []
+        if cursor and size != self.size:
+            if restarts < SCAN_MAX_RESTARTS:
+                restarts, pos = restarts + 1, 0
+            else:
+                pos = pos * self.size // size
+        buckets = self.buckets
+        end = min(pos + max(count, 1), self.size)
+        page: List[Product] = []
+        for node in buckets[pos:end]:
+            while node:
+                page.append(node.product)
+                node = node.next
+        if end >= self.size:
+            return 0, page
+        return _make_cursor(self.size, end, restarts), page
+
+    def items(self, page_size: int = SCAN_COUNT) -> Iterator[Tuple[str, Product]]:
+        # one page of buckets held at a time, so this can stream a big catalogue;
+        # resizes the cursor cannot follow are held off until the iteration ends,
+        # so nothing is yielded twice when the table is modified meanwhile
+        self._iterators += 1
+        try:
+            cursor = 0
+            while True:
+                cursor, page = self.scan(cursor, page_size)
+                for product in page:
+                    yield product.product_id, product
+                if cursor == 0:
+                    return
+        finally:
+            self._iterators -= 1
+            if not self._iterators:
+                self._maybe_grow()
+                self._maybe_shrink()
+
+    def __iter__(self) -> Iterator[Product]:
+        for _, product in self.items():
+            yield product
+
+    def longest_chain(self) -> int:
+        best = 0
+        for node in self._all_buckets():
+            length = 0
+            while node:
+                length += 1
+                node = node.next
+            if length > best:
+                best = length
+        return best
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "count": self.count,
+            "load_factor": self.load_factor,
+            "grow_count": self.grow_count,
+            "shrink_count": self.shrink_count,
+            "resize_count": self.resize_count,
+            "max_chain_length": self.max_chain_length,
+            "longest_chain": self.longest_chain(),
+            "rehashing": self.is_rehashing(),
+        }
+
+    def diagnostics(self, miss_keys: Optional[Sequence[str]] = None) -> dict:
+        """Report how evenly the hash strategy spreads the current keys.
+
+        Expected values assume uniform hashing at the current load factor alpha:
+        a hit walks 1 + alpha/2 nodes on average, a miss walks alpha nodes and a
+        fraction e^-alpha of the buckets is empty. Pass miss_keys (ids known to be
+        absent) to measure the miss cost on real key patterns; without them the
+        observed miss cost is the mean chain length, which always equals alpha.
+        """
+        self._finish_rehash()
+        histogram: Dict[int, int] = {}
+        hit_probes = 0
+        lengths = []
         for node in self.buckets:
+            length = 0
             while node:
-                print(" -", node.product)
-                any_item = True
+                length += 1
                 node = node.next
+            lengths.append(length)
+            histogram[length] = histogram.get(length, 0) + 1
+            # the k-th node in a chain costs k probes to find
+            hit_probes += length * (length + 1) // 2
+        alpha = self.load_factor
+        if miss_keys:
+            observed_miss = sum(lengths[i] for i in self._bucket_indexes(miss_keys, self.size)) / len(miss_keys)
+        else:
+            observed_miss = alpha
+        variance = sum((x - alpha) ** 2 for x in lengths) / self.size
+        return {
+            "hash_fn": getattr(self.hash_fn, "__name__", repr(self.hash_fn)),
+            "indexing": self.indexing,
+            "size": self.size,
+            "count": self.count,
+            "load_factor": alpha,
+            "chain_histogram": dict(sorted(histogram.items())),
+            "empty_ratio": histogram.get(0, 0) / self.size,
+            "expected_empty_ratio": exp(-alpha),
+            "longest_chain": max(lengths) if lengths else 0,
+            "observed_hit_probes": hit_probes / self.count if self.count else 0.0,
+            "expected_hit_probes": 1 + alpha / 2,
+            "observed_miss_probes": observed_miss,
+            "expected_miss_probes": alpha,
+            # chain lengths are Poisson(alpha) under uniform hashing, so variance ~ alpha
+            "chain_length_variance": variance,
+            "expected_variance": alpha,
+        }
+
+    def display_all(self) -> None:
+        print("\n Baby Shop Inventory:\n")
+        any_item = False
+        for product in self:
+            print(" -", product)
+            any_item = True
         if not any_item:
             print(" (empty)")
 
@@ -87,6 +691,319 @@ class HashTable:
         return self.count
 
 
+# marks a slot whose entry was removed so probe sequences running through it stay intact
+_DELETED = object()
+
+
+class OpenAddressingHashTable:
+    # linear probing over flat parallel arrays (hashes / keys / values) instead of
+    # one Node object per entry. capacity is always a power of two so the bucket
+    # index is a mask, and the cached hash rejects most mismatches without a key compare
+    MAX_LOAD = 0.6
+    indexing = "mask"
+
+    def __init__(self, size: int = 1024, max_load: float = MAX_LOAD, value_typecode: Optional[str] = None,
+                 hash_fn: Union[str, HashFunction] = "builtin"):
+        self.max_load = max_load
+        self.hash_fn = resolve_hash_function(hash_fn)
+        # the built-in hash is signed; the other strategies return unsigned 64-bit values
+        self._hash_typecode = "q" if self.hash_fn is hash else "Q"
+        # with a typecode (e.g. "q") values are kept unboxed in an array instead of a list
+        self.value_typecode = value_typecode
+        self.count = 0
+        self.grow_count = 0
+        self.max_probe_length = 0
+        self._listeners: List[ChangeListener] = []
+        self._epoch = 0
+        self._alloc(self._capacity_for(size))
+
+    @staticmethod
+    def _capacity_for(n: int) -> int:
+        capacity = 8
+        while capacity < n:
+            capacity <<= 1
+        return capacity
+
+    def _alloc(self, capacity: int) -> None:
+        self.size = capacity
+        self._mask = capacity - 1
+        self._hashes = array(self._hash_typecode, bytes(8 * capacity))
+        self._keys: List[Any] = [None] * capacity
+        if self.value_typecode is None:
+            self._values: Any = [None] * capacity
+        else:
+            self._values = array(self.value_typecode, bytes(array(self.value_typecode).itemsize * capacity))
+        # live entries + tombstones, i.e. slots a probe has to step over
+        self._used = 0
+
+    @property
+    def load_factor(self) -> float:
+        return self.count / self.size
+
+    def _find(self, key: Any) -> int:
+        h = self.hash_fn(key)
+        mask = self._mask
+        keys = self._keys
+        hashes = self._hashes
+        i = h & mask
+        while True:
+            k = keys[i]
+            if k is None:
+                return -1
+            if k is not _DELETED and hashes[i] == h and k == key:
+                return i
+            i = (i + 1) & mask
+
+    def _resize(self, expected: int = 0) -> None:
+        # full rebuild sized for the live entries (or `expected` if larger);
+        # this also drops every tombstone
+        old_keys = self._keys
+        old_values = self._values
+        old_hashes = self._hashes
+        # smallest power of two that holds them under max_load: twice the old
+        # capacity when live entries triggered the resize, the same one when tombstones did
+        new_capacity = self._capacity_for(ceil(max(self.count, expected) / self.max_load))
+        if new_capacity > self.size:
+            self.grow_count += 1
+        self._alloc(new_capacity)
+        self._epoch += 1
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        mask = self._mask
+        for j, k in enumerate(old_keys):
+            if k is None or k is _DELETED:
+                continue
+            h = old_hashes[j]
+            i = h & mask
+            while keys[i] is not None:
+                i = (i + 1) & mask
+            keys[i] = k
+            hashes[i] = h
+            values[i] = old_values[j]
+        self._used = self.count
+
+    # --- generic key/value layer ---
+    def put(self, key: Any, value: Any) -> Any:
+        """Store value under key. Return the previous value, or None."""
+        h = self.hash_fn(key)
+        mask = self._mask
+        keys = self._keys
+        hashes = self._hashes
+        i = h & mask
+        first_free = -1
+        probes = 1
+        while True:
+            k = keys[i]
+            if k is None:
+                break
+            if k is _DELETED:
+                if first_free < 0:
+                    first_free = i
+            elif hashes[i] == h and k == key:
+                old = self._values[i]
+                self._values[i] = value
+                return old
+            i = (i + 1) & mask
+            probes += 1
+        if first_free >= 0:
+            # reuse the first tombstone on the probe path
+            i = first_free
+        else:
+            self._used += 1
+        keys[i] = key
+        hashes[i] = h
+        self._values[i] = value
+        self.count += 1
+        if probes > self.max_probe_length:
+            self.max_probe_length = probes
+        if self._used > self.size * self.max_load:
+            self._resize()
+        return None
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        i = self._find(key)
+        return default if i < 0 else self._values[i]
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        i = self._find(key)
+        if i < 0:
+            return default
+        keys = self._keys
+        value = self._values[i]
+        keys[i] = _DELETED
+        if self.value_typecode is None:
+            self._values[i] = None
+        self.count -= 1
+        mask = self._mask
+        if keys[(i + 1) & mask] is None:
+            # nothing probes past this slot, so the tombstone run ending here can be freed
+            while keys[i] is _DELETED:
+                keys[i] = None
+                self._used -= 1
+                i = (i - 1) & mask
+        return value
+
+    # --- bulk operations ---
+    def reserve(self, n: int) -> None:
+        """Make room for n entries in one rebuild instead of growing step by step."""
+        if n > self.size * self.max_load:
+            self._resize(n)
+
+    def insert_many(self, products: Iterable[Product]) -> int:
+        """Insert (or replace) every product. Return how many new ids were added."""
+        if not isinstance(products, list):
+            products = list(products)
+        self.reserve(self.count + len(products))
+        before = self.count
+        if self._listeners:
+            insert = self.insert
+            for product in products:
+                insert(product)
+        else:
+            put = self.put
+            for product in products:
+                put(product.product_id, product)
+        return self.count - before
+
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        """Look up every id; results come back in input order (None for misses)."""
+        mask = self._mask
+        keys = self._keys
+        hashes = self._hashes
+        values = self._values
+        hash_fn = self.hash_fn
+        results: List[Optional[Product]] = []
+        append = results.append
+        for key in product_ids:
+            h = hash_fn(key)
+            i = h & mask
+            while True:
+                k = keys[i]
+                if k is None:
+                    append(None)
+                    break
+                if k is not _DELETED and hashes[i] == h and k == key:
+                    append(values[i])
+                    break
+                i = (i + 1) & mask
+        return results
+
+    def remove_many(self, product_ids: Iterable[str]) -> List[bool]:
+        """Remove every id; results come back in input order (False if not found)."""
+        if self._listeners:
+            remove = self.remove
+            return [remove(key) for key in product_ids]
+        pop = self.pop
+        return [pop(key, _DELETED) is not _DELETED for key in product_ids]
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) >= 0
+
+    def _scan_page(self, cursor: int, count: int) -> Tuple[int, List[Tuple[Any, Any]]]:
+        epoch, pos, restarts = _split_cursor(cursor)
+        if cursor and epoch != self._epoch & _CURSOR_FIELD and restarts < SCAN_MAX_RESTARTS:
+            restarts, pos = restarts + 1, 0
+        end = min(pos + max(count, 1), self.size)
+        keys = self._keys
+        values = self._values
+        page = [(keys[i], values[i]) for i in range(pos, end)
+                if keys[i] is not None and keys[i] is not _DELETED]
+        if end >= self.size:
+            return 0, page
+        return _make_cursor(self._epoch, end, restarts), page
+
+    def scan(self, cursor: int = 0, count: int = SCAN_COUNT) -> Tuple[int, List[Any]]:
+        """Visit the next `count` slots from `cursor`; returns (next_cursor, values).
+
+        Called like HashTable.scan, with a position cursor as for its modulo mode.
+        Entries never move between rebuilds (removal only leaves a tombstone), so
+        only a resize restarts the scan, and after SCAN_MAX_RESTARTS of those it
+        carries on from the same slot instead (it ends, but may miss entries).
+        """
+        cursor, page = self._scan_page(cursor, count)
+        return cursor, [v for _, v in page]
+
+    def items(self, page_size: int = SCAN_COUNT) -> Iterator[Tuple[Any, Any]]:
+        cursor = 0
+        while True:
+            cursor, page = self._scan_page(cursor, page_size)
+            yield from page
+            if cursor == 0:
+                return
+
+    def __iter__(self) -> Iterator[Any]:
+        # iterates values (the products, for the product API)
+        for _, v in self.items():
+            yield v
+
+    # --- same product API as HashTable ---
+    def add_listener(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ChangeListener) -> None:
+        self._listeners.remove(listener)
+
+    def _notify(self, old: Optional[Product], new: Optional[Product]) -> None:
+        for listener in self._listeners:
+            listener(old, new)
+
+    def insert(self, product: Product) -> None:
+        old = self.put(product.product_id, product)
+        if self._listeners:
+            self._notify(old, product)
+
+    def search(self, product_id: str) -> Optional[Product]:
+        return self.get(product_id)
+
+    def remove(self, product_id: str) -> bool:
+        old = self.pop(product_id, _DELETED)
+        if old is _DELETED:
+            return False
+        if self._listeners:
+            self._notify(old, None)
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "count": self.count,
+            "load_factor": self.load_factor,
+            "tombstones": self._used - self.count,
+            "grow_count": self.grow_count,
+            "max_probe_length": self.max_probe_length,
+        }
+
+    def display_all(self) -> None:
+        print("\n Baby Shop Inventory:\n")
+        any_item = False
+        for v in self:
+            print(" -", v)
+            any_item = True
+        if not any_item:
+            print(" (empty)")
+
+    def __len__(self) -> int:
+        return self.count
+
+
+ENGINES: Dict[str, type] = {
+    "chained": HashTable,
+    "open": OpenAddressingHashTable,
+}
+
+Inventory = Union[HashTable, OpenAddressingHashTable]
+
+
+def create_inventory(engine: str = "chained", size: int = 1031) -> Inventory:
+    """Build an empty inventory table using the named storage engine."""
+    try:
+        cls = ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"unknown engine {engine!r}, expected one of {sorted(ENGINES)}") from None
+    return cls(size=size)
+
+
 # --- Utility functions for CLI ---
 
 def prompt_product_input(existing_id: Optional[str] = None) -> Product:
@@ -198,13 +1115,202 @@ def seed_sample_products(inventory: HashTable) -> None:
         Product("BB002", "Random Baby Wipes", "Baby Care", 12.50, 200),
         Product("BB003", "Random Feeding Bottle", "Feeding", 59.90, 50),
     ]
-    for p in sample_products:
-        inventory.insert(p)
+    inventory.insert_many(sample_products)
+
+# --- Batch / scripted mode ---
+#
+# Commands come from a CSV file (header: op,product_id,name,category,price,stock) or
+# from JSON lines ({"op": "insert", "product_id": ..., ...}); "-" reads stdin.
+# op is insert, edit, delete or search. Consecutive commands with the same op are
+# applied together through insert_many / search_many / remove_many, in file order.
+BATCH_OPS = ("insert", "edit", "delete", "search")
+BATCH_CHUNK = 5_000
+
+
+def _read_commands(stream: TextIO, fmt: str) -> Iterator[Tuple[int, dict]]:
+    if fmt == "csv":
+        # plain csv.reader + zip is noticeably cheaper per row than csv.DictReader
+        reader = csv.reader(stream)
+        header = [name.strip().lower() for name in next(reader, [])]
+        for line_no, row in enumerate(reader, start=2):
+            if row:
+                yield line_no, dict(zip(header, row))
+        return
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            row = {"op": "", "error": f"invalid JSON ({e})"}
+        yield line_no, row if isinstance(row, dict) else {"op": "", "error": "expected a JSON object"}
+
+
+def _product_from_row(row: dict) -> Product:
+    product_id = str(row.get("product_id") or "").strip()
+    if not product_id:
+        raise ValueError("product_id is required")
+    try:
+        price = float(row.get("price"))
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid price {row.get('price')!r}") from None
+    try:
+        stock = int(row.get("stock"))
+    except (TypeError, ValueError):
+        raise ValueError(f"invalid stock {row.get('stock')!r}") from None
+    return Product(product_id, str(row.get("name") or "").strip(), str(row.get("category") or "").strip(),
+                   price, stock)
+
+
+def run_batch(inventory: Inventory, stream: TextIO, fmt: str = "csv", out: TextIO = sys.stdout,
+              chunk_size: int = BATCH_CHUNK) -> dict:
+    """Apply every command in stream to inventory without prompting. Return a summary."""
+    summary = {"rows": 0, "inserted": 0, "replaced": 0, "edited": 0, "deleted": 0,
+               "searched": 0, "found": 0, "errors": 0}
+    started = perf_counter()
+    pending_op: Optional[str] = None
+    pending: List[Tuple[int, Any]] = []
 
-def main():
-    inventory = HashTable(size=101)
-    seed_sample_products(inventory)
-    print("Sample products loaded. Total:", len(inventory))
+    def error(line_no: int, message: str) -> None:
+        summary["errors"] += 1
+        print(f"line {line_no}: {message}", file=out)
+
+    def flush() -> None:
+        if not pending:
+            return
+        payloads = [payload for _, payload in pending]
+        if pending_op == "insert":
+            added = inventory.insert_many(payloads)
+            summary["inserted"] += added
+            summary["replaced"] += len(payloads) - added
+        elif pending_op == "edit":
+            existing = inventory.search_many([p.product_id for p in payloads])
+            updates = []
+            for (line_no, product), current in zip(pending, existing):
+                if current is None:
+                    error(line_no, f"edit {product.product_id}: product not found")
+                else:
+                    updates.append(product)
+            inventory.insert_many(updates)
+            summary["edited"] += len(updates)
+        elif pending_op == "delete":
+            for (line_no, pid), removed in zip(pending, inventory.remove_many(payloads)):
+                if removed:
+                    summary["deleted"] += 1
+                else:
+                    error(line_no, f"delete {pid}: product not found")
+        elif pending_op == "search":
+            for pid, found in zip(payloads, inventory.search_many(payloads)):
+                summary["searched"] += 1
+                if found is not None:
+                    summary["found"] += 1
+                    print(f"found {found}", file=out)
+                else:
+                    print(f"not found {pid}", file=out)
+        pending.clear()
+
+    def reject(line_no: int, message: str) -> None:
+        # apply what came before first, so output stays in file order
+        flush()
+        error(line_no, message)
+
+    for line_no, row in _read_commands(stream, fmt):
+        summary["rows"] += 1
+        if row.get("error"):
+            reject(line_no, row["error"])
+            continue
+        op = str(row.get("op") or "").strip().lower()
+        if op not in BATCH_OPS:
+            reject(line_no, f"unknown op {op!r}, expected one of {', '.join(BATCH_OPS)}")
+            continue
+        if op in ("insert", "edit"):
+            try:
+                payload: Any = _product_from_row(row)
+            except ValueError as e:
+                reject(line_no, f"{op}: {e}")
+                continue
+        else:
+            payload = str(row.get("product_id") or "").strip()
+            if not payload:
+                reject(line_no, f"{op}: product_id is required")
+                continue
+        if op != pending_op or len(pending) >= chunk_size:
+            flush()
+            pending_op = op
+        pending.append((line_no, payload))
+    flush()
+
+    elapsed = perf_counter() - started
+    summary["seconds"] = elapsed
+    summary["rows_per_sec"] = summary["rows"] / elapsed if elapsed > 0 else 0.0
+    return summary
+
+
+def print_batch_summary(summary: dict, out: TextIO = sys.stderr) -> None:
+    print(
+        f"Batch done: {summary['rows']:,} rows in {summary['seconds']:.3f}s "
+        f"({summary['rows_per_sec']:,.0f} rows/s) - inserted {summary['inserted']:,}, "
+        f"replaced {summary['replaced']:,}, edited {summary['edited']:,}, deleted {summary['deleted']:,}, "
+        f"searched {summary['searched']:,} (found {summary['found']:,}), errors {summary['errors']:,}",
+        file=out,
+    )
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Baby shop inventory.")
+    parser.add_argument("data_dir", nargs="?", help="directory to persist the inventory in")
+    parser.add_argument("--batch", metavar="FILE", help="apply commands from FILE ('-' for stdin) and exit")
+    parser.add_argument("--format", choices=["csv", "jsonl"],
+                        help="batch file format (default: from the extension, csv otherwise)")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="chained",
+                        help="in-memory storage engine when no data_dir is given")
+    return parser.parse_args(argv)
+
+
+def open_inventory(data_dir: Optional[str], engine: str = "chained", seed: bool = True) -> Inventory:
+    if data_dir:
+        # imported here because AssignmentQ1G builds on the classes in this module
+        from AssignmentQ1G import PersistentInventory
+        inventory = PersistentInventory(data_dir)
+        if seed and len(inventory) == 0:
+            seed_sample_products(inventory)
+    else:
+        inventory = create_inventory(engine, size=101)
+        if seed:
+            seed_sample_products(inventory)
+    return inventory
+
+
+def batch_main(args: argparse.Namespace) -> int:
+    fmt = args.format
+    if fmt is None:
+        fmt = "jsonl" if args.batch.endswith((".jsonl", ".json")) else "csv"
+    inventory = open_inventory(args.data_dir, args.engine, seed=False)
+    try:
+        if args.batch == "-":
+            summary = run_batch(inventory, sys.stdin, fmt)
+        else:
+            with open(args.batch, newline="", encoding="utf-8") as stream:
+                summary = run_batch(inventory, stream, fmt)
+    finally:
+        if args.data_dir:
+            inventory.close()
+    print_batch_summary(summary)
+    return 1 if summary["errors"] else 0
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    args = parse_args(argv)
+    if args.batch:
+        sys.exit(batch_main(args))
+
+    data_dir = args.data_dir
+    inventory = open_inventory(data_dir, args.engine)
+    if data_dir:
+        print(f"Inventory opened from {data_dir}. Total:", len(inventory))
+    else:
+        print("Sample products loaded. Total:", len(inventory))
 
     while True:
         print_menu()
@@ -220,6 +1326,8 @@ def main():
         elif choice == "5":
             inventory.display_all()
         elif choice == "6":
+            if data_dir:
+                inventory.close()
             print("Goodbye!")
             sys.exit(0)
         else:
@@ -1,51 +1,47 @@
-from time import perf_counter_ns
+# benchmark harness for the inventory lookup structures (Q1)
+#
+#   python AssignmentQ1D.py                                  # defaults below
+#   python AssignmentQ1D.py -n 10000 100000 --load-factor 0.5 0.75 --repeats 20
+#   python AssignmentQ1D.py --json run.json --csv run.csv
+#   python AssignmentQ1D.py --json new.json --compare old.json
+#   python AssignmentQ1D.py --hash fnv1a-mix --indexing mask     # deterministic bucket layout
+#   python AssignmentQ1D.py --diagnose -n 10000                  # hash distribution report
+#
+# Every (engine, N, load factor) combination is built once, warmed up, then timed for
+# --repeats repetitions. One repetition times M hit searches, M miss searches, M inserts
+# of fresh ids and M removes of those same ids (leaving the table at N again), so each
+# sample is the mean ns/op of one batch of M calls. Engines with search_many also get
+# batch_hit / batch_miss: the same key sets looked up in one search_many call.
+# Every engine sees identical hit/miss key sets (same seed, same N and M).
+import argparse
+import csv
+import json
+import math
+import platform
 import random
-from typing import Optional, List
+import statistics
+import sys
+import tracemalloc
+from bisect import bisect_left
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
 
-# --- Configuration ---
-N = 100_000      # number of products (dataset size)
-M = 1_000        # number of searches per category per round
-ROUNDS = 10      # how many rounds to run
-HT_SIZE = 131071 # hash table bucket count (prime-ish)
-random.seed(42)  # deterministic sampling across runs
-
-#product entity
-class Product:
-    def __init__(self, product_id: str, name: str):
-        self.product_id = product_id
-        self.name = name
-    def __repr__(self):
-        return f"Product({self.product_id})"
-
-# separate chaining
-class Node:
-    def __init__(self, product: Product, next_node: Optional['Node'] = None):
-        self.product = product
-        self.next = next_node
-
-class HashTable:
-    def __init__(self, size: int = HT_SIZE):
-        self.size = size
-        self.buckets: List[Optional[Node]] = [None] * size
-        self.count = 0
-
-    def _hash(self, key: str) -> int:
-        return abs(hash(key)) % self.size
+from AssignmentQ1C import HASH_FUNCTIONS, INDEXING, HashTable, OpenAddressingHashTable, Product
 
-    def insert(self, product: Product) -> None:
-        idx = self._hash(product.product_id)
-        node = Node(product, self.buckets[idx])
-        self.buckets[idx] = node
-        self.count += 1
+try:
+    import numpy as np
+except ImportError:  # the numpy contender is simply left out
+    np = None
 
-    def search(self, product_id: str) -> Optional[Product]:
-        idx = self._hash(product_id)
-        node = self.buckets[idx]
-        while node is not None:
-            if node.product.product_id == product_id:
-                return node.product
-            node = node.next
-        return None
+# --- Defaults ---
+N = 100_000      # number of products (dataset size)
+M = 1_000        # operations per batch (one sample)
+ROUNDS = 10      # timed repetitions per configuration
+WARMUP = 2       # untimed repetitions before timing starts
+LOAD_FACTOR = 0.75
+SEED = 42        # deterministic sampling across runs
+
+OPERATIONS = ["insert", "search_hit", "search_miss", "batch_hit", "batch_miss", "remove"]
 
 
 #linear search on array
@@ -55,108 +51,469 @@ def linear_search(arr: List[Product], product_id: str) -> Optional[Product]:
             return p
     return None
 
-# Build dataset and data structures
 
-print(f"Config: N={N:,}, M={M:,}, ROUNDS={ROUNDS}, HashTable size={HT_SIZE}")
+class LinearArray:
+    # plain list of products; the baseline the hash tables are compared against
+    def __init__(self) -> None:
+        self.items: List[Product] = []
 
-# Create products
-products = [Product(f"P{i:06d}", f"Product #{i}") for i in range(N)]
+    def insert(self, product: Product) -> None:
+        self.items.append(product)
 
-# Create and build hash table and array
-ht = HashTable(size=HT_SIZE)
-arr: List[Product] = []
+    def search(self, product_id: str) -> Optional[Product]:
+        return linear_search(self.items, product_id)
 
-t0 = perf_counter_ns()
-for p in products:
-    ht.insert(p)
-t1 = perf_counter_ns()
-ht_build_ns = t1 - t0
+    def remove(self, product_id: str) -> bool:
+        for i, p in enumerate(self.items):
+            if p.product_id == product_id:
+                del self.items[i]
+                return True
+        return False
 
-t0 = perf_counter_ns()
-for p in products:
-    arr.append(p)
-t1 = perf_counter_ns()
-arr_build_ns = t1 - t0
+    def __len__(self) -> int:
+        return len(self.items)
 
-print(f"Build times (ns): HashTable={ht_build_ns:,}, Array append={arr_build_ns:,}\n")
 
-# run the rounds
+class SortedArray:
+    # ids kept sorted in a list (products in a parallel list), looked up with bisect
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.products: List[Product] = []
 
-rounds_results = []
+    def insert_many(self, products: Iterable[Product]) -> int:
+        merged = {p.product_id: p for p in self.products}
+        before = len(merged)
+        merged.update((p.product_id, p) for p in products)
+        self.ids = sorted(merged)
+        self.products = [merged[pid] for pid in self.ids]
+        return len(merged) - before
 
-for r in range(1, ROUNDS + 1):
-    # Prepare keys: M existing, M missing
-    existing_keys = random.sample([p.product_id for p in products], M)
-    missing_keys = [f"X{random.randint(N, N*10):06d}" for _ in range(M)]
+    def insert(self, product: Product) -> None:
+        i = bisect_left(self.ids, product.product_id)
+        if i < len(self.ids) and self.ids[i] == product.product_id:
+            self.products[i] = product
+            return
+        self.ids.insert(i, product.product_id)
+        self.products.insert(i, product)
 
-    # HashTable -> existing
-    t0 = perf_counter_ns()
-    for key in existing_keys:
-        _ = ht.search(key)
-    t1 = perf_counter_ns()
-    ht_existing_total = t1 - t0
+    def search(self, product_id: str) -> Optional[Product]:
+        i = bisect_left(self.ids, product_id)
+        if i < len(self.ids) and self.ids[i] == product_id:
+            return self.products[i]
+        return None
 
-    # Array -> existing
-    t0 = perf_counter_ns()
-    for key in existing_keys:
-        _ = linear_search(arr, key)
-    t1 = perf_counter_ns()
-    arr_existing_total = t1 - t0
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        search = self.search
+        return [search(pid) for pid in product_ids]
 
-    # HashTable -> missing
-    t0 = perf_counter_ns()
-    for key in missing_keys:
-        _ = ht.search(key)
-    t1 = perf_counter_ns()
-    ht_missing_total = t1 - t0
+    def remove(self, product_id: str) -> bool:
+        i = bisect_left(self.ids, product_id)
+        if i < len(self.ids) and self.ids[i] == product_id:
+            del self.ids[i]
+            del self.products[i]
+            return True
+        return False
 
-    # Array -> missing
-    t0 = perf_counter_ns()
-    for key in missing_keys:
-        _ = linear_search(arr, key)
-    t1 = perf_counter_ns()
-    arr_missing_total = t1 - t0
-
-    # Save round
-    rounds_results.append({
-        "round": r,
-        "ht_existing_ns": ht_existing_total,
-        "arr_existing_ns": arr_existing_total,
-        "ht_missing_ns": ht_missing_total,
-        "arr_missing_ns": arr_missing_total
-    })
-
-    # Print per-round results
-    print(
-        f"Round {r:2d}: "
-        f"HT(existing)={ht_existing_total:,} ns, ARR(existing)={arr_existing_total:,} ns, "
-        f"HT(missing)={ht_missing_total:,} ns, ARR(missing)={arr_missing_total:,} ns"
-    )
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class DictTable:
+    # the built-in dict, for reference
+    def __init__(self) -> None:
+        self.items: Dict[str, Product] = {}
+
+    def insert(self, product: Product) -> None:
+        self.items[product.product_id] = product
+
+    def search(self, product_id: str) -> Optional[Product]:
+        return self.items.get(product_id)
+
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        get = self.items.get
+        return [get(pid) for pid in product_ids]
+
+    def remove(self, product_id: str) -> bool:
+        return self.items.pop(product_id, None) is not None
 
-# Compute averages and summary
+    def __len__(self) -> int:
+        return len(self.items)
 
-def average(key: str) -> float:
-    return sum(d[key] for d in rounds_results) / len(rounds_results)
 
-avg_ht_existing = average("ht_existing_ns")
-avg_arr_existing = average("arr_existing_ns")
-avg_ht_missing = average("ht_missing_ns")
-avg_arr_missing = average("arr_missing_ns")
+class NumpySortedArray:
+    # sorted fixed-width unicode id array; batches are answered with one np.searchsorted
+    def __init__(self) -> None:
+        self.ids = np.empty(0, dtype="U1")
+        self.products: List[Product] = []
 
-print("\nAverages over rounds (ns):")
-print(f"  HashTable existing avg: {avg_ht_existing:,.0f} ns")
-print(f"  Array existing    avg: {avg_arr_existing:,.0f} ns")
-print(f"  HashTable missing avg: {avg_ht_missing:,.0f} ns")
-print(f"  Array missing     avg: {avg_arr_missing:,.0f} ns\n")
+    def _widen(self, key: str) -> None:
+        # the array's string width must fit the longest id or inserts get truncated
+        if len(key) > self.ids.dtype.itemsize // 4:
+            self.ids = self.ids.astype(f"U{len(key)}")
 
-ratio_existing = avg_arr_existing / avg_ht_existing if avg_ht_existing > 0 else float('inf')
-ratio_missing = avg_arr_missing / avg_ht_missing if avg_ht_missing > 0 else float('inf')
+    def insert_many(self, products: Iterable[Product]) -> int:
+        merged = {p.product_id: p for p in self.products}
+        before = len(merged)
+        merged.update((p.product_id, p) for p in products)
+        ordered = sorted(merged)
+        self.ids = np.array(ordered) if ordered else np.empty(0, dtype="U1")
+        self.products = [merged[pid] for pid in ordered]
+        return len(merged) - before
 
-print(f"Speedup (Array / Hash) existing ~ {ratio_existing:.1f}x (higher means array slower)")
-print(f"Speedup (Array / Hash) missing  ~ {ratio_missing:.1f}x (higher means array slower)")
+    def _find(self, product_id: str) -> tuple:
+        i = int(np.searchsorted(self.ids, product_id))
+        return i, i < len(self.products) and self.ids[i] == product_id
 
-print(f"\nCounts sanity check: HashTable stored {ht.count}, Array stored {len(arr)}")
+    def insert(self, product: Product) -> None:
+        i, found = self._find(product.product_id)
+        if found:
+            self.products[i] = product
+            return
+        self._widen(product.product_id)
+        self.ids = np.insert(self.ids, i, product.product_id)
+        self.products.insert(i, product)
+
+    def search(self, product_id: str) -> Optional[Product]:
+        i, found = self._find(product_id)
+        return self.products[i] if found else None
+
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        keys = np.asarray(list(product_ids))
+        if not self.products:
+            return [None] * len(keys)
+        pos = np.minimum(np.searchsorted(self.ids, keys), len(self.products) - 1)
+        hits = self.ids[pos] == keys
+        products = self.products
+        return [products[i] if hit else None for i, hit in zip(pos.tolist(), hits.tolist())]
+
+    def remove(self, product_id: str) -> bool:
+        i, found = self._find(product_id)
+        if not found:
+            return False
+        self.ids = np.delete(self.ids, i)
+        del self.products[i]
+        return True
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+
+def _chained(n: int, load_factor: float, hash_fn: str = "builtin", indexing: str = "modulo") -> HashTable:
+    # fixed bucket count for the requested load factor (HashTable rounds it up to a
+    # prime or a power of two): resizing is switched off so the sweep measures the
+    # load factor it asks for
+    return HashTable(size=max(11, round(n / load_factor)), max_load=math.inf, auto_shrink=False,
+                     hash_fn=hash_fn, indexing=indexing)
+
+
+def _open(n: int, load_factor: float, hash_fn: str = "builtin", indexing: str = "mask") -> OpenAddressingHashTable:
+    # always masks a power-of-two capacity
+    return OpenAddressingHashTable(size=round(n / load_factor), max_load=0.95, hash_fn=hash_fn)
+
+
+class Engine(NamedTuple):
+    factory: Callable[..., object]
+    # hash tables: the load factor means something and hash_fn / indexing are passed on
+    uses_load: bool = False
+    # build the N products with insert_many (sorted arrays would be O(N^2) one at a time)
+    bulk_build: bool = False
+
+
+ENGINES: Dict[str, Engine] = {
+    "chained": Engine(_chained, uses_load=True),
+    "open": Engine(_open, uses_load=True),
+    "dict": Engine(lambda n, lf: DictTable()),
+    "bisect": Engine(lambda n, lf: SortedArray(), bulk_build=True),
+    "linear": Engine(lambda n, lf: LinearArray()),
+}
+if np is not None:
+    ENGINES["numpy"] = Engine(lambda n, lf: NumpySortedArray(), bulk_build=True)
+
+
+# --- statistics ---
+
+def percentile(sorted_samples: Sequence[float], pct: float) -> float:
+    # nearest-rank percentile
+    if not sorted_samples:
+        return math.nan
+    rank = max(1, math.ceil(pct / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "samples": len(samples),
+        "mean_ns": statistics.fmean(samples),
+        "median_ns": statistics.median(ordered),
+        "p95_ns": percentile(ordered, 95),
+        "p99_ns": percentile(ordered, 99),
+        "stddev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min_ns": ordered[0],
+    }
+
+
+# --- timing ---
+
+def _time_batch(op: Callable, keys: Sequence) -> float:
+    t0 = perf_counter_ns()
+    for key in keys:
+        op(key)
+    t1 = perf_counter_ns()
+    return (t1 - t0) / len(keys)
 
 
+def _time_bulk(op: Callable, keys: Sequence) -> float:
+    t0 = perf_counter_ns()
+    op(keys)
+    t1 = perf_counter_ns()
+    return (t1 - t0) / len(keys)
+
+
+def _build(spec: Engine, n: int, load_factor: float, products: List[Product], table_options: Dict[str, str]):
+    if spec.uses_load:
+        table = spec.factory(n, load_factor, **table_options)
+    else:
+        table = spec.factory(n, load_factor)
+    if spec.bulk_build:
+        table.insert_many(products)
+    else:
+        insert = table.insert
+        for p in products:
+            insert(p)
+    return table
+
+
+def footprint(spec: Engine, n: int, load_factor: float, products: List[Product],
+              table_options: Dict[str, str]) -> float:
+    """Bytes per entry the structure itself allocates (the Product objects are shared)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    table = _build(spec, n, load_factor, products, table_options)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del table
+    return used / n
+
+
+def bench_config(engine: str, n: int, load_factor: float, m: int, repeats: int, warmup: int,
+                 rng: random.Random, measure_memory: bool = True,
+                 table_options: Optional[Dict[str, str]] = None) -> List[Dict[str, object]]:
+    spec = ENGINES[engine]
+    uses_load = spec.uses_load
+    table_options = table_options or {}
+    products = [Product(f"P{i:06d}", f"Product #{i}", "Bench", 9.90, 10) for i in range(n)]
+    ids = [p.product_id for p in products]
+    bytes_per_entry = footprint(spec, n, load_factor, products, table_options) if measure_memory else None
+
+    t0 = perf_counter_ns()
+    table = _build(spec, n, load_factor, products, table_options)
+    build_ns = (perf_counter_ns() - t0) / n
+    search_many = getattr(table, "search_many", None)
+
+    samples: Dict[str, List[float]] = {op: [] for op in OPERATIONS}
+    for rep in range(warmup + repeats):
+        hit_keys = rng.sample(ids, m)
+        miss_keys = [f"X{rng.randint(n, n * 10):06d}" for _ in range(m)]
+        fresh = [Product(f"N{rep:03d}{i:06d}", "New", "Bench", 9.90, 10) for i in range(m)]
+        fresh_ids = [p.product_id for p in fresh]
+
+        timings = {
+            "search_hit": _time_batch(table.search, hit_keys),
+            "search_miss": _time_batch(table.search, miss_keys),
+        }
+        if search_many is not None:
+            timings["batch_hit"] = _time_bulk(search_many, hit_keys)
+            timings["batch_miss"] = _time_bulk(search_many, miss_keys)
+        timings["insert"] = _time_batch(table.insert, fresh)
+        timings["remove"] = _time_batch(table.remove, fresh_ids)
+        if rep >= warmup:
+            for op, value in timings.items():
+                samples[op].append(value)
+
+    if len(table) != n:
+        raise RuntimeError(f"{engine}: expected {n} entries after the run, found {len(table)}")
+
+    common = {
+        "engine": engine, "n": n, "load_factor": load_factor if uses_load else None,
+        "actual_load": n / table.size if uses_load else None, "bytes_per_entry": bytes_per_entry,
+        "hash_fn": table_options.get("hash_fn", "builtin") if uses_load else None,
+        "indexing": getattr(table, "indexing", None),
+    }
+    rows: List[Dict[str, object]] = [{**common, "op": "build", **summarize([build_ns])}]
+    for op in OPERATIONS:
+        if samples[op]:
+            rows.append({**common, "op": op, **summarize(samples[op])})
+    return rows
+
+
+def run(engines: Sequence[str], sizes: Sequence[int], load_factors: Sequence[float], m: int,
+        repeats: int, warmup: int, seed: int, measure_memory: bool = True,
+        table_options: Optional[Dict[str, str]] = None,
+        log: Callable[[str], None] = print) -> List[Dict[str, object]]:
+    results: List[Dict[str, object]] = []
+    for n in sizes:
+        for engine in engines:
+            uses_load = ENGINES[engine].uses_load
+            for load_factor in (load_factors if uses_load else load_factors[:1]):
+                if engine == "open" and load_factor >= 0.95:
+                    log(f"skipping open addressing at load factor {load_factor} (must stay below 0.95)")
+                    continue
+                rng = random.Random(seed)
+                rows = bench_config(engine, n, load_factor, min(m, n), repeats, warmup, rng, measure_memory,
+                                    table_options)
+                results.extend(rows)
+                for row in rows:
+                    log(format_row(row))
+                if measure_memory:
+                    log(f"{engine:<8} N={n:<9,} memory: {rows[0]['bytes_per_entry']:,.1f} bytes/entry")
+    return results
+
+
+# --- output ---
+
+def format_row(row: Dict[str, object]) -> str:
+    lf = "-" if row["load_factor"] is None else f"{row['load_factor']:.2f}"
+    return (
+        f"{row['engine']:<8} N={row['n']:<9,} lf={lf:<5} {row['op']:<12}"
+        f" median={row['median_ns']:>10,.0f}  p95={row['p95_ns']:>10,.0f}"
+        f"  p99={row['p99_ns']:>10,.0f}  stddev={row['stddev_ns']:>9,.0f} ns/op"
+    )
 
 
+def write_json(path: str, config: Dict[str, object], results: List[Dict[str, object]]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"config": config, "python": platform.python_version(), "results": results}, f, indent=2)
+
+
+def write_csv(path: str, results: List[Dict[str, object]]) -> None:
+    if not results:
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def _row_key(row: Dict[str, object]) -> tuple:
+    return row["engine"], row["n"], row["load_factor"], row.get("hash_fn"), row.get("indexing"), row["op"]
+
+
+def compare(baseline_path: str, results: List[Dict[str, object]], threshold: float) -> List[str]:
+    """Rows whose median got more than threshold percent slower than in the baseline file."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {_row_key(row): row for row in json.load(f)["results"]}
+    regressions = []
+    for row in results:
+        old = baseline.get(_row_key(row))
+        if old is None or not old["median_ns"]:
+            continue
+        change = (row["median_ns"] - old["median_ns"]) / old["median_ns"] * 100
+        if change > threshold:
+            regressions.append(
+                f"{row['engine']} N={row['n']} lf={row['load_factor']} {row['op']}: "
+                f"{old['median_ns']:,.0f} -> {row['median_ns']:,.0f} ns/op (+{change:.1f}%)"
+            )
+    return regressions
+
+
+# --- hash distribution report ---
+
+# id patterns seen in the shop: short shelf codes and zero-padded catalogue numbers
+KEY_PATTERNS: Dict[str, Callable[[int], str]] = {
+    "BB###": lambda i: f"BB{i:03d}",
+    "P######": lambda i: f"P{i:06d}",
+}
+
+
+def diagnose(n: int, load_factor: float, log: Callable[[str], None] = print) -> List[Dict[str, object]]:
+    """Chain-length diagnostics for every hash function / indexing pair on each key pattern."""
+    reports = []
+    for pattern, make_key in KEY_PATTERNS.items():
+        keys = [make_key(i) for i in range(n)]
+        misses = [make_key(i) for i in range(n, 2 * n)]
+        log(f"\n{pattern} ids, N={n:,}, target load factor {load_factor}:")
+        for hash_name in HASH_FUNCTIONS:
+            for indexing in INDEXING:
+                table = HashTable(size=max(11, round(n / load_factor)), max_load=math.inf, auto_shrink=False,
+                                  hash_fn=hash_name, indexing=indexing)
+                table.insert_many(Product(k, k, "Bench", 1.0, 1) for k in keys)
+                report = table.diagnostics(misses)
+                report.update(pattern=pattern, hash_name=hash_name)
+                reports.append(report)
+                log(
+                    f"  {hash_name:<10} {indexing:<7} size={report['size']:<8,} "
+                    f"empty={report['empty_ratio']:.3f} (exp {report['expected_empty_ratio']:.3f})  "
+                    f"longest={report['longest_chain']:<3} "
+                    f"hit probes={report['observed_hit_probes']:.3f} (exp {report['expected_hit_probes']:.3f})  "
+                    f"miss probes={report['observed_miss_probes']:.3f} (exp {report['expected_miss_probes']:.3f})"
+                )
+    return reports
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark inventory lookup structures.")
+    parser.add_argument("-n", "--sizes", type=int, nargs="+", default=[N], help="dataset sizes to sweep")
+    parser.add_argument("--load-factor", type=float, nargs="+", default=[LOAD_FACTOR],
+                        help="hash table load factors to sweep")
+    parser.add_argument("-m", "--batch", type=int, default=M, help="operations per timed batch")
+    parser.add_argument("--repeats", type=int, default=ROUNDS, help="timed repetitions per configuration")
+    parser.add_argument("--warmup", type=int, default=WARMUP, help="untimed repetitions before timing")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc footprint build")
+    parser.add_argument("--hash", default="builtin", choices=list(HASH_FUNCTIONS),
+                        help="hash function for the hash table engines")
+    parser.add_argument("--indexing", default="modulo", choices=list(INDEXING),
+                        help="bucket indexing for the chained table (open addressing always masks)")
+    parser.add_argument("--diagnose", action="store_true",
+                        help="print chain-length diagnostics per hash strategy instead of timing")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    parser.add_argument("--compare", help="baseline JSON file from an earlier run")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="percent slowdown in the median reported as a regression")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.diagnose:
+        reports = []
+        for n in args.sizes:
+            for load_factor in args.load_factor:
+                reports.extend(diagnose(n, load_factor))
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(reports, f, indent=2)
+        return 0
+
+    config = {
+        "sizes": args.sizes, "load_factors": args.load_factor, "batch": args.batch,
+        "repeats": args.repeats, "warmup": args.warmup, "engines": args.engines, "seed": args.seed,
+        "hash_fn": args.hash, "indexing": args.indexing,
+    }
+    print(f"Config: {config}\n")
+    if np is None:
+        print("(numpy not installed: the numpy contender is skipped)\n")
+    table_options = {"hash_fn": args.hash, "indexing": args.indexing}
+    results = run(args.engines, args.sizes, args.load_factor, args.batch, args.repeats, args.warmup,
+                  args.seed, not args.no_memory, table_options)
+
+    if args.json:
+        write_json(args.json, config, results)
+    if args.csv:
+        write_csv(args.csv, results)
+    if args.compare:
+        regressions = compare(args.compare, results, args.threshold)
+        if regressions:
+            print(f"\nRegressions (> {args.threshold:.0f}% slower median):")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print("\nNo regressions against", args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
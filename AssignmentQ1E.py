@@ -0,0 +1,185 @@
+# columnar product store for large catalogues (Q1 inventory)
+import sys
+import tracemalloc
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from AssignmentQ1C import HashTable, OpenAddressingHashTable, Product
+
+
+class ProductStore:
+    """Keeps every product field in its own column instead of one object per product.
+
+    price and stock live in typed arrays, categories are stored once and referenced
+    by a small integer code, and an OpenAddressingHashTable maps product_id to the
+    row index. Product objects are only built when search() hands one out.
+    """
+
+    def __init__(self, size: int = 1024):
+        # row numbers are plain ints, so the index keeps them unboxed in an array('q')
+        self._index = OpenAddressingHashTable(size=int(size / OpenAddressingHashTable.MAX_LOAD) + 1, value_typecode="q")
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._categories = array("I")
+        self._prices = array("d")
+        self._stock = array("q")
+        # interned category table: code -> name and name -> code
+        self._category_names: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = len(self._category_names)
+            category = sys.intern(category)
+            self._category_names.append(category)
+            self._category_codes[category] = code
+        return code
+
+    def row_of(self, product_id: str) -> int:
+        """Row index of product_id, or -1 if it is not stored."""
+        return self._index.get(product_id, -1)
+
+    def insert(self, product: Product) -> None:
+        # same replace-on-duplicate behaviour as HashTable.insert
+        code = self._category_code(product.category)
+        row = self.row_of(product.product_id)
+        if row >= 0:
+            self._names[row] = product.name
+            self._categories[row] = code
+            self._prices[row] = product.price
+            self._stock[row] = product.stock
+            return
+        self._index.put(product.product_id, len(self._ids))
+        self._ids.append(product.product_id)
+        self._names.append(product.name)
+        self._categories.append(code)
+        self._prices.append(product.price)
+        self._stock.append(product.stock)
+
+    def product_at(self, row: int) -> Product:
+        return Product(
+            self._ids[row],
+            self._names[row],
+            self._category_names[self._categories[row]],
+            self._prices[row],
+            self._stock[row],
+        )
+
+    def search(self, product_id: str) -> Optional[Product]:
+        row = self.row_of(product_id)
+        if row < 0:
+            return None
+        return self.product_at(row)
+
+    def remove(self, product_id: str) -> bool:
+        row = self._index.pop(product_id, -1)
+        if row < 0:
+            return False
+        last = len(self._ids) - 1
+        if row != last:
+            # move the last row into the hole so the columns stay dense
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._names[row] = self._names[last]
+            self._categories[row] = self._categories[last]
+            self._prices[row] = self._prices[last]
+            self._stock[row] = self._stock[last]
+            self._index.put(moved_id, row)
+        self._ids.pop()
+        self._names.pop()
+        self._categories.pop()
+        self._prices.pop()
+        self._stock.pop()
+        return True
+
+    # --- column access without building Product objects ---
+    def price_of(self, product_id: str) -> Optional[float]:
+        row = self.row_of(product_id)
+        return None if row < 0 else self._prices[row]
+
+    def stock_of(self, product_id: str) -> Optional[int]:
+        row = self.row_of(product_id)
+        return None if row < 0 else self._stock[row]
+
+    def set_stock(self, product_id: str, stock: int) -> bool:
+        row = self.row_of(product_id)
+        if row < 0:
+            return False
+        self._stock[row] = stock
+        return True
+
+    def categories(self) -> List[str]:
+        return list(self._category_names)
+
+    def display_all(self) -> None:
+        print("\n Baby Shop Inventory:\n")
+        if not self._ids:
+            print(" (empty)")
+        for row in range(len(self._ids)):
+            print(" -", self.product_at(row))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+# --- memory report: bytes per product before and after ---
+
+class _DictProduct:
+    # the original Product layout (per-instance __dict__), kept for comparison only
+    def __init__(self, product_id: str, name: str, category: str, price: float, stock: int):
+        self.product_id = product_id
+        self.name = name
+        self.category = category
+        self.price = price
+        self.stock = stock
+
+
+_CATEGORIES = ["Diapers", "Baby Care", "Feeding", "Toys", "Clothing"]
+
+
+def _measure(build: Callable[[int], object], n: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build(n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / n
+
+
+def _build_dict_products(n: int) -> HashTable:
+    table = HashTable(size=n)
+    for i in range(n):
+        table.insert(_DictProduct(f"P{i:06d}", f"Product #{i}", _CATEGORIES[i % 5], 9.90 + i % 50, i % 500))
+    return table
+
+
+def _build_slot_products(n: int) -> HashTable:
+    table = HashTable(size=n)
+    for i in range(n):
+        table.insert(Product(f"P{i:06d}", f"Product #{i}", _CATEGORIES[i % 5], 9.90 + i % 50, i % 500))
+    return table
+
+
+def _build_store(n: int) -> ProductStore:
+    store = ProductStore(size=n)
+    for i in range(n):
+        store.insert(Product(f"P{i:06d}", f"Product #{i}", _CATEGORIES[i % 5], 9.90 + i % 50, i % 500))
+    return store
+
+
+def memory_report(n: int = 100_000) -> Dict[str, float]:
+    """Bytes per product (ids and names included) for each storage layout."""
+    return {
+        "HashTable + dict Product": _measure(_build_dict_products, n),
+        "HashTable + __slots__ Product": _measure(_build_slot_products, n),
+        "ProductStore (columnar)": _measure(_build_store, n),
+    }
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Bytes per product for N={n:,}:")
+    for label, per_product in memory_report(n).items():
+        print(f"  {label:<30} {per_product:8.1f} B")
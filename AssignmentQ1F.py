@@ -0,0 +1,121 @@
+# secondary indexes (category, price range) for the Q1 inventory
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+from AssignmentQ1C import Inventory, Product, create_inventory, seed_sample_products
+
+
+class CategoryIndex:
+    """category -> set of product ids."""
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, Set[str]] = {}
+
+    def add(self, product: Product) -> None:
+        ids = self._ids.get(product.category)
+        if ids is None:
+            ids = self._ids[product.category] = set()
+        ids.add(product.product_id)
+
+    def discard(self, product: Product) -> None:
+        ids = self._ids.get(product.category)
+        if ids is None:
+            return
+        ids.discard(product.product_id)
+        if not ids:
+            del self._ids[product.category]
+
+    def ids(self, category: str) -> Set[str]:
+        return set(self._ids.get(category, ()))
+
+    def categories(self) -> List[str]:
+        return sorted(self._ids)
+
+
+class PriceIndex:
+    """Sorted (price, product_id) pairs, so a price range is two bisects plus a slice."""
+
+    def __init__(self) -> None:
+        self._entries: List[Tuple[float, str]] = []
+
+    def add(self, product: Product) -> None:
+        insort(self._entries, (product.price, product.product_id))
+
+    def discard(self, product: Product) -> None:
+        entry = (product.price, product.product_id)
+        i = bisect_left(self._entries, entry)
+        if i < len(self._entries) and self._entries[i] == entry:
+            del self._entries[i]
+
+    def ids(self, low: float, high: float) -> List[str]:
+        """Ids with low <= price <= high, cheapest first. O(log n + k)."""
+        entries = self._entries
+        # ("",) sorts before and (chr(0x10FFFF),) after any id sharing the same price
+        start = bisect_left(entries, (low, ""))
+        end = bisect_right(entries, (high, chr(0x10FFFF)))
+        return [pid for _, pid in entries[start:end]]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class InventoryIndexes:
+    """Category and price indexes kept in step with an inventory table.
+
+    The indexes listen to the table's insert/remove/replace notifications, so every
+    change has to go through the table: replace a product with insert() rather than
+    editing its category or price in place.
+    """
+
+    def __init__(self, inventory: Inventory):
+        self.inventory = inventory
+        self.category = CategoryIndex()
+        self.price = PriceIndex()
+        for product in inventory:
+            self._on_change(None, product)
+        inventory.add_listener(self._on_change)
+
+    def detach(self) -> None:
+        self.inventory.remove_listener(self._on_change)
+
+    def _on_change(self, old: Optional[Product], new: Optional[Product]) -> None:
+        if old is not None:
+            self.category.discard(old)
+            self.price.discard(old)
+        if new is not None:
+            self.category.add(new)
+            self.price.add(new)
+
+    def ids_in_category(self, category: str) -> Set[str]:
+        return self.category.ids(category)
+
+    def ids_in_price_range(self, low: float, high: float) -> List[str]:
+        return self.price.ids(low, high)
+
+    def by_category(self, category: str) -> List[Product]:
+        return [p for p in self.inventory.search_many(sorted(self.category.ids(category))) if p is not None]
+
+    def by_price_range(self, low: float, high: float) -> List[Product]:
+        return [p for p in self.inventory.search_many(self.price.ids(low, high)) if p is not None]
+
+
+if __name__ == "__main__":
+    inventory = create_inventory("chained", size=11)
+    indexes = InventoryIndexes(inventory)
+    seed_sample_products(inventory)
+    inventory.insert(Product("BB004", "Random Spoon Set", "Feeding", 9.90, 120))
+
+    print("Feeding products:")
+    for p in indexes.by_category("Feeding"):
+        print(" -", p)
+
+    print("\nBetween RM10 and RM50:")
+    for p in indexes.by_price_range(10, 50):
+        print(" -", p)
+
+    # replacing a record moves it between index entries
+    inventory.insert(Product("BB004", "Random Spoon Set", "Feeding", 19.90, 120))
+    inventory.remove("BB002")
+    print("\nBetween RM10 and RM50 after repricing BB004 and removing BB002:")
+    for p in indexes.by_price_range(10, 50):
+        print(" -", p)
@@ -0,0 +1,377 @@
+# on-disk inventory: mmap'd binary snapshot + append-only operation log (Q1 inventory)
+import heapq
+import json
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from AssignmentQ1C import ChangeListener, HashTable, Product
+
+# snapshot layout (little-endian):
+#   header   magic, record count, offset of the record table, offset of the string table
+#   records  one fixed-width record per product, sorted by product_id bytes:
+#            id/name/category offsets into the string table, their lengths, price, stock
+#   strings  utf-8 bytes; every distinct category is written once and shared
+SNAPSHOT_MAGIC = b"BBINV01\0"
+_HEADER = struct.Struct("<8sQQQ")
+_RECORD = struct.Struct("<QQQIIIdq")
+
+SNAPSHOT_FILE = "inventory.snap"
+LOG_FILE = "inventory.wal"
+
+
+def _sort_key(product: Product) -> bytes:
+    # snapshot order: product_id as utf-8 bytes, the order Snapshot._find searches in
+    return product.product_id.encode("utf-8")
+
+
+def write_snapshot(path: str, products: Iterable[Product], presorted: bool = False) -> int:
+    """Write products to path (atomically, via a temp file). Return how many were written.
+
+    With presorted=True the products must already be in snapshot order and are
+    streamed: records go straight to the file and strings to a temporary file
+    appended after them, so the catalogue is never held in memory.
+    """
+    items = products if presorted else sorted(products, key=_sort_key)
+    shared: Dict[str, Tuple[int, int]] = {}
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f, tempfile.TemporaryFile() as strings:
+            strings_len = 0
+
+            def add_string(text: str, share: bool = False) -> Tuple[int, int]:
+                nonlocal strings_len
+                if share and text in shared:
+                    return shared[text]
+                data = text.encode("utf-8")
+                ref = (strings_len, len(data))
+                strings.write(data)
+                strings_len += len(data)
+                if share:
+                    shared[text] = ref
+                return ref
+
+            # the header needs the record count, so it is written last
+            f.write(bytes(_HEADER.size))
+            count = 0
+            last = None
+            for p in items:
+                key = _sort_key(p)
+                if last is not None and key <= last:
+                    raise ValueError(f"products out of order or duplicated at {p.product_id!r}")
+                last = key
+                id_off, id_len = add_string(p.product_id)
+                name_off, name_len = add_string(p.name)
+                cat_off, cat_len = add_string(p.category, share=True)
+                f.write(_RECORD.pack(id_off, name_off, cat_off, id_len, name_len, cat_len,
+                                     float(p.price), int(p.stock)))
+                count += 1
+            strings_offset = f.tell()
+            strings.seek(0)
+            shutil.copyfileobj(strings, f)
+            f.seek(0)
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, count, _HEADER.size, strings_offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return count
+
+
+class Snapshot:
+    """Read-only view over a snapshot file through mmap.
+
+    Nothing is decoded on open; search() binary-searches the sorted record table
+    and only builds a Product for the record it lands on.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._map)
+        magic, count, records_offset, strings_offset = _HEADER.unpack_from(self._buf, 0)
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an inventory snapshot")
+        self.count = count
+        self._records = records_offset
+        self._strings = strings_offset
+
+    def _string(self, offset: int, length: int) -> bytes:
+        start = self._strings + offset
+        return bytes(self._buf[start:start + length])
+
+    def _id_at(self, i: int) -> bytes:
+        id_off, _, _, id_len, _, _, _, _ = _RECORD.unpack_from(self._buf, self._records + i * _RECORD.size)
+        return self._string(id_off, id_len)
+
+    def _product_at(self, i: int) -> Product:
+        id_off, name_off, cat_off, id_len, name_len, cat_len, price, stock = _RECORD.unpack_from(
+            self._buf, self._records + i * _RECORD.size)
+        return Product(
+            self._string(id_off, id_len).decode("utf-8"),
+            self._string(name_off, name_len).decode("utf-8"),
+            self._string(cat_off, cat_len).decode("utf-8"),
+            price,
+            stock,
+        )
+
+    def _find(self, product_id: str) -> int:
+        key = product_id.encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._id_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self._id_at(lo) == key:
+            return lo
+        return -1
+
+    def __contains__(self, product_id: str) -> bool:
+        return self._find(product_id) >= 0
+
+    def search(self, product_id: str) -> Optional[Product]:
+        i = self._find(product_id)
+        return None if i < 0 else self._product_at(i)
+
+    def __iter__(self) -> Iterator[Product]:
+        for i in range(self.count):
+            yield self._product_at(i)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        self._buf.release()
+        self._map.close()
+        self._file.close()
+
+
+class PersistentInventory:
+    """Inventory stored in a directory as a snapshot plus an operation log.
+
+    Opening maps the snapshot and replays the log into a small in-memory overlay
+    (a HashTable of records changed since the snapshot, plus the ids removed from
+    it). Every insert/remove is appended to the log before it is applied. Once the
+    log holds compact_every operations it is folded into a fresh snapshot.
+    """
+
+    def __init__(self, directory: str, compact_every: int = 10_000, sync: bool = False):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.compact_every = compact_every
+        # fsync the log after every operation (slower, survives power loss)
+        self.sync = sync
+        self._snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self._log_path = os.path.join(directory, LOG_FILE)
+        self._listeners: List[ChangeListener] = []
+        self._snapshot: Optional[Snapshot] = None
+        self._open_snapshot()
+        self._overlay = HashTable(size=101)
+        self._removed: Set[str] = set()
+        self.count = len(self._snapshot)
+        self.log_ops = 0
+        self._replay_log()
+        self._log = open(self._log_path, "a", encoding="utf-8")
+
+    def _open_snapshot(self) -> None:
+        if not os.path.exists(self._snapshot_path):
+            write_snapshot(self._snapshot_path, [])
+        self._snapshot = Snapshot(self._snapshot_path)
+
+    def _replay_log(self) -> None:
+        if not os.path.exists(self._log_path):
+            return
+        good = 0
+        with open(self._log_path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if entry["op"] == "put":
+                    self._apply_put(Product(entry["id"], entry["name"], entry["category"],
+                                            entry["price"], entry["stock"]))
+                elif entry["op"] == "del":
+                    self._apply_remove(entry["id"])
+                self.log_ops += 1
+                good += len(line)
+        if good < os.path.getsize(self._log_path):
+            # a torn tail from a crash mid-write: drop it so new entries start on a clean line
+            with open(self._log_path, "r+b") as f:
+                f.truncate(good)
+
+    # --- applying operations to the in-memory view ---
+    def _apply_put(self, product: Product) -> Optional[Product]:
+        old = self.search(product.product_id)
+        self._overlay.insert(product)
+        self._removed.discard(product.product_id)
+        if old is None:
+            self.count += 1
+        return old
+
+    def _apply_remove(self, product_id: str) -> Optional[Product]:
+        old = self.search(product_id)
+        if old is None:
+            return None
+        self._overlay.remove(product_id)
+        if product_id in self._snapshot:
+            self._removed.add(product_id)
+        self.count -= 1
+        return old
+
+    def _append(self, entry: dict) -> None:
+        self._append_many([entry])
+
+    def _append_many(self, entries: List[dict]) -> None:
+        # one write and one flush (and fsync) for the whole batch
+        if not entries:
+            return
+        self._log.write("".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries))
+        self._log.flush()
+        if self.sync:
+            os.fsync(self._log.fileno())
+        self.log_ops += len(entries)
+
+    # --- listeners, same hook as the in-memory tables ---
+    def add_listener(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ChangeListener) -> None:
+        self._listeners.remove(listener)
+
+    # --- inventory API ---
+    @staticmethod
+    def _put_entry(product: Product) -> dict:
+        return {"op": "put", "id": product.product_id, "name": product.name,
+                "category": product.category, "price": product.price, "stock": product.stock}
+
+    def insert(self, product: Product) -> None:
+        self._append(self._put_entry(product))
+        old = self._apply_put(product)
+        for listener in self._listeners:
+            listener(old, product)
+        self._maybe_compact()
+
+    def search(self, product_id: str) -> Optional[Product]:
+        found = self._overlay.search(product_id)
+        if found is not None:
+            return found
+        if product_id in self._removed:
+            return None
+        return self._snapshot.search(product_id)
+
+    def remove(self, product_id: str) -> bool:
+        if self.search(product_id) is None:
+            return False
+        self._append({"op": "del", "id": product_id})
+        old = self._apply_remove(product_id)
+        for listener in self._listeners:
+            listener(old, None)
+        self._maybe_compact()
+        return True
+
+    def insert_many(self, products: Iterable[Product]) -> int:
+        # the whole batch is logged with a single write and flush, then applied
+        products = list(products)
+        self._append_many([self._put_entry(p) for p in products])
+        before = self.count
+        for product in products:
+            old = self._apply_put(product)
+            for listener in self._listeners:
+                listener(old, product)
+        self._maybe_compact()
+        return self.count - before
+
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        return [self.search(pid) for pid in product_ids]
+
+    def remove_many(self, product_ids: Iterable[str]) -> List[bool]:
+        results = []
+        doomed: Dict[str, None] = {}
+        for pid in product_ids:
+            # an id repeated in the batch is only removed the first time
+            found = pid not in doomed and self.search(pid) is not None
+            if found:
+                doomed[pid] = None
+            results.append(found)
+        self._append_many([{"op": "del", "id": pid} for pid in doomed])
+        for pid in doomed:
+            old = self._apply_remove(pid)
+            for listener in self._listeners:
+                listener(old, None)
+        self._maybe_compact()
+        return results
+
+    def __iter__(self) -> Iterator[Product]:
+        yield from self._overlay
+        for product in self._snapshot:
+            pid = product.product_id
+            if pid not in self._removed and self._overlay.search(pid) is None:
+                yield product
+
+    def __len__(self) -> int:
+        return self.count
+
+    def display_all(self) -> None:
+        print("\n Baby Shop Inventory:\n")
+        any_item = False
+        for product in self:
+            print(" -", product)
+            any_item = True
+        if not any_item:
+            print(" (empty)")
+
+    # --- compaction ---
+    def _maybe_compact(self) -> None:
+        if self.compact_every and self.log_ops >= self.compact_every:
+            self.compact()
+
+    def _sorted_products(self) -> Iterator[Product]:
+        # the snapshot is already in order and only the overlay (at most compact_every
+        # records) needs sorting, so the merged stream never holds the catalogue
+        overlay = sorted(self._overlay, key=_sort_key)
+        removed = self._removed
+        kept = (p for p in self._snapshot
+                if p.product_id not in removed and self._overlay.search(p.product_id) is None)
+        return heapq.merge(overlay, kept, key=_sort_key)
+
+    def compact(self) -> None:
+        """Fold the log into a new snapshot and start an empty log."""
+        # written next to the live snapshot while it is still mapped; on failure
+        # the inventory keeps its current snapshot, overlay and log
+        new_path = self._snapshot_path + ".new"
+        write_snapshot(new_path, self._sorted_products(), presorted=True)
+        # the old mapping has to be closed before the file can be replaced (Windows)
+        self._snapshot.close()
+        try:
+            os.replace(new_path, self._snapshot_path)
+        finally:
+            # the new snapshot, or the old one again if the swap failed
+            self._snapshot = Snapshot(self._snapshot_path)
+        self._log.close()
+        self._log = open(self._log_path, "w", encoding="utf-8")
+        self._overlay = HashTable(size=101)
+        self._removed = set()
+        self.count = len(self._snapshot)
+        self.log_ops = 0
+
+    def close(self) -> None:
+        self._log.close()
+        self._snapshot.close()
+
+    def __enter__(self) -> "PersistentInventory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,211 @@
+# thread-safe inventory with lock striping + multi-threaded stress benchmark (Q1 inventory)
+import random
+import sys
+import threading
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from AssignmentQ1C import ChangeListener, HashTable, Product
+
+
+def _with_stock(product: Product, stock: int) -> Product:
+    # stock changes swap in a new record (like a CLI edit) so listeners see old and new values
+    return Product(product.product_id, product.name, product.category, product.price, stock)
+
+
+def _stripe_of(key: str, stripes: int) -> int:
+    # the stripe comes from the high bits of the hash and the bucket inside it from
+    # hash % size, so keys sharing a stripe still spread over all of its buckets
+    return (hash(key) >> 32) % stripes
+
+
+class StripedHashTable:
+    """HashTable split into independent stripes, each guarded by its own lock.
+
+    A key's stripe is picked from its hash, so two threads only contend when their
+    keys land in the same stripe; lookups on other stripes never wait. Each stripe
+    is an ordinary resizing HashTable, so a resize only ever locks one stripe.
+    Listeners run while the stripe lock is held and must not call back into the table.
+    """
+
+    def __init__(self, size: int = 1031, stripes: int = 16):
+        self.stripes = stripes
+        # HashTable rounds each stripe's size up to a prime
+        per_stripe = max(11, size // stripes)
+        self._tables = [HashTable(size=per_stripe) for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe(self, key: str) -> int:
+        return _stripe_of(key, self.stripes)
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        for table in self._tables:
+            table.add_listener(listener)
+
+    def remove_listener(self, listener: ChangeListener) -> None:
+        for table in self._tables:
+            table.remove_listener(listener)
+
+    def insert(self, product: Product) -> None:
+        s = self._stripe(product.product_id)
+        with self._locks[s]:
+            self._tables[s].insert(product)
+
+    def search(self, product_id: str) -> Optional[Product]:
+        s = self._stripe(product_id)
+        with self._locks[s]:
+            return self._tables[s].search(product_id)
+
+    def remove(self, product_id: str) -> bool:
+        s = self._stripe(product_id)
+        with self._locks[s]:
+            return self._tables[s].remove(product_id)
+
+    def _group(self, keys: List[str]) -> Dict[int, List[int]]:
+        # positions of keys per stripe, so each stripe lock is taken once per batch
+        groups: Dict[int, List[int]] = {}
+        stripes = self.stripes
+        for pos, key in enumerate(keys):
+            groups.setdefault(_stripe_of(key, stripes), []).append(pos)
+        return groups
+
+    def insert_many(self, products: Iterable[Product]) -> int:
+        products = list(products)
+        added = 0
+        for s, positions in self._group([p.product_id for p in products]).items():
+            with self._locks[s]:
+                added += self._tables[s].insert_many([products[i] for i in positions])
+        return added
+
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        ids = list(product_ids)
+        results: List[Optional[Product]] = [None] * len(ids)
+        for s, positions in self._group(ids).items():
+            with self._locks[s]:
+                found = self._tables[s].search_many([ids[i] for i in positions])
+            for i, p in zip(positions, found):
+                results[i] = p
+        return results
+
+    def remove_many(self, product_ids: Iterable[str]) -> List[bool]:
+        ids = list(product_ids)
+        results = [False] * len(ids)
+        for s, positions in self._group(ids).items():
+            with self._locks[s]:
+                removed = self._tables[s].remove_many([ids[i] for i in positions])
+            for i, ok in zip(positions, removed):
+                results[i] = ok
+        return results
+
+    # --- atomic stock updates ---
+    def adjust_stock(self, product_id: str, delta: int) -> bool:
+        """Add delta to the stock of product_id as one atomic step.
+
+        Return False (and change nothing) if the product does not exist or the
+        stock would go negative.
+        """
+        s = self._stripe(product_id)
+        with self._locks[s]:
+            table = self._tables[s]
+            product = table.search(product_id)
+            if product is None or product.stock + delta < 0:
+                return False
+            table.insert(_with_stock(product, product.stock + delta))
+            return True
+
+    def decrement_stock(self, product_id: str, qty: int) -> bool:
+        if qty < 0:
+            raise ValueError("qty must not be negative")
+        return self.adjust_stock(product_id, -qty)
+
+    def __iter__(self) -> Iterator[Product]:
+        # each stripe is copied under its lock, so iteration never sees a half-applied change
+        for s, table in enumerate(self._tables):
+            with self._locks[s]:
+                products = list(table)
+            yield from products
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables)
+
+    def display_all(self) -> None:
+        print("\n Baby Shop Inventory:\n")
+        any_item = False
+        for product in self:
+            print(" -", product)
+            any_item = True
+        if not any_item:
+            print(" (empty)")
+
+
+class LockedHashTable(StripedHashTable):
+    """The same table behind one global lock; the baseline for the stress benchmark."""
+
+    def __init__(self, size: int = 1031):
+        super().__init__(size=size, stripes=1)
+
+
+# --- multi-threaded stress benchmark ---
+
+def _stress(table: StripedHashTable, threads: int, ops_per_thread: int, ids: List[str]) -> Dict[str, int]:
+    decrements = [0] * threads
+    start_gate = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        rng = random.Random(index)
+        start_gate.wait()
+        done = 0
+        for _ in range(ops_per_thread):
+            pid = rng.choice(ids)
+            if rng.random() < 0.5:
+                if table.decrement_stock(pid, 1):
+                    done += 1
+            else:
+                table.search(pid)
+        decrements[index] = done
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    start_gate.wait()
+    t0 = perf_counter_ns()
+    for t in workers:
+        t.join()
+    elapsed = perf_counter_ns() - t0
+    return {"elapsed_ns": elapsed, "decrements": sum(decrements)}
+
+
+def run_stress_benchmark(n_products: int = 1_000, initial_stock: int = 1_000_000,
+                         ops_per_thread: int = 50_000, thread_counts: Iterable[int] = (1, 2, 4, 8),
+                         stripes: int = 16) -> List[Dict[str, object]]:
+    ids = [f"P{i:06d}" for i in range(n_products)]
+    results = []
+    factories: Dict[str, Callable[[], StripedHashTable]] = {
+        "global-lock": lambda: LockedHashTable(size=n_products),
+        f"striped({stripes})": lambda: StripedHashTable(size=n_products, stripes=stripes),
+    }
+    for threads in thread_counts:
+        for label, factory in factories.items():
+            table = factory()
+            table.insert_many(Product(pid, f"Product {pid}", "Bench", 1.0, initial_stock) for pid in ids)
+            run = _stress(table, threads, ops_per_thread, ids)
+            remaining = sum(p.stock for p in table)
+            # every successful decrement must be visible in the final stock levels
+            lost = (n_products * initial_stock - remaining) - run["decrements"]
+            total_ops = threads * ops_per_thread
+            results.append({
+                "table": label,
+                "threads": threads,
+                "ops": total_ops,
+                "ops_per_sec": total_ops * 1_000_000_000 // max(run["elapsed_ns"], 1),
+                "lost_updates": lost,
+            })
+    return results
+
+
+if __name__ == "__main__":
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    print(f"Stress benchmark: 50% decrement_stock / 50% search, {ops:,} ops per thread\n")
+    for row in run_stress_benchmark(ops_per_thread=ops):
+        print(f"  {row['table']:<12} threads={row['threads']:<2} "
+              f"{row['ops_per_sec']:>10,} ops/s  lost updates={row['lost_updates']}")
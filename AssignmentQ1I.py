@@ -0,0 +1,185 @@
+# read-through LRU/TTL cache in front of an inventory (Q1 inventory)
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from AssignmentQ1C import ChangeListener, HashTable, Product, seed_sample_products
+
+# cache entry for an id the backend does not have (negative caching)
+_MISSING = None
+
+
+class CachedInventory:
+    """Bounded read-through cache wrapping any inventory backend.
+
+    search() answers from the cache when it can and otherwise asks the backend,
+    remembering the answer - including "not found" when negative caching is on.
+    Entries are evicted least-recently-used once capacity is reached and expire
+    after ttl seconds (negative_ttl for misses). Writes go straight to the backend;
+    the cache drops the affected ids, both for writes made through this wrapper and,
+    via the backend's change listeners, for writes made on the backend directly.
+    """
+
+    def __init__(self, backend, capacity: int = 1024, ttl: Optional[float] = None,
+                 negative_ttl: Optional[float] = 30.0, cache_misses: bool = True,
+                 clock: Callable[[], float] = time.monotonic):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.backend = backend
+        self.capacity = capacity
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.cache_misses = cache_misses
+        self._clock = clock
+        # product_id -> (product or _MISSING, expiry time or None); order = recency
+        self._entries: "OrderedDict[str, Tuple[Optional[Product], Optional[float]]]" = OrderedDict()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        if hasattr(backend, "add_listener"):
+            backend.add_listener(self._on_change)
+
+    def detach(self) -> None:
+        if hasattr(self.backend, "add_listener"):
+            self.backend.remove_listener(self._on_change)
+
+    # --- cache internals ---
+    def _on_change(self, old: Optional[Product], new: Optional[Product]) -> None:
+        changed = new if new is not None else old
+        if changed is not None:
+            self.invalidate(changed.product_id)
+
+    def invalidate(self, product_id: str) -> None:
+        if self._entries.pop(product_id, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _lookup(self, product_id: str) -> Tuple[bool, Optional[Product]]:
+        # (found in cache, cached value)
+        entry = self._entries.get(product_id)
+        if entry is None:
+            return False, None
+        product, expires = entry
+        if expires is not None and self._clock() >= expires:
+            del self._entries[product_id]
+            self.expirations += 1
+            return False, None
+        self._entries.move_to_end(product_id)
+        if product is _MISSING:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return True, product
+
+    def _store(self, product_id: str, product: Optional[Product]) -> None:
+        if product is _MISSING and not self.cache_misses:
+            return
+        ttl = self.ttl if product is not _MISSING else self.negative_ttl
+        expires = None if ttl is None else self._clock() + ttl
+        entries = self._entries
+        entries[product_id] = (product, expires)
+        entries.move_to_end(product_id)
+        while len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    # --- inventory API ---
+    def search(self, product_id: str) -> Optional[Product]:
+        cached, product = self._lookup(product_id)
+        if cached:
+            return product
+        self.misses += 1
+        product = self.backend.search(product_id)
+        self._store(product_id, product)
+        return product
+
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        ids = list(product_ids)
+        results: List[Optional[Product]] = [None] * len(ids)
+        pending: Dict[str, List[int]] = {}
+        for i, pid in enumerate(ids):
+            cached, product = self._lookup(pid)
+            if cached:
+                results[i] = product
+            else:
+                pending.setdefault(pid, []).append(i)
+        if pending:
+            # one backend round trip for everything the cache could not answer
+            missing = list(pending)
+            self.misses += len(missing)
+            for pid, product in zip(missing, self.backend.search_many(missing)):
+                self._store(pid, product)
+                for i in pending[pid]:
+                    results[i] = product
+        return results
+
+    def insert(self, product: Product) -> None:
+        self.backend.insert(product)
+        self.invalidate(product.product_id)
+
+    def remove(self, product_id: str) -> bool:
+        removed = self.backend.remove(product_id)
+        self.invalidate(product_id)
+        return removed
+
+    def insert_many(self, products: Iterable[Product]) -> int:
+        products = list(products)
+        added = self.backend.insert_many(products)
+        for p in products:
+            self.invalidate(p.product_id)
+        return added
+
+    def remove_many(self, product_ids: Iterable[str]) -> List[bool]:
+        ids = list(product_ids)
+        results = self.backend.remove_many(ids)
+        for pid in ids:
+            self.invalidate(pid)
+        return results
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        self.backend.add_listener(listener)
+
+    def remove_listener(self, listener: ChangeListener) -> None:
+        self.backend.remove_listener(listener)
+
+    def __iter__(self) -> Iterator[Product]:
+        return iter(self.backend)
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def display_all(self) -> None:
+        self.backend.display_all()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+if __name__ == "__main__":
+    inventory = HashTable(size=11)
+    seed_sample_products(inventory)
+    cache = CachedInventory(inventory, capacity=2, ttl=60.0)
+
+    for pid in ["BB001", "BB001", "BB999", "BB999", "BB002", "BB003", "BB001"]:
+        print(f"search {pid}: {cache.search(pid)}")
+
+    # a write on the backend itself still reaches the cache through the listener hook
+    inventory.insert(Product("BB001", "Random Diapers L-Size", "Diapers", 47.90, 80))
+    print("after backend update:", cache.search("BB001"))
+    print("\nCache stats:", cache.stats())
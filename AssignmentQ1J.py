@@ -0,0 +1,260 @@
+# multi-process sharded inventory: one HashTable shard per worker process (Q1 inventory)
+import multiprocessing as mp
+import os
+import sys
+from array import array
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter_ns
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from AssignmentQ1C import HashTable, Product, crc32_hash, create_inventory
+
+# bytes per id in the shared result buffer: price (d) + stock (q) + found flag (b)
+_RESULT_BYTES = 8 + 8 + 1
+
+
+def _result_views(buf: memoryview, capacity: int) -> Tuple[memoryview, memoryview, memoryview]:
+    prices = buf[0:8 * capacity].cast("d")
+    stock = buf[8 * capacity:16 * capacity].cast("q")
+    found = buf[16 * capacity:17 * capacity].cast("b")
+    return prices, stock, found
+
+
+def _shard_worker(conn, engine: str, size: int) -> None:
+    table = create_inventory(engine, size)
+    shm: Optional[SharedMemory] = None
+    views = None
+    while True:
+        op, payload = conn.recv()
+        if op == "insert_many":
+            conn.send(table.insert_many(payload))
+        elif op == "search_many":
+            conn.send(table.search_many(payload))
+        elif op == "remove_many":
+            conn.send(table.remove_many(payload))
+        elif op == "fields_into":
+            # write price/stock/found for each id straight into the shared buffer
+            positions, ids = payload
+            prices, stock, found = views
+            for pos, product in zip(positions, table.search_many(ids)):
+                if product is None:
+                    found[pos] = 0
+                else:
+                    found[pos] = 1
+                    prices[pos] = product.price
+                    stock[pos] = product.stock
+            conn.send(len(ids))
+        elif op == "attach":
+            name, capacity = payload
+            if views is not None:
+                for view in views:
+                    view.release()
+                shm.close()
+            # workers share the parent's resource tracker, so attaching here does not
+            # take ownership: the parent alone unlinks the block in close()
+            shm = SharedMemory(name=name)
+            views = _result_views(shm.buf, capacity)
+            conn.send(True)
+        elif op == "len":
+            conn.send(len(table))
+        elif op == "items":
+            conn.send(list(table))
+        elif op == "close":
+            if views is not None:
+                for view in views:
+                    view.release()
+                shm.close()
+            conn.send(True)
+            break
+
+
+class ShardedInventory:
+    """Inventory partitioned across worker processes, each owning one HashTable shard.
+
+    Ids are routed to a shard with a deterministic CRC-32 (so routing does not depend
+    on PYTHONHASHSEED). Batch calls are split per shard, sent to every shard before any
+    reply is awaited - so the shards work in parallel on separate cores - and the replies
+    are gathered back into input order. search_many() returns Product objects, which are
+    pickled back through a pipe; fields_many() skips that and has the workers write
+    price/stock/found straight into a shared-memory result buffer.
+    """
+
+    def __init__(self, shards: int = os.cpu_count() or 1, size: int = 1031, engine: str = "chained"):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.shards = shards
+        ctx = mp.get_context()
+        # start the tracker before the workers so they inherit it instead of each
+        # launching their own, which would unlink the shared buffer when a worker exits
+        resource_tracker.ensure_running()
+        self._conns = []
+        self._procs = []
+        for _ in range(shards):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_shard_worker, args=(child, engine, max(11, size // shards)), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self._shm: Optional[SharedMemory] = None
+        self._capacity = 0
+
+    def _shard(self, product_id: str) -> int:
+        return crc32_hash(product_id) % self.shards
+
+    def _split(self, ids: List[str]) -> Dict[int, List[int]]:
+        groups: Dict[int, List[int]] = {}
+        shards = self.shards
+        for pos, pid in enumerate(ids):
+            groups.setdefault(crc32_hash(pid) % shards, []).append(pos)
+        return groups
+
+    def _fan_out(self, op: str, payloads: Dict[int, object]) -> Dict[int, object]:
+        for s, payload in payloads.items():
+            self._conns[s].send((op, payload))
+        return {s: self._conns[s].recv() for s in payloads}
+
+    # --- inventory API ---
+    def insert_many(self, products: Iterable[Product]) -> int:
+        products = list(products)
+        groups = self._split([p.product_id for p in products])
+        replies = self._fan_out("insert_many", {s: [products[i] for i in pos] for s, pos in groups.items()})
+        return sum(replies.values())
+
+    def search_many(self, product_ids: Iterable[str]) -> List[Optional[Product]]:
+        ids = list(product_ids)
+        groups = self._split(ids)
+        replies = self._fan_out("search_many", {s: [ids[i] for i in pos] for s, pos in groups.items()})
+        results: List[Optional[Product]] = [None] * len(ids)
+        for s, positions in groups.items():
+            for i, product in zip(positions, replies[s]):
+                results[i] = product
+        return results
+
+    def remove_many(self, product_ids: Iterable[str]) -> List[bool]:
+        ids = list(product_ids)
+        groups = self._split(ids)
+        replies = self._fan_out("remove_many", {s: [ids[i] for i in pos] for s, pos in groups.items()})
+        results = [False] * len(ids)
+        for s, positions in groups.items():
+            for i, removed in zip(positions, replies[s]):
+                results[i] = removed
+        return results
+
+    def _ensure_buffer(self, n: int) -> None:
+        if n <= self._capacity:
+            return
+        capacity = max(n, 2 * self._capacity, 1024)
+        old = self._shm
+        self._shm = SharedMemory(create=True, size=capacity * _RESULT_BYTES)
+        self._capacity = capacity
+        self._fan_out("attach", {s: (self._shm.name, capacity) for s in range(self.shards)})
+        if old is not None:
+            old.close()
+            old.unlink()
+
+    def fields_many(self, product_ids: Iterable[str]) -> Tuple[array, array, List[bool]]:
+        """(prices, stock, found) for each id in input order, gathered through shared memory."""
+        ids = list(product_ids)
+        n = len(ids)
+        if n == 0:
+            # nothing to gather, and no shared buffer exists before the first real batch
+            return array("d"), array("q"), []
+        self._ensure_buffer(n)
+        groups = self._split(ids)
+        self._fan_out("fields_into", {s: (pos, [ids[i] for i in pos]) for s, pos in groups.items()})
+        prices, stock, found = _result_views(self._shm.buf, self._capacity)
+        try:
+            return array("d", prices[:n]), array("q", stock[:n]), [bool(f) for f in found[:n]]
+        finally:
+            for view in (prices, stock, found):
+                view.release()
+
+    def insert(self, product: Product) -> None:
+        self.insert_many([product])
+
+    def search(self, product_id: str) -> Optional[Product]:
+        return self.search_many([product_id])[0]
+
+    def remove(self, product_id: str) -> bool:
+        return self.remove_many([product_id])[0]
+
+    def __len__(self) -> int:
+        return sum(self._fan_out("len", {s: None for s in range(self.shards)}).values())
+
+    def __iter__(self) -> Iterator[Product]:
+        for s in range(self.shards):
+            yield from self._fan_out("items", {s: None})[s]
+
+    def display_all(self) -> None:
+        print("\n Baby Shop Inventory:\n")
+        any_item = False
+        for product in self:
+            print(" -", product)
+            any_item = True
+        if not any_item:
+            print(" (empty)")
+
+    def close(self) -> None:
+        if not self._procs:
+            return
+        self._fan_out("close", {s: None for s in range(self.shards)})
+        for proc in self._procs:
+            proc.join()
+        for conn in self._conns:
+            conn.close()
+        self._procs = []
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "ShardedInventory":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# --- throughput vs number of shards ---
+
+def run_shard_benchmark(n: int = 200_000, batch: int = 50_000, rounds: int = 5,
+                        shard_counts: Optional[Iterable[int]] = None) -> List[Dict[str, object]]:
+    cores = os.cpu_count() or 1
+    if shard_counts is None:
+        shard_counts = sorted({1, 2, 4, cores} | {c for c in (8, 16) if c <= cores})
+    products = [Product(f"P{i:07d}", f"Product #{i}", "Bench", 9.90, 10) for i in range(n)]
+    ids = [p.product_id for p in products]
+    keys = [ids[(i * 7919) % n] for i in range(batch)]
+    results = []
+
+    # in-process single table, the baseline the shards have to beat
+    table = HashTable(size=n)
+    table.insert_many(products)
+    t0 = perf_counter_ns()
+    for _ in range(rounds):
+        table.search_many(keys)
+    elapsed = perf_counter_ns() - t0
+    results.append({"shards": 0, "mode": "in-process", "lookups_per_sec": rounds * batch * 10**9 // elapsed})
+
+    for shards in shard_counts:
+        with ShardedInventory(shards=shards, size=n) as inventory:
+            inventory.insert_many(products)
+            for mode, call in (("search_many", inventory.search_many), ("fields_many", inventory.fields_many)):
+                call(keys)  # warm-up, also sizes the shared buffer
+                t0 = perf_counter_ns()
+                for _ in range(rounds):
+                    call(keys)
+                elapsed = perf_counter_ns() - t0
+                results.append({"shards": shards, "mode": mode,
+                                "lookups_per_sec": rounds * batch * 10**9 // elapsed})
+    return results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"Sharded lookup throughput, N={n:,}, cores={os.cpu_count()}\n")
+    for row in run_shard_benchmark(n=n, batch=min(n, 50_000)):
+        label = "single table" if row["shards"] == 0 else f"{row['shards']} shard(s)"
+        print(f"  {label:<14} {row['mode']:<12} {row['lookups_per_sec']:>12,} lookups/s")
@@ -0,0 +1,187 @@
+# inventory change events: subscriber queues and low-stock triggers (Q1 inventory)
+from collections import deque
+from itertools import count
+from typing import Callable, Deque, Dict, Iterable, List, NamedTuple, Optional
+
+from AssignmentQ1C import Inventory, Product, create_inventory, seed_sample_products
+
+EVENT_KINDS = ("insert", "update", "remove")
+# what a full subscriber queue does with the next event
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
+
+class InventoryEvent(NamedTuple):
+    seq: int
+    kind: str
+    product_id: str
+    before: Optional[Product]
+    after: Optional[Product]
+
+    @property
+    def stock_delta(self) -> int:
+        old = self.before.stock if self.before is not None else 0
+        new = self.after.stock if self.after is not None else 0
+        return new - old
+
+
+EventBatchHandler = Callable[[List[InventoryEvent]], None]
+LowStockHandler = Callable[[InventoryEvent], None]
+
+
+class Subscription:
+    """Bounded queue of events for one consumer.
+
+    Pull with poll(), or give a handler to have events pushed in batches of
+    batch_size (flush() delivers a partial batch). When the queue is full the
+    overflow policy decides which event is lost; `dropped` counts them.
+    """
+
+    def __init__(self, maxlen: int = 1024, batch_size: int = 1, handler: Optional[EventBatchHandler] = None,
+                 kinds: Optional[Iterable[str]] = None, overflow: str = "drop_oldest"):
+        if maxlen <= 0 or batch_size <= 0:
+            raise ValueError("maxlen and batch_size must be positive")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}")
+        self.kinds = frozenset(kinds) if kinds is not None else frozenset(EVENT_KINDS)
+        unknown = self.kinds.difference(EVENT_KINDS)
+        if unknown:
+            raise ValueError(f"unknown event kinds {sorted(unknown)}, expected some of {EVENT_KINDS}")
+        self.maxlen = maxlen
+        self.batch_size = min(batch_size, maxlen)
+        self.handler = handler
+        self.overflow = overflow
+        self._queue: Deque[InventoryEvent] = deque()
+        self.delivered = 0
+        self.dropped = 0
+
+    def _offer(self, event: InventoryEvent) -> None:
+        if event.kind not in self.kinds:
+            return
+        queue = self._queue
+        if len(queue) >= self.maxlen:
+            self.dropped += 1
+            if self.overflow == "drop_newest":
+                return
+            queue.popleft()
+        queue.append(event)
+        if self.handler is not None and len(queue) >= self.batch_size:
+            self.flush()
+
+    def poll(self, max_events: Optional[int] = None) -> List[InventoryEvent]:
+        """Take up to max_events (default: everything queued), oldest first."""
+        queue = self._queue
+        n = len(queue) if max_events is None else min(max_events, len(queue))
+        batch = [queue.popleft() for _ in range(n)]
+        self.delivered += len(batch)
+        return batch
+
+    def flush(self) -> None:
+        # hand everything queued to the handler, batch_size events at a time
+        if self.handler is None:
+            return
+        while self._queue:
+            self.handler(self.poll(self.batch_size))
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+class _LowStockTrigger(NamedTuple):
+    threshold: int
+    handler: LowStockHandler
+    category: Optional[str]
+
+
+def _is_low(product: Optional[Product], trigger: _LowStockTrigger) -> bool:
+    if product is None:
+        return False
+    if trigger.category is not None and product.category != trigger.category:
+        return False
+    return product.stock < trigger.threshold
+
+
+class EventStream:
+    """Turns an inventory's change listener calls into numbered insert/update/remove events.
+
+    Each event carries the record before and after the change, so consumers only
+    look at deltas instead of polling the table. Stock changes are record
+    replacements (see cli_edit / StripedHashTable.adjust_stock) and arrive as updates.
+    Low-stock triggers are checked against each event as it happens and fire once
+    when a product drops below the threshold, not again until it has been restocked.
+    """
+
+    def __init__(self, inventory: Inventory):
+        self.inventory = inventory
+        self._seq = count(1)
+        self._subscriptions: List[Subscription] = []
+        self._triggers: List[_LowStockTrigger] = []
+        self.counts: Dict[str, int] = dict.fromkeys(EVENT_KINDS, 0)
+        inventory.add_listener(self._on_change)
+
+    def detach(self) -> None:
+        self.inventory.remove_listener(self._on_change)
+
+    def _on_change(self, old: Optional[Product], new: Optional[Product]) -> None:
+        if old is None and new is None:
+            return
+        if old is None:
+            kind = "insert"
+        elif new is None:
+            kind = "remove"
+        else:
+            kind = "update"
+        product_id = new.product_id if new is not None else old.product_id
+        event = InventoryEvent(next(self._seq), kind, product_id, old, new)
+        self.counts[kind] += 1
+        for subscription in self._subscriptions:
+            subscription._offer(event)
+        for trigger in self._triggers:
+            # edge-triggered: only the change that crosses the threshold fires
+            if _is_low(new, trigger) and not _is_low(old, trigger):
+                trigger.handler(event)
+
+    # --- subscribers ---
+    def subscribe(self, maxlen: int = 1024, batch_size: int = 1, handler: Optional[EventBatchHandler] = None,
+                  kinds: Optional[Iterable[str]] = None, overflow: str = "drop_oldest") -> Subscription:
+        subscription = Subscription(maxlen, batch_size, handler, kinds, overflow)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.remove(subscription)
+
+    def flush(self) -> None:
+        for subscription in self._subscriptions:
+            subscription.flush()
+
+    # --- low-stock triggers ---
+    def on_low_stock(self, threshold: int, handler: LowStockHandler, category: Optional[str] = None) -> None:
+        """Call handler(event) whenever a product (optionally only in category) falls below threshold."""
+        self._triggers.append(_LowStockTrigger(threshold, handler, category))
+
+    def remove_low_stock(self, handler: LowStockHandler) -> None:
+        self._triggers = [t for t in self._triggers if t.handler is not handler]
+
+
+if __name__ == "__main__":
+    inventory = create_inventory("chained", size=11)
+    stream = EventStream(inventory)
+    audit = stream.subscribe(maxlen=100)
+    reorders: List[str] = []
+    stream.on_low_stock(50, lambda e: reorders.append(e.product_id))
+    # replenishment only cares about updates, in batches of 2
+    stream.subscribe(batch_size=2, kinds=["update"],
+                     handler=lambda batch: print("replenishment batch:", [(e.product_id, e.stock_delta) for e in batch]))
+
+    seed_sample_products(inventory)
+    inventory.insert(Product("BB001", "Random Diapers M-Size", "Diapers", 45.90, 40))
+    inventory.insert(Product("BB001", "Random Diapers M-Size", "Diapers", 45.90, 30))
+    inventory.insert(Product("BB002", "Random Baby Wipes", "Baby Care", 12.50, 150))
+    inventory.remove("BB003")
+    stream.flush()
+
+    print("\nAudit log:")
+    for e in audit.poll():
+        print(f" #{e.seq} {e.kind:<6} {e.product_id}  stock {e.stock_delta:+d}")
+    print("\nReorder needed for:", reorders)
+    print("Event counts:", stream.counts)
@@ -1,6 +1,98 @@
+import os
+import sys
+import tempfile
+import tracemalloc
+from typing import Callable, Dict, List, Literal, Optional
+
+
+class CodeTable:
+    #Interns a small set of repeated strings (genders, privacy levels):
+    #each person keeps a small int code instead of its own copy of the string.
+
+    def __init__(self, values: tuple = ()):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def value(self, code: int) -> str:
+        return self.values[code]
+
+
+#bio handles keep the length in the low bits and the byte offset above them
+_LENGTH_BITS = 32
+_LENGTH_MASK = (1 << _LENGTH_BITS) - 1
+
+
+class BioStore:
+    #Append-only blob store for biographies, kept out of the Person objects.
+    #put() returns a handle, get() decodes the text only when it is asked for.
+    #With a path the bytes live in that file and are read back on demand,
+    #otherwise in one in-memory buffer. Bios are never deleted, only superseded.
+    #A handle packs the bio's byte offset and length, so it needs no index and
+    #stays valid when an existing file is opened again (it is appended to, never truncated).
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._buffer = bytearray()
+        # bios put since this store was opened
+        self._count = 0
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b") if path else None
+
+    def put(self, text: str) -> int:
+        data = text.encode("utf-8")
+        if self._file is not None:
+            start = self._file.seek(0, os.SEEK_END)
+            self._file.write(data)
+        else:
+            start = len(self._buffer)
+            self._buffer.extend(data)
+        self._count += 1
+        return (start << _LENGTH_BITS) | len(data)
+
+    def get(self, handle: int) -> str:
+        start, length = handle >> _LENGTH_BITS, handle & _LENGTH_MASK
+        if self._file is not None:
+            self._file.seek(start)
+            return self._file.read(length).decode("utf-8")
+        return self._buffer[start:start + length].decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def nbytes(self) -> int:
+        #bytes held by the store: the file's size when it is file-backed
+        if self._file is not None:
+            return self._file.seek(0, os.SEEK_END)
+        return len(self._buffer)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+GENDERS = CodeTable()
+PRIVACY = CodeTable(("public", "private"))
+
 
-from typing import Literal
 class Person:
+    #__slots__ instead of a per-instance __dict__; gender and privacy are small
+    #codes into shared tables and the bio is a handle into Person.bio_store.
+    #The bio only goes into the append-only store once the person is accepted
+    #(store_bio()); until then it stays on the object, so a rejected person
+    #leaves nothing behind in the store
+    __slots__ = ("user_id", "name", "_gender", "_privacy", "_bio")
+
+    #where bios go; swap in BioStore(path) to keep them on disk
+    bio_store = BioStore()
 
     def __init__(
         self,
@@ -13,9 +105,48 @@ class Person:
         self.user_id = user_id
         self.name = name
         self.gender = gender
+        self._bio = None
         self.bio = bio
         self.privacy = privacy
 
+    @property
+    def gender(self) -> str:
+        return GENDERS.value(self._gender)
+
+    @gender.setter
+    def gender(self, value: str) -> None:
+        self._gender = GENDERS.code(value)
+
+    @property
+    def privacy(self) -> str:
+        return PRIVACY.value(self._privacy)
+
+    @privacy.setter
+    def privacy(self, value: str) -> None:
+        self._privacy = PRIVACY.code(value)
+
+    @property
+    def bio(self) -> str:
+        #fetched from the store only when a full profile is shown;
+        #_bio is None (no bio), the text itself (not stored yet) or a store handle
+        bio = self._bio
+        if bio is None or isinstance(bio, str):
+            return bio or ""
+        return Person.bio_store.get(bio)
+
+    @bio.setter
+    def bio(self, value: str) -> None:
+        if isinstance(self._bio, int):
+            #already accepted: goes straight to the store
+            self._bio = Person.bio_store.put(value) if value else None
+        else:
+            self._bio = value or None
+
+    def store_bio(self) -> None:
+        #move a pending bio into Person.bio_store; no-op once stored
+        if isinstance(self._bio, str):
+            self._bio = Person.bio_store.put(self._bio)
+
     def __str__(self) -> str:
         #Human-readable representation for printing.
         return f"{self.name} ({self.user_id}) - {self.privacy} profile"
@@ -40,7 +171,74 @@ class Person:
 
         return hash(self.user_id)
 
+
+# --- memory per person: plain __dict__ objects vs the compact Person ---
+
+class _DictPerson:
+    #the original layout, kept for the comparison
+    def __init__(self, user_id: str, name: str, gender: str, bio: str = "", privacy: str = "public"):
+        self.user_id = user_id
+        self.name = name
+        self.gender = gender
+        self.bio = bio
+        self.privacy = privacy
+
+
+_SAMPLE_GENDERS = ("Female", "Male", "Other")
+
+
+def _build(cls: Callable, n: int) -> list:
+    people = []
+    for i in range(n):
+        #decode() gives a fresh string per record, like values parsed from a file would be
+        gender = _SAMPLE_GENDERS[i % 3].encode().decode()
+        privacy = ("private" if i % 5 == 0 else "public").encode().decode()
+        people.append(cls(f"u{i:07d}", f"User {i}", gender, f"Bio of user {i}: likes coffee and travel.", privacy))
+    return people
+
+
+def _accepted_person(*args) -> Person:
+    #a Person as a graph keeps it: accepted, so its bio is in the store
+    person = Person(*args)
+    person.store_bio()
+    return person
+
+
+def _measure(cls: Callable, n: int) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = _build(cls, n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / n
+
+
+def memory_report(n: int = 1_000_000) -> Dict[str, float]:
+    #Bytes per person (ids, names and bios included) for each layout.
+    #The on-disk bios are listed separately: they take file space, not memory.
+    report = {"__dict__ Person": _measure(_DictPerson, n)}
+    default_store = Person.bio_store
+    try:
+        Person.bio_store = BioStore()
+        report["__slots__ Person, bios in memory"] = _measure(_accepted_person, n)
+        with tempfile.TemporaryDirectory() as tmp:
+            Person.bio_store = BioStore(os.path.join(tmp, "bios.bin"))
+            report["__slots__ Person, bios on disk"] = _measure(_accepted_person, n)
+            report["  + bio file (disk, not memory)"] = Person.bio_store.nbytes() / n
+            Person.bio_store.close()
+    finally:
+        Person.bio_store = default_store
+    return report
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        n = int(sys.argv[1])
+        print(f"Bytes per person for N={n:,}:")
+        for label, per_person in memory_report(n).items():
+            print(f"  {label:<34} {per_person:8.1f} B")
+        sys.exit(0)
     mamamia = Person("u001", "MamaMia", "Female", "Travel enthusiast", "public")
     bobby = Person("u002", "BobbyTheGreat", "Male", "Coffee enthusiast", "private")
 
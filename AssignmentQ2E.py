@@ -1,22 +1,78 @@
 
-from typing import Dict, Generic, List, Optional, Set, TypeVar, Literal
+from typing import TYPE_CHECKING, Callable, Dict, Generic, Iterator, List, Optional, Set, TypeVar, Literal
 import sys
 
+from AssignmentQ2B import GENDERS, PRIVACY, BioStore
+
+if TYPE_CHECKING:
+    # only for annotations: AssignmentQ2F imports this module at runtime
+    from AssignmentQ2F import CSRGraph
+
 T = TypeVar('T')
 
 
 # Person entity (Q2)
 class Person:
-    """Represents a social-media user."""
+    """Represents a social-media user.
+
+    Same compact layout as AssignmentQ2B.Person: __slots__, gender/privacy as
+    codes into the shared tables there, and the bio kept in Person.bio_store
+    until something (the full-profile view) reads it. The bio only goes into
+    the append-only store once the person is accepted (store_bio(), called by
+    SocialGraph.addVertex); until then it stays on the object, so a rejected
+    duplicate leaves nothing behind.
+    """
+    __slots__ = ("user_id", "name", "_gender", "_privacy", "_bio")
+
+    bio_store = BioStore()
+
     def __init__(self, user_id: str, name: str, gender: str = "", bio: str = "", privacy: Literal["public", "private"] = "public"):
+        self.privacy = privacy
         self.user_id = user_id
         self.name = name
         self.gender = gender
+        self._bio = None
         self.bio = bio
+
+    @property
+    def gender(self) -> str:
+        return GENDERS.value(self._gender)
+
+    @gender.setter
+    def gender(self, value: str) -> None:
+        self._gender = GENDERS.code(value)
+
+    @property
+    def privacy(self) -> str:
+        return PRIVACY.value(self._privacy)
+
+    @privacy.setter
+    def privacy(self, value: str) -> None:
         # privacy: "public" or "private"
-        if privacy not in ("public", "private"):
+        if value not in ("public", "private"):
             raise ValueError("privacy must be 'public' or 'private'")
-        self.privacy = privacy
+        self._privacy = PRIVACY.code(value)
+
+    @property
+    def bio(self) -> str:
+        # _bio: None (no bio), the text itself (not stored yet) or a store handle
+        bio = self._bio
+        if bio is None or isinstance(bio, str):
+            return bio or ""
+        return Person.bio_store.get(bio)
+
+    @bio.setter
+    def bio(self, value: str) -> None:
+        if isinstance(self._bio, int):
+            # already accepted: goes straight to the store
+            self._bio = Person.bio_store.put(value) if value else None
+        else:
+            self._bio = value or None
+
+    def store_bio(self) -> None:
+        # move a pending bio into Person.bio_store; no-op once stored
+        if isinstance(self._bio, str):
+            self._bio = Person.bio_store.put(self._bio)
 
     def __repr__(self) -> str:
         return f"Person(user_id={self.user_id!r}, name={self.name!r}, privacy={self.privacy!r})"
@@ -34,23 +90,48 @@ class Person:
 
 # Directed Graph (Q1)
 
+# called as listener(src, dst, added) after an edge is added (True) or removed (False)
+EdgeListener = Callable[[T, T, bool], None]
+
 class DirectedGraph(Generic[T]):
 
     def __init__(self) -> None:
         self._adj: Dict[T, Set[T]] = {}
+        # reverse index: v -> vertices that have an edge into v, kept in step with _adj
+        self._radj: Dict[T, Set[T]] = {}
+        # bumped on every structural change, so derived views (freeze()) know when they are stale
+        self.version = 0
+        self._frozen = None
+        self._listeners: List[EdgeListener] = []
+
+    # --- edge listeners (caches built on the graph hook in here) ---
+    def add_listener(self, listener: EdgeListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: EdgeListener) -> None:
+        self._listeners.remove(listener)
+
+    def _notify(self, src: T, dst: T, added: bool) -> None:
+        for listener in self._listeners:
+            listener(src, dst, added)
 
     # --- required operations ---
     def addVertex(self, v: T) -> None:
         if v not in self._adj:
             self._adj[v] = set()
+            self._radj[v] = set()
+            self.version += 1
 
     def addEdge(self, src: T, dst: T) -> None:
         # auto-add missing vertices
-        if src not in self._adj:
-            self._adj[src] = set()
-        if dst not in self._adj:
-            self._adj[dst] = set()
-        self._adj[src].add(dst)
+        self.addVertex(src)
+        self.addVertex(dst)
+        out = self._adj[src]
+        if dst not in out:
+            out.add(dst)
+            self._radj[dst].add(src)
+            self.version += 1
+            self._notify(src, dst, True)
 
     def listOutgoingAdjacentVertex(self, v: T) -> List[T]:
         neighbors = self._adj.get(v)
@@ -58,21 +139,65 @@ class DirectedGraph(Generic[T]):
             return []
         return list(neighbors)
 
+    def listIncomingAdjacentVertex(self, v: T) -> List[T]:
+        sources = self._radj.get(v)
+        if sources is None:
+            return []
+        return list(sources)
+
+    def out_degree(self, v: T) -> int:
+        return len(self._adj.get(v, ()))
+
+    def in_degree(self, v: T) -> int:
+        return len(self._radj.get(v, ()))
+
     # --- helpful extras ---
     def removeEdge(self, src: T, dst: T) -> bool:
         if src not in self._adj:
             return False
         if dst in self._adj[src]:
             self._adj[src].remove(dst)
+            self._radj[dst].discard(src)
+            self.version += 1
+            self._notify(src, dst, False)
             return True
         return False
 
+    def removeVertex(self, v: T) -> bool:
+        # drops v and every edge touching it, via the reverse index instead of a full scan
+        if v not in self._adj:
+            return False
+        following = self._adj.pop(v)
+        followers = self._radj.pop(v)
+        for dst in following:
+            if dst != v:  # a self-follow goes away with v's own sets
+                self._radj[dst].discard(v)
+        for src in followers:
+            if src != v:
+                self._adj[src].discard(v)
+        self.version += 1
+        if self._listeners:
+            for dst in following:
+                self._notify(v, dst, False)
+            for src in followers:
+                if src != v:
+                    self._notify(src, v, False)
+        return True
+
     def hasVertex(self, v: T) -> bool:
         return v in self._adj
 
     def vertices(self) -> List[T]:
         return list(self._adj.keys())
 
+    def freeze(self) -> "CSRGraph":
+        # read-only compact copy, reused until the graph changes;
+        # imported here because AssignmentQ2F builds on this module
+        if self._frozen is None or self._frozen[0] != self.version:
+            from AssignmentQ2F import CSRGraph
+            self._frozen = (self.version, CSRGraph.from_graph(self))
+        return self._frozen[1]
+
     def __str__(self) -> str:
         lines = []
         for v, nbrs in self._adj.items():
@@ -81,11 +206,150 @@ class DirectedGraph(Generic[T]):
         return "\n".join(lines)
 
 
+# User registry: O(1) lookups by user_id / name, O(prefix) type-ahead
+
+def normalize_name(name: str) -> str:
+    # case- and spacing-insensitive key, so "  alice " finds "Alice"
+    return " ".join(name.split()).casefold()
+
+
+class _TrieNode:
+    __slots__ = ("children", "person")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.person: Optional[Person] = None
+
+
+class UserRegistry:
+    """Indexes people by user_id and by normalized name, plus a prefix trie over names.
+
+    user_id must be unique and so, by default, must the name; add() raises
+    ValueError otherwise. Bulk loads pass unique_name=False: a person whose name
+    is already taken is then indexed by user_id only, and the name keeps
+    pointing at whoever registered it first.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: Dict[str, Person] = {}
+        self._by_name: Dict[str, Person] = {}
+        self._trie = _TrieNode()
+
+    def add(self, person: Person, unique_name: bool = True) -> bool:
+        """Register person; returns False if only the user_id was indexed (name already taken)."""
+        key = normalize_name(person.name)
+        if person.user_id in self._by_id:
+            raise ValueError(f"user_id {person.user_id!r} already exists")
+        if key in self._by_name:
+            if unique_name:
+                raise ValueError(f"a user named {person.name!r} already exists")
+            self._by_id[person.user_id] = person
+            return False
+        self._by_id[person.user_id] = person
+        self._by_name[key] = person
+        node = self._trie
+        for ch in key:
+            nxt = node.children.get(ch)
+            if nxt is None:
+                nxt = node.children[ch] = _TrieNode()
+            node = nxt
+        node.person = person
+        return True
+
+    def remove(self, person: Person) -> bool:
+        # matched by user_id like the graph's vertices, so an equal Person (or a
+        # renamed copy) removes the registered one and its registered name
+        registered = self._by_id.pop(person.user_id, None)
+        if registered is None:
+            return False
+        key = normalize_name(registered.name)
+        if self._by_name.get(key) is not registered:
+            # registered by user_id only: the name belongs to someone else
+            return True
+        del self._by_name[key]
+        # unmark the name, then prune the branch nodes nothing else uses
+        path = [self._trie]
+        for ch in key:
+            path.append(path[-1].children[ch])
+        path[-1].person = None
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.person is not None or node.children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+        return True
+
+    def get(self, user_id: str) -> Optional[Person]:
+        return self._by_id.get(user_id)
+
+    def by_name(self, name: str) -> Optional[Person]:
+        return self._by_name.get(normalize_name(name))
+
+    def find(self, query: str) -> Optional[Person]:
+        # what the menu prompts accept: a user_id or a name
+        query = query.strip()
+        return self._by_id.get(query) or self._by_name.get(normalize_name(query))
+
+    def has_id(self, user_id: str) -> bool:
+        return user_id in self._by_id
+
+    def has_name(self, name: str) -> bool:
+        return normalize_name(name) in self._by_name
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> List[Person]:
+        """Up to limit people whose name starts with prefix, in name order."""
+        node = self._trie
+        for ch in normalize_name(prefix):
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        found: List[Person] = []
+        # iterative DFS, children visited in character order
+        stack = [node]
+        while stack and len(found) < limit:
+            node = stack.pop()
+            if node.person is not None:
+                found.append(node.person)
+            stack.extend(node.children[ch] for ch in sorted(node.children, reverse=True))
+        return found
+
+    def __contains__(self, person: object) -> bool:
+        return isinstance(person, Person) and person.user_id in self._by_id
+
+    def __iter__(self) -> Iterator[Person]:
+        # registration order
+        return iter(list(self._by_id.values()))
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+class SocialGraph(DirectedGraph[Person]):
+    """DirectedGraph of Person that keeps a UserRegistry in step with its vertices."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.users = UserRegistry()
+
+    def addVertex(self, v: Person) -> None:
+        if v not in self._adj:
+            # register first so a duplicate id/name leaves the graph (and the bio store) untouched
+            self.users.add(v)
+            v.store_bio()
+            super().addVertex(v)
+
+    def removeVertex(self, v: Person) -> bool:
+        if not super().removeVertex(v):
+            return False
+        self.users.remove(v)
+        return True
+
+
 
 # Sample data creation (Q3 & Q4)
 
-def create_sample_graph() -> (DirectedGraph[Person], List[Person]):
-    graph: DirectedGraph[Person] = DirectedGraph()
+def create_sample_graph() -> (SocialGraph, List[Person]):
+    graph = SocialGraph()
 
     # Create 7 sample people (between 5 and 10)
     alice = Person("u001", "Alice", "Female", "Travel lover and photographer.", "public")
@@ -125,6 +389,7 @@ def create_sample_graph() -> (DirectedGraph[Person], List[Person]):
 
 # Utility helpers
 def find_person_by_name(people: List[Person], name: str) -> Optional[Person]:
+    # linear scan for a plain list; the menu looks people up through SocialGraph.users
     for p in people:
         if p.name.lower() == name.lower():
             return p
@@ -132,13 +397,8 @@ def find_person_by_name(people: List[Person], name: str) -> Optional[Person]:
 
 
 def list_followers(graph: DirectedGraph[Person], target: Person) -> List[Person]:
-    # incoming edges: find all vertices that have 'target' in their outgoing set
-    followers: List[Person] = []
-    for v in graph.vertices():
-        nbrs = graph.listOutgoingAdjacentVertex(v)
-        if target in nbrs:
-            followers.append(v)
-    return followers
+    # incoming edges come straight from the graph's reverse index
+    return graph.listIncomingAdjacentVertex(target)
 
 # Menu-driven program (Question 5)
 
@@ -154,6 +414,11 @@ def print_menu():
     print("7. Unfollow someone (user X unfollows user Y)")
     print("8. View a user's profile (respect privacy)  [Optional feature]")
     print("9. Show full graph (debug)")
+    print("10. Search users by name prefix")
+    print("11. How is user X connected to user Y (shortest follow path)")
+    print("12. Accounts within k hops of a user")
+    print("13. Who to follow (recommendations for a user)")
+    print("14. Save graph snapshot to a file")
     print("0. Exit")
 
 
@@ -171,12 +436,32 @@ def prompt_new_person() -> Person:
     return Person(user_id, name, gender, bio, privacy)
 
 
-def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
-    # maintain people list in sync with graph (so adding new users works)
+def find_user(graph: SocialGraph, query: str) -> Optional[Person]:
+    # exact user_id / name lookup, with type-ahead suggestions on a miss
+    person = graph.users.find(query)
+    if person is None and query.strip():
+        matches = graph.users.search_prefix(query, limit=5)
+        if matches:
+            print("Did you mean:", ", ".join(p.name for p in matches))
+    return person
+
+
+def menu(graph: SocialGraph, people: Optional[List[Person]] = None) -> None:
+    # lookups go through graph.users; people, if given, is kept in sync for callers holding the list.
+    # graph may also be a read-only AssignmentQ2K.GraphSnapshot: the queries run on it directly
+    recommender = None
     while True:
         print_menu()
         choice = input("Choose an option: ").strip()
 
+        # the first edit turns a snapshot into a SocialGraph (checked by attribute, since this
+        # module may be __main__ while the snapshot builds AssignmentQ2E objects)
+        if choice in ("5", "6", "7") and hasattr(graph, "to_social_graph"):
+            snapshot = graph
+            graph = snapshot.to_social_graph()
+            snapshot.close()
+            recommender = None
+
         if choice == "0":
             print("Goodbye!")
             break
@@ -184,15 +469,15 @@ def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
         # 1. Display all users' names
         elif choice == "1":
             print("\nAll users:")
-            if not people:
+            if not len(graph.users):
                 print(" (none)")
-            for p in people:
+            for p in graph.users:
                 print(" -", p.name)
 
         # 2. View full profile ignoring privacy
         elif choice == "2":
             name = input("Enter user name: ").strip()
-            person = find_person_by_name(people, name)
+            person = find_user(graph, name)
             if not person:
                 print("User not found.")
             else:
@@ -206,7 +491,7 @@ def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
         # 3. View the list of accounts a user follows (outgoing)
         elif choice == "3":
             name = input("Enter user name: ").strip()
-            person = find_person_by_name(people, name)
+            person = find_user(graph, name)
             if not person:
                 print("User not found.")
             else:
@@ -220,7 +505,7 @@ def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
         # 4. View list of followers (incoming edges)
         elif choice == "4":
             name = input("Enter user name: ").strip()
-            person = find_person_by_name(people, name)
+            person = find_user(graph, name)
             if not person:
                 print("User not found.")
             else:
@@ -235,12 +520,13 @@ def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
         elif choice == "5":
             new_person = prompt_new_person()
             # ensure unique user_id and name
-            if any(p.user_id == new_person.user_id for p in people):
+            if graph.users.has_id(new_person.user_id):
                 print("A user with that ID already exists. Aborting.")
-            elif any(p.name.lower() == new_person.name.lower() for p in people):
+            elif graph.users.has_name(new_person.name):
                 print("A user with that name already exists. Aborting.")
             else:
-                people.append(new_person)
+                if people is not None:
+                    people.append(new_person)
                 graph.addVertex(new_person)
                 print(f"Added user: {new_person}")
 
@@ -248,8 +534,8 @@ def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
         elif choice == "6":
             name_x = input("Enter follower's name (X): ").strip()
             name_y = input("Enter follower's name (Y): ").strip()
-            x = find_person_by_name(people, name_x)
-            y = find_person_by_name(people, name_y)
+            x = find_user(graph, name_x)
+            y = find_user(graph, name_y)
             if not x or not y:
                 print("One or both users not found.")
             else:
@@ -260,8 +546,8 @@ def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
         elif choice == "7":
             name_x = input("Enter follower's name (X): ").strip()
             name_y = input("Enter follower's name (Y): ").strip()
-            x = find_person_by_name(people, name_x)
-            y = find_person_by_name(people, name_y)
+            x = find_user(graph, name_x)
+            y = find_user(graph, name_y)
             if not x or not y:
                 print("One or both users not found.")
             else:
@@ -274,7 +560,7 @@ def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
         # 8. View profile with privacy respected (optional)
         elif choice == "8":
             name = input("Enter user name: ").strip()
-            person = find_person_by_name(people, name)
+            person = find_user(graph, name)
             if not person:
                 print("User not found.")
             else:
@@ -292,10 +578,101 @@ def menu(graph: DirectedGraph[Person], people: List[Person]) -> None:
             print("\nGraph adjacency (debug):")
             print(graph)
 
+        # 10. Type-ahead search over the name trie
+        elif choice == "10":
+            prefix = input("Name starts with: ").strip()
+            matches = graph.users.search_prefix(prefix, limit=20)
+            print(f"\nMatches for {prefix!r}:")
+            if not matches:
+                print(" (none)")
+            for p in matches:
+                print(" -", p)
+
+        # 11. Degrees of separation (bidirectional BFS)
+        elif choice == "11":
+            # imported here because AssignmentQ2G builds on this module
+            from AssignmentQ2G import shortest_path
+            name_x = input("From user (X): ").strip()
+            name_y = input("To user (Y): ").strip()
+            x = find_user(graph, name_x)
+            y = find_user(graph, name_y)
+            if not x or not y:
+                print("One or both users not found.")
+            else:
+                path = shortest_path(graph, x, y)
+                if path is None:
+                    print(f"{x.name} cannot reach {y.name} through follows.")
+                else:
+                    print(f"\n{len(path) - 1} degree(s) of separation:")
+                    print(" " + " -> ".join(p.name for p in path))
+
+        # 12. k-hop neighbourhood
+        elif choice == "12":
+            from AssignmentQ2G import within_hops
+            name = input("Enter user name: ").strip()
+            person = find_user(graph, name)
+            if not person:
+                print("User not found.")
+            else:
+                while True:
+                    k_text = input("Max hops (k) [2]: ").strip() or "2"
+                    if k_text.isdigit():
+                        k = int(k_text)
+                        break
+                    print("Invalid number of hops. Enter a whole number >= 0.")
+                reach = within_hops(graph, person, k)
+                print(f"\nWithin {k} hop(s) of {person.name} ({len(reach)}):")
+                if not reach:
+                    print(" (none)")
+                for p, hops in sorted(reach.items(), key=lambda item: (item[1], item[0].name)):
+                    print(f" [{hops}] {p.name}")
+
+        # 13. Friend-of-friend recommendations (cached until follows change)
+        elif choice == "13":
+            from AssignmentQ2H import Recommender
+            if recommender is None:
+                recommender = Recommender(graph, k=5)
+            name = input("Enter user name: ").strip()
+            person = find_user(graph, name)
+            if not person:
+                print("User not found.")
+            else:
+                suggestions = recommender.recommend(person)
+                print(f"\nSuggested for {person.name} ({len(suggestions)}):")
+                if not suggestions:
+                    print(" (none)")
+                for r in suggestions:
+                    print(f" + {r.person.name}  (score {r.score:.2f}, {r.mutual} mutual)")
+
+        # 14. Binary snapshot; start again with: python AssignmentQ2E.py FILE.graph
+        elif choice == "14":
+            from AssignmentQ2K import save_graph
+            path = input("Snapshot file [social.graph]: ").strip() or "social.graph"
+            try:
+                n_vertices, n_edges = save_graph(path, graph)
+            except OSError as exc:
+                print(f"Could not save: {exc}")
+            else:
+                print(f"Saved {n_vertices} users and {n_edges} follows to {path}.")
+
         else:
             print("Invalid option. Please try again.")
 
 
 if __name__ == "__main__":
-    g, people_list = create_sample_graph()
+    if len(sys.argv) > 1 and sys.argv[1].endswith(".graph"):
+        # python AssignmentQ2E.py FILE.graph: reopen a snapshot saved with option 14, queried
+        # in place until the first edit
+        from AssignmentQ2K import GraphSnapshot
+        g = GraphSnapshot(sys.argv[1])
+        people_list = None
+    elif len(sys.argv) > 1:
+        # python AssignmentQ2E.py EDGES.csv [PROFILES.jsonl]; imported here because AssignmentQ2J builds on this module
+        from AssignmentQ2J import load_social_graph, print_stats
+        g, load_stats = load_social_graph(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+        print(f"Loaded {sys.argv[1]}:")
+        print_stats(load_stats)
+        people_list = list(g.users)
+    else:
+        g, people_list = create_sample_graph()
     menu(g, people_list)
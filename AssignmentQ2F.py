@@ -0,0 +1,306 @@
+# compressed sparse row (CSR) snapshot of the follow graph (Q2 social graph)
+import random
+import sys
+import tracemalloc
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; as_numpy() needs it
+    np = None
+
+from AssignmentQ2E import DirectedGraph, create_sample_graph
+
+T = TypeVar('T')
+
+
+def _index_typecode(n: int) -> str:
+    # 4-byte vertex ids while they fit, 8-byte beyond that
+    return "i" if n < 2 ** 31 else "q"
+
+
+def _row_offsets(n: int, sources: Sequence[int]) -> array:
+    # counting sort, step 1: where each source's row starts
+    offsets = array("q", bytes(8 * (n + 1)))
+    for s in sources:
+        offsets[s + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    return offsets
+
+
+def _scatter(offsets: array, sources: Sequence[int], targets: Sequence[int], typecode: str) -> array:
+    # counting sort, step 2: drop each target into the next free cell of its source's row
+    out = array(typecode, bytes(array(typecode).itemsize * len(targets)))
+    fill = array("q", offsets)
+    for s, t in zip(sources, targets):
+        out[fill[s]] = t
+        fill[s] += 1
+    return out
+
+
+def _sorted_rows_numpy(n: int, sources: Sequence[int], targets: Sequence[int], dedup: bool) -> Tuple[array, array]:
+    # vectorized version of the counting sort + per-row sort/dedup: order edges by
+    # (source, target), drop adjacent repeats, and count row lengths with bincount
+    typecode = _index_typecode(n)
+    dtype = np.int32 if typecode == "i" else np.int64
+    src = np.asarray(sources, dtype=dtype)
+    dst = np.asarray(targets, dtype=dtype)
+    order = np.lexsort((dst, src))
+    src = src[order]
+    dst = dst[order]
+    if dedup and len(src):
+        keep = np.empty(len(src), dtype=bool)
+        keep[0] = True
+        np.not_equal(src[1:], src[:-1], out=keep[1:])
+        keep[1:] |= dst[1:] != dst[:-1]
+        src = src[keep]
+        dst = dst[keep]
+    row_offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=n), out=row_offsets[1:])
+    offsets = array("q")
+    offsets.frombytes(row_offsets.tobytes())
+    out = array(typecode)
+    out.frombytes(dst.tobytes())
+    return offsets, out
+
+
+class CSRGraph(Generic[T]):
+    """Read-only follow graph packed into two flat integer arrays.
+
+    Vertices get dense ids 0..V-1. The accounts vertex i follows are
+    targets[offsets[i]:offsets[i + 1]], sorted by id, so there is no per-edge
+    Python object at all. Build one with DirectedGraph.freeze() (or from_graph);
+    the lookup methods mirror DirectedGraph so read-only code can take either.
+    """
+
+    def __init__(self, vertices: List[T], offsets: array, targets: array):
+        if len(offsets) != len(vertices) + 1:
+            raise ValueError("offsets needs one entry per vertex plus one")
+        self._vertices = vertices
+        self._index: Dict[T, int] = {v: i for i, v in enumerate(vertices)}
+        self.offsets = offsets
+        self.targets = targets
+        self._transpose: Optional["CSRGraph[T]"] = None
+
+    @classmethod
+    def from_graph(cls, graph: Any) -> "CSRGraph[T]":
+        # works on any of the dict-of-sets DirectedGraph classes (Q2A / Q2E)
+        adj = graph._adj
+        vertices = list(adj)
+        index = {v: i for i, v in enumerate(vertices)}
+        offsets = array("q", [0]) * (len(vertices) + 1)
+        targets = array(_index_typecode(len(vertices)))
+        pos = 0
+        for i, v in enumerate(vertices):
+            ids = sorted([index[n] for n in adj[v]])
+            targets.extend(ids)
+            pos += len(ids)
+            offsets[i + 1] = pos
+        return cls(vertices, offsets, targets)
+
+    @classmethod
+    def from_edges(cls, vertices: List[T], sources: Sequence[int], targets: Sequence[int],
+                   dedup: bool = True) -> "CSRGraph[T]":
+        """Build from parallel (source id, target id) sequences without a dict graph in between."""
+        n = len(vertices)
+        if np is not None:
+            offsets, out = _sorted_rows_numpy(n, sources, targets, dedup)
+            return cls(vertices, offsets, out)
+        offsets = _row_offsets(n, sources)
+        out = _scatter(offsets, sources, targets, _index_typecode(n))
+        graph = cls(vertices, offsets, out)
+        graph._sort_rows(dedup)
+        return graph
+
+    def _sort_rows(self, dedup: bool) -> None:
+        # sort each row's targets by id, optionally dropping repeats, and compact in place
+        offsets = self.offsets
+        targets = self.targets
+        write = 0
+        lo = offsets[0]
+        for i in range(len(offsets) - 1):
+            hi = offsets[i + 1]
+            row = sorted(targets[lo:hi])
+            if dedup and row:
+                row = [t for k, t in enumerate(row) if k == 0 or t != row[k - 1]]
+            targets[write:write + len(row)] = array(targets.typecode, row)
+            offsets[i] = write
+            write += len(row)
+            lo = hi
+        offsets[-1] = write
+        del targets[write:]
+
+    def transpose(self) -> "CSRGraph[T]":
+        """The same vertices with every edge reversed (who follows each account); cached."""
+        if self._transpose is None:
+            n = len(self._vertices)
+            if np is not None:
+                offsets, targets = self.as_numpy()
+                sources = np.repeat(np.arange(n, dtype=targets.dtype), np.diff(offsets))
+                # rows were deduplicated already, reversing cannot create repeats
+                rev = CSRGraph(self._vertices, *_sorted_rows_numpy(n, targets, sources, False))
+                rev._index = self._index
+                rev._transpose = self
+                self._transpose = rev
+                return rev
+            sources = array(self.targets.typecode, bytes(self.targets.itemsize * len(self.targets)))
+            offsets = self.offsets
+            for i in range(n):
+                for k in range(offsets[i], offsets[i + 1]):
+                    sources[k] = i
+            rev_offsets = _row_offsets(n, self.targets)
+            # sources are visited in ascending order, so each reversed row comes out sorted
+            rev = CSRGraph(self._vertices, rev_offsets, _scatter(rev_offsets, self.targets, sources, self.targets.typecode))
+            rev._index = self._index
+            rev._transpose = self
+            self._transpose = rev
+        return self._transpose
+
+    # --- size ---
+    @property
+    def num_vertices(self) -> int:
+        return len(self._vertices)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def __len__(self) -> int:
+        return len(self._vertices)
+
+    # --- id <-> vertex ---
+    def index_of(self, v: T) -> int:
+        """Dense id of v, or -1 if v is not in the graph."""
+        return self._index.get(v, -1)
+
+    def vertex(self, i: int) -> T:
+        return self._vertices[i]
+
+    def vertices(self) -> List[T]:
+        return list(self._vertices)
+
+    def hasVertex(self, v: T) -> bool:
+        return v in self._index
+
+    # --- integer adjacency (no Python objects created per edge) ---
+    def neighbors(self, i: int) -> memoryview:
+        """Ids vertex i follows, as a zero-copy view into targets."""
+        return memoryview(self.targets)[self.offsets[i]:self.offsets[i + 1]]
+
+    def degree_of(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def has_edge_ids(self, i: int, j: int) -> bool:
+        lo, hi = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.targets, j, lo, hi)
+        return k < hi and self.targets[k] == j
+
+    # --- same lookups as DirectedGraph ---
+    def listOutgoingAdjacentVertex(self, v: T) -> List[T]:
+        i = self._index.get(v)
+        if i is None:
+            return []
+        vertices = self._vertices
+        return [vertices[j] for j in self.neighbors(i)]
+
+    def hasEdge(self, src: T, dst: T) -> bool:
+        i = self._index.get(src)
+        j = self._index.get(dst)
+        return i is not None and j is not None and self.has_edge_ids(i, j)
+
+    def out_degree(self, v: T) -> int:
+        i = self._index.get(v)
+        return 0 if i is None else self.degree_of(i)
+
+    def edges(self) -> Iterable[Tuple[int, int]]:
+        # (src id, dst id) pairs in CSR order
+        offsets = self.offsets
+        targets = self.targets
+        for i in range(len(self._vertices)):
+            for k in range(offsets[i], offsets[i + 1]):
+                yield i, targets[k]
+
+    def as_numpy(self) -> Tuple[Any, Any]:
+        """(offsets, targets) as NumPy arrays sharing this graph's buffers."""
+        if np is None:
+            raise RuntimeError("as_numpy() needs numpy installed")
+        return (np.frombuffer(self.offsets, dtype=np.int64),
+                np.frombuffer(self.targets, dtype=np.int32 if self.targets.typecode == "i" else np.int64))
+
+    def nbytes(self) -> int:
+        # the two edge arrays plus the vertex list and id lookup (vertex objects themselves excluded)
+        return (self.offsets.itemsize * len(self.offsets) + self.targets.itemsize * len(self.targets)
+                + sys.getsizeof(self._vertices) + sys.getsizeof(self._index))
+
+    def __str__(self) -> str:
+        lines = []
+        for i, v in enumerate(self._vertices):
+            lines.append(f"{v} -> {[str(self._vertices[j]) for j in self.neighbors(i)]}")
+        return "\n".join(lines)
+
+
+# --- memory per edge: dict of sets vs CSR ---
+
+def random_follow_graph(vertices: List[T], avg_degree: int, seed: int = 42) -> DirectedGraph[T]:
+    rnd = random.Random(seed)
+    graph: DirectedGraph[T] = DirectedGraph()
+    for v in vertices:
+        graph.addVertex(v)
+    n = len(vertices)
+    randrange = rnd.randrange
+    for v in vertices:
+        for _ in range(avg_degree):
+            graph.addEdge(v, vertices[randrange(n)])
+    return graph
+
+
+def random_csr(n_vertices: int, avg_degree: int, seed: int = 42) -> CSRGraph[int]:
+    # synthetic graph straight into CSR, for sizes where a dict graph would not fit
+    rnd = random.Random(seed)
+    randrange = rnd.randrange
+    m = n_vertices * avg_degree
+    typecode = _index_typecode(n_vertices)
+    sources = array(typecode, bytes(array(typecode).itemsize * m))
+    targets = array(typecode, [randrange(n_vertices) for _ in range(m)])
+    for k in range(m):
+        sources[k] = k // avg_degree
+    return CSRGraph.from_edges(list(range(n_vertices)), sources, targets)
+
+
+def memory_report(n_vertices: int = 100_000, avg_degree: int = 10, seed: int = 42) -> Dict[str, float]:
+    """Bytes per edge of the adjacency structure alone, vertex objects excluded."""
+    # vertex objects are made before measuring so only the adjacency is counted
+    vertices = list(range(n_vertices))
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    graph = random_follow_graph(vertices, avg_degree, seed)
+    dict_bytes = tracemalloc.get_traced_memory()[0] - base
+    base = tracemalloc.get_traced_memory()[0]
+    frozen = graph.freeze()
+    csr_bytes = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    edges = frozen.num_edges
+    return {
+        "edges": edges,
+        "dict of sets": dict_bytes / edges,
+        "CSR": csr_bytes / edges,
+        "CSR arrays only": (frozen.offsets.itemsize * len(frozen.offsets)
+                            + frozen.targets.itemsize * len(frozen.targets)) / edges,
+    }
+
+
+if __name__ == "__main__":
+    g, people = create_sample_graph()
+    frozen = g.freeze()
+    for p in people:
+        print(f"{p.name} follows:", [f.name for f in frozen.listOutgoingAdjacentVertex(p)])
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    degree = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    report = memory_report(n, degree)
+    print(f"\nBytes per edge for V={n:,}, E={report.pop('edges'):,}:")
+    for label, per_edge in report.items():
+        print(f"  {label:<16} {per_edge:8.1f} B")
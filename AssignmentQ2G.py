@@ -0,0 +1,261 @@
+# traversals over the follow graph: BFS, DFS, shortest paths, k-hop (Q2 social graph)
+import argparse
+import random
+import sys
+from time import perf_counter
+from typing import Any, Dict, List, Optional, TypeVar, Union
+
+from AssignmentQ2E import DirectedGraph
+from AssignmentQ2F import CSRGraph, random_csr
+
+T = TypeVar('T')
+
+# everything here is iterative (explicit frontier lists / stacks), so deep or
+# long chains never hit the recursion limit; the *_ids functions work on dense
+# CSR vertex ids and the plain-named ones wrap them for DirectedGraph vertices
+
+
+# --- id-level traversals on a CSRGraph ---
+
+def bfs_ids(csr: CSRGraph, source: int, max_depth: int = -1) -> List[int]:
+    """Ids reachable from source in BFS order (source first), optionally only up to max_depth hops."""
+    visited = bytearray(csr.num_vertices)
+    visited[source] = 1
+    order = [source]
+    frontier = [source]
+    offsets = csr.offsets
+    targets = csr.targets
+    depth = 0
+    while frontier and depth != max_depth:
+        nxt = []
+        for u in frontier:
+            for k in range(offsets[u], offsets[u + 1]):
+                w = targets[k]
+                if not visited[w]:
+                    visited[w] = 1
+                    nxt.append(w)
+        order.extend(nxt)
+        frontier = nxt
+        depth += 1
+    return order
+
+
+def dfs_ids(csr: CSRGraph, source: int) -> List[int]:
+    """Ids reachable from source in DFS preorder, lower ids explored first."""
+    visited = bytearray(csr.num_vertices)
+    order: List[int] = []
+    stack = [source]
+    offsets = csr.offsets
+    targets = csr.targets
+    while stack:
+        u = stack.pop()
+        if visited[u]:
+            continue
+        visited[u] = 1
+        order.append(u)
+        # pushed in reverse so the smallest id is popped next
+        for k in range(offsets[u + 1] - 1, offsets[u] - 1, -1):
+            w = targets[k]
+            if not visited[w]:
+                stack.append(w)
+    return order
+
+
+def k_hop_ids(csr: CSRGraph, source: int, k: int) -> Dict[int, int]:
+    """id -> hop count for everything within k hops of source (source excluded)."""
+    # a dict instead of a V-sized visited array: small neighbourhoods stay cheap on huge graphs
+    depth: Dict[int, int] = {source: 0}
+    frontier = [source]
+    offsets = csr.offsets
+    targets = csr.targets
+    for d in range(1, k + 1):
+        nxt = []
+        for u in frontier:
+            for j in range(offsets[u], offsets[u + 1]):
+                w = targets[j]
+                if w not in depth:
+                    depth[w] = d
+                    nxt.append(w)
+        if not nxt:
+            break
+        frontier = nxt
+    del depth[source]
+    return depth
+
+
+def _path(meet: int, forward: Dict[int, int], backward: Dict[int, int]) -> List[int]:
+    # walk parents back to the source, then successors on to the target
+    path = []
+    u = meet
+    while u != -1:
+        path.append(u)
+        u = forward[u]
+    path.reverse()
+    u = backward[meet]
+    while u != -1:
+        path.append(u)
+        u = backward[u]
+    return path
+
+
+def shortest_path_ids(csr: CSRGraph, source: int, target: int) -> Optional[List[int]]:
+    """Fewest-hops path of ids from source to target, or None; bidirectional BFS.
+
+    One search runs forward from source and one runs over the reversed graph
+    from target, always growing whichever frontier is smaller, so each side
+    only explores about half the depth.
+    """
+    if source == target:
+        return [source]
+    rev = csr.transpose()
+    # parent pointers: forward side points toward source, backward side toward target
+    parents = ({source: -1}, {target: -1})
+    depths = ({source: 0}, {target: 0})
+    frontiers = ([source], [target])
+    graphs = (csr, rev)
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, depth, other = parents[side], depths[side], depths[1 - side]
+        offsets, targets = graphs[side].offsets, graphs[side].targets
+        nxt = []
+        best = -1
+        meet = -1
+        for u in frontiers[side]:
+            du = depth[u] + 1
+            for k in range(offsets[u], offsets[u + 1]):
+                w = targets[k]
+                if w in parent:
+                    continue
+                parent[w] = u
+                depth[w] = du
+                nxt.append(w)
+                # finish the whole level before picking, the first meeting is not always the shortest
+                if w in other and (best < 0 or du + other[w] < best):
+                    best = du + other[w]
+                    meet = w
+        if meet >= 0:
+            return _path(meet, parents[0], parents[1])
+        frontiers = (nxt, frontiers[1]) if side == 0 else (frontiers[0], nxt)
+    return None
+
+
+def bfs_path_ids(csr: CSRGraph, source: int, target: int) -> Optional[List[int]]:
+    """Same answer as shortest_path_ids from a one-directional BFS (the benchmark baseline)."""
+    parent = {source: -1}
+    frontier = [source]
+    offsets = csr.offsets
+    targets = csr.targets
+    while frontier and target not in parent:
+        nxt = []
+        for u in frontier:
+            for k in range(offsets[u], offsets[u + 1]):
+                w = targets[k]
+                if w not in parent:
+                    parent[w] = u
+                    nxt.append(w)
+        frontier = nxt
+    if target not in parent:
+        return None
+    return _path(target, parent, {target: -1})
+
+
+# --- vertex-level API (DirectedGraph or CSRGraph) ---
+
+GraphLike = Union[DirectedGraph, CSRGraph]
+
+
+def _csr(graph: GraphLike) -> CSRGraph:
+    # DirectedGraph.freeze() is cached until the graph changes
+    return graph if isinstance(graph, CSRGraph) else graph.freeze()
+
+
+def bfs(graph: GraphLike, source: T, max_depth: int = -1) -> List[T]:
+    csr = _csr(graph)
+    i = csr.index_of(source)
+    return [] if i < 0 else [csr.vertex(j) for j in bfs_ids(csr, i, max_depth)]
+
+
+def dfs(graph: GraphLike, source: T) -> List[T]:
+    csr = _csr(graph)
+    i = csr.index_of(source)
+    return [] if i < 0 else [csr.vertex(j) for j in dfs_ids(csr, i)]
+
+
+def within_hops(graph: GraphLike, source: T, k: int) -> Dict[T, int]:
+    """Everyone source can reach in at most k follows -> hop count."""
+    csr = _csr(graph)
+    i = csr.index_of(source)
+    return {} if i < 0 else {csr.vertex(j): d for j, d in k_hop_ids(csr, i, k).items()}
+
+
+def shortest_path(graph: GraphLike, source: T, target: T) -> Optional[List[T]]:
+    csr = _csr(graph)
+    i, j = csr.index_of(source), csr.index_of(target)
+    if i < 0 or j < 0:
+        return None
+    path = shortest_path_ids(csr, i, j)
+    return None if path is None else [csr.vertex(v) for v in path]
+
+
+def degrees_of_separation(graph: GraphLike, source: T, target: T) -> int:
+    """Follows needed to get from source to target, -1 if there is no path."""
+    path = shortest_path(graph, source, target)
+    return -1 if path is None else len(path) - 1
+
+
+def is_reachable(graph: GraphLike, source: T, target: T) -> bool:
+    return shortest_path(graph, source, target) is not None
+
+
+# --- benchmark ---
+
+def _time(fn, *args) -> Any:
+    start = perf_counter()
+    result = fn(*args)
+    return result, perf_counter() - start
+
+
+def run_benchmark(n_vertices: int, avg_degree: int, queries: int, seed: int) -> None:
+    print(f"Building random graph: V={n_vertices:,}, {avg_degree} follows each ...")
+    csr, secs = _time(random_csr, n_vertices, avg_degree, seed)
+    print(f"  CSR build          {secs:8.2f} s   E={csr.num_edges:,}")
+    _, secs = _time(csr.transpose)
+    print(f"  transpose          {secs:8.2f} s")
+
+    rnd = random.Random(seed + 1)
+    order, secs = _time(bfs_ids, csr, 0)
+    print(f"  full BFS           {secs:8.2f} s   reached {len(order):,} ({len(order) / secs:,.0f} vertices/s)")
+    order, secs = _time(dfs_ids, csr, 0)
+    print(f"  full DFS           {secs:8.2f} s   reached {len(order):,}")
+    hops, secs = _time(k_hop_ids, csr, 0, 2)
+    print(f"  2-hop from 0       {secs * 1e3:8.2f} ms  {len(hops):,} vertices")
+
+    pairs = [(rnd.randrange(n_vertices), rnd.randrange(n_vertices)) for _ in range(queries)]
+    uni = bi = 0.0
+    for s, t in pairs:
+        a, secs = _time(bfs_path_ids, csr, s, t)
+        uni += secs
+        b, secs = _time(shortest_path_ids, csr, s, t)
+        bi += secs
+        assert (a is None) == (b is None) and (a is None or len(a) == len(b))
+    print(f"  shortest path x{queries}: one-directional {uni / queries * 1e3:8.2f} ms/query, "
+          f"bidirectional {bi / queries * 1e3:8.2f} ms/query ({uni / bi:.1f}x)")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark follow-graph traversals on a synthetic graph.")
+    parser.add_argument("-n", "--vertices", type=int, default=1_000_000)
+    parser.add_argument("-d", "--degree", type=int, default=5, help="follows per vertex")
+    parser.add_argument("-q", "--queries", type=int, default=20, help="random shortest-path queries")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    run_benchmark(args.vertices, args.degree, args.queries, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
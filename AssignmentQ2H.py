@@ -0,0 +1,220 @@
+# "who to follow" recommendations from friends-of-friends (Q2 social graph)
+import argparse
+import heapq
+import math
+import random
+import sys
+from itertools import islice
+from time import perf_counter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from AssignmentQ2E import DirectedGraph, Person, create_sample_graph
+
+SCORING = ("adamic_adar", "mutual", "overlap")
+
+
+class Recommendation(NamedTuple):
+    person: Person
+    score: float
+    # how many accounts the user follows that follow this person
+    mutual: int
+    # how many of the user's followers also follow this person
+    overlap: int
+
+
+class Recommender:
+    """Top-k accounts a user does not follow yet, scored from the 2-hop neighbourhood.
+
+    Candidates come from the accounts the user follows (mutual count, and
+    Adamic-Adar: each of those contributes 1/log(its own follow count), so a
+    selective follower counts for more than one who follows everyone) and from the
+    user's followers (overlap: "people who follow you also follow ...").
+
+    Private accounts are never suggested and their follow lists are not used as
+    evidence, unless include_private is set. To stay cheap around high-degree
+    accounts at most max_intermediates neighbours are expanded (most selective
+    first) and each contributes at most max_fanout candidates, so no full 2-hop set
+    is built. Results are cached per user; the graph's edge listener drops exactly
+    the users an addEdge/removeEdge can affect.
+    """
+
+    def __init__(self, graph: DirectedGraph[Person], k: int = 10, scoring: str = "adamic_adar",
+                 max_intermediates: int = 200, max_fanout: int = 500, include_private: bool = False):
+        if scoring not in SCORING:
+            raise ValueError(f"scoring must be one of {SCORING}")
+        self.graph = graph
+        self.k = k
+        self.scoring = scoring
+        self.max_intermediates = max_intermediates
+        self.max_fanout = max_fanout
+        self.include_private = include_private
+        # user -> (k the entry was computed for, its recommendations); the list may be
+        # shorter than k when the user has fewer candidates, and is still complete
+        self._cache: Dict[Person, Tuple[int, List[Recommendation]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        graph.add_listener(self._on_edge)
+
+    def detach(self) -> None:
+        self.graph.remove_listener(self._on_edge)
+
+    # --- cache invalidation ---
+    def _on_edge(self, src: Person, dst: Person, added: bool) -> None:
+        # src's follow list changed: that touches src's own candidates and exclusions,
+        # everyone who reaches candidates through src (its followers), and everyone
+        # whose followers include src (the accounts src follows, plus dst)
+        affected: Set[Person] = {src, dst}
+        affected.update(self.graph._radj.get(src, ()))
+        affected.update(self.graph._adj.get(src, ()))
+        for person in affected:
+            if self._cache.pop(person, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    # --- scoring ---
+    def _visible(self, person: Person) -> bool:
+        return self.include_private or person.privacy == "public"
+
+    def _expand(self, neighbours: Iterable[Person], adj: Dict[Person, Set[Person]]) -> List[Person]:
+        # usable intermediates, most selective (fewest follows) first, capped
+        usable = [p for p in neighbours if self._visible(p)]
+        if len(usable) > self.max_intermediates:
+            usable = heapq.nsmallest(self.max_intermediates, usable, key=lambda p: len(adj[p]))
+        return usable
+
+    def compute(self, user: Person, k: Optional[int] = None) -> List[Recommendation]:
+        """Score candidates for user without touching the cache."""
+        k = self.k if k is None else k
+        adj = self.graph._adj
+        radj = self.graph._radj
+        following = adj.get(user)
+        if following is None:
+            return []
+        fanout = self.max_fanout
+        mutual: Dict[Person, int] = {}
+        adamic: Dict[Person, float] = {}
+        overlap: Dict[Person, int] = {}
+        for z in self._expand(following, adj):
+            followed = adj[z]
+            if not followed:
+                continue
+            weight = 1.0 / math.log(len(followed) + 1)
+            # set iteration order is hash order, so the cap keeps an arbitrary slice, not the "first" accounts
+            for c in islice(followed, fanout):
+                mutual[c] = mutual.get(c, 0) + 1
+                adamic[c] = adamic.get(c, 0.0) + weight
+        for f in self._expand(radj.get(user, ()), adj):
+            for c in islice(adj[f], fanout):
+                overlap[c] = overlap.get(c, 0) + 1
+
+        def eligible(c: Person) -> bool:
+            return c != user and c not in following and self._visible(c)
+
+        if self.scoring == "adamic_adar":
+            scores = {c: s for c, s in adamic.items() if eligible(c)}
+        elif self.scoring == "mutual":
+            scores = {c: float(n) for c, n in mutual.items() if eligible(c)}
+        else:
+            scores = {c: float(n) for c, n in overlap.items() if eligible(c)}
+        # heap top-k; ties broken by user_id so results are stable
+        best = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0].user_id))
+        return [Recommendation(c, s, mutual.get(c, 0), overlap.get(c, 0)) for c, s in best]
+
+    def recommend(self, user: Person, k: Optional[int] = None) -> List[Recommendation]:
+        k = self.k if k is None else k
+        cached = self._cache.get(user)
+        if cached is not None and cached[0] >= k:
+            self.hits += 1
+            return cached[1][:k]
+        self.misses += 1
+        k_used = max(k, self.k)
+        result = self.compute(user, k_used)
+        self._cache[user] = (k_used, result)
+        return result[:k]
+
+    def precompute(self, users: Optional[Iterable[Person]] = None) -> int:
+        """Fill the cache for users (default: every vertex); returns how many were computed."""
+        done = 0
+        for user in (self.graph.vertices() if users is None else users):
+            if user not in self._cache:
+                self._cache[user] = (self.k, self.compute(user))
+                done += 1
+        return done
+
+    def stats(self) -> dict:
+        return {
+            "cached_users": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+def random_social_graph(n_users: int, avg_follows: int, seed: int = 42) -> DirectedGraph[Person]:
+    # preferential attachment-ish: later follows favour already popular accounts, giving hubs
+    rnd = random.Random(seed)
+    graph: DirectedGraph[Person] = DirectedGraph()
+    people = [Person(f"u{i:07d}", f"User {i}", "", "", "private" if rnd.random() < 0.2 else "public")
+              for i in range(n_users)]
+    for p in people:
+        graph.addVertex(p)
+    popular: List[Person] = []
+    for p in people:
+        for _ in range(avg_follows):
+            if popular and rnd.random() < 0.5:
+                q = popular[rnd.randrange(len(popular))]
+            else:
+                q = people[rnd.randrange(n_users)]
+            if q is not p:
+                graph.addEdge(p, q)
+                popular.append(q)
+    return graph
+
+
+def run_benchmark(n_users: int, avg_follows: int, seed: int) -> None:
+    graph = random_social_graph(n_users, avg_follows, seed)
+    hub = max(graph.vertices(), key=graph.in_degree)
+    print(f"Graph: {n_users:,} users, {avg_follows} follows each; biggest hub has {graph.in_degree(hub):,} followers")
+    rec = Recommender(graph)
+    start = perf_counter()
+    done = rec.precompute()
+    secs = perf_counter() - start
+    print(f"  precompute all users   {secs:8.2f} s  ({done / secs:,.0f} users/s)")
+    users = graph.vertices()[:1000]
+    start = perf_counter()
+    for u in users:
+        rec.recommend(u)
+    print(f"  cached recommend       {(perf_counter() - start) / len(users) * 1e6:8.2f} us/user")
+    # one follow change only drops the users it can affect
+    follower = next(u for u in users if u is not hub and hub not in graph._adj[u])
+    graph.addEdge(follower, hub)
+    print(f"  after one addEdge:     {rec.stats()}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Who-to-follow recommendations demo and benchmark.")
+    parser.add_argument("--bench", action="store_true", help="run the synthetic benchmark instead of the demo")
+    parser.add_argument("-n", "--users", type=int, default=100_000)
+    parser.add_argument("-d", "--follows", type=int, default=10, help="follows per user")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.bench:
+        run_benchmark(args.users, args.follows, args.seed)
+        return 0
+    graph, people = create_sample_graph()
+    rec = Recommender(graph, k=3, include_private=False)
+    for p in people:
+        suggestions = ", ".join(f"{r.person.name} ({r.score:.2f})" for r in rec.recommend(p)) or "(none)"
+        print(f"{p.name:<8} -> {suggestions}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+# influence scores over the follow graph: PageRank, HITS, degree centrality (Q2 social graph)
+import argparse
+import random
+import sys
+from array import array
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # the vectorized versions need numpy; the *_reference ones do not
+    np = None
+
+from AssignmentQ2E import DirectedGraph, create_sample_graph
+from AssignmentQ2F import CSRGraph, random_csr
+
+DAMPING = 0.85
+TOLERANCE = 1e-10
+MAX_ITER = 200
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("vectorized centrality needs numpy installed")
+
+
+def _edge_arrays(csr: CSRGraph) -> Tuple[Any, Any, Any]:
+    # (source of every edge, target of every edge, out-degree per vertex) as numpy arrays;
+    # the CSR buffers are shared, only the per-edge source column is new
+    offsets, targets = csr.as_numpy()
+    out_degree = np.diff(offsets)
+    sources = np.repeat(np.arange(csr.num_vertices, dtype=targets.dtype), out_degree)
+    return sources, targets, out_degree
+
+
+# --- degree centrality ---
+
+def degree_centrality(csr: CSRGraph) -> Tuple[Any, Any]:
+    """(in, out) degree per vertex id, divided by V - 1 so 1.0 means follows/followed by everyone."""
+    _require_numpy()
+    n = csr.num_vertices
+    offsets, targets = csr.as_numpy()
+    scale = 1.0 / (n - 1) if n > 1 else 0.0
+    return np.bincount(targets, minlength=n) * scale, np.diff(offsets) * scale
+
+
+# --- PageRank ---
+
+def pagerank(csr: CSRGraph, damping: float = DAMPING, tol: float = TOLERANCE, max_iter: int = MAX_ITER,
+             init: Optional[Any] = None) -> Tuple[Any, int]:
+    """PageRank per vertex id by power iteration; returns (scores, iterations used).
+
+    Each iteration is a handful of whole-array operations: every edge carries
+    rank/out_degree of its source and np.bincount sums them per target. Accounts
+    that follow nobody spread their rank evenly. Stops once the L1 change drops
+    under tol. Passing the previous scores as init (a warm start) after a small
+    edit to the graph usually converges in a fraction of the iterations.
+    """
+    _require_numpy()
+    n = csr.num_vertices
+    if n == 0:
+        return np.zeros(0), 0
+    sources, targets, out_degree = _edge_arrays(csr)
+    dangling = out_degree == 0
+    inv_degree = np.zeros(n)
+    np.divide(1.0, out_degree, out=inv_degree, where=~dangling)
+    rank = None
+    if init is not None:
+        rank = np.asarray(init, dtype=float).copy()
+        total = rank.sum()
+        # an all-zero start carries no information: fall back to uniform
+        rank = rank / total if total > 0 else None
+    if rank is None:
+        rank = np.full(n, 1.0 / n)
+    teleport = (1.0 - damping) / n
+    for iteration in range(1, max_iter + 1):
+        spread = rank * inv_degree
+        new = np.bincount(targets, weights=spread[sources], minlength=n)
+        new *= damping
+        new += teleport + damping * rank[dangling].sum() / n
+        delta = np.abs(new - rank).sum()
+        rank = new
+        if delta < tol:
+            return rank, iteration
+    return rank, max_iter
+
+
+def pagerank_reference(csr: CSRGraph, damping: float = DAMPING, tol: float = TOLERANCE,
+                       max_iter: int = MAX_ITER) -> Tuple[List[float], int]:
+    """Same algorithm as pagerank() in plain Python loops (the benchmark baseline)."""
+    n = csr.num_vertices
+    if n == 0:
+        return [], 0
+    offsets = csr.offsets
+    targets = csr.targets
+    rank = [1.0 / n] * n
+    teleport = (1.0 - damping) / n
+    for iteration in range(1, max_iter + 1):
+        new = [0.0] * n
+        dangling_sum = 0.0
+        for u in range(n):
+            lo, hi = offsets[u], offsets[u + 1]
+            if lo == hi:
+                dangling_sum += rank[u]
+                continue
+            share = rank[u] / (hi - lo)
+            for k in range(lo, hi):
+                new[targets[k]] += share
+        base = teleport + damping * dangling_sum / n
+        delta = 0.0
+        for v in range(n):
+            value = base + damping * new[v]
+            delta += abs(value - rank[v])
+            new[v] = value
+        rank = new
+        if delta < tol:
+            return rank, iteration
+    return rank, max_iter
+
+
+# --- HITS ---
+
+def hits(csr: CSRGraph, tol: float = TOLERANCE, max_iter: int = MAX_ITER) -> Tuple[Any, Any, int]:
+    """(hub, authority, iterations): good hubs follow good authorities, good authorities are followed by good hubs."""
+    _require_numpy()
+    n = csr.num_vertices
+    sources, targets, _ = _edge_arrays(csr)
+    hub = np.full(n, 1.0)
+    authority = np.zeros(n)
+    for iteration in range(1, max_iter + 1):
+        authority = np.bincount(targets, weights=hub[sources], minlength=n)
+        norm = authority.sum()
+        if norm:
+            authority /= norm
+        new_hub = np.bincount(sources, weights=authority[targets], minlength=n)
+        norm = new_hub.sum()
+        if norm:
+            new_hub /= norm
+        delta = np.abs(new_hub - hub).sum()
+        hub = new_hub
+        if delta < tol:
+            return hub, authority, iteration
+    return hub, authority, max_iter
+
+
+# --- vertex-level API ---
+
+class InfluenceRanker:
+    """PageRank for a DirectedGraph that warm-starts from its previous run.
+
+    Scores are remembered per vertex, so after a few follows/unfollows (or new
+    users) the next scores() call starts from the old answer instead of a uniform vector.
+    """
+
+    def __init__(self, graph: DirectedGraph, damping: float = DAMPING, tol: float = TOLERANCE):
+        self.graph = graph
+        self.damping = damping
+        self.tol = tol
+        self._version = -1
+        self._scores: Dict[Any, float] = {}
+        self.last_iterations = 0
+
+    def scores(self) -> Dict[Any, float]:
+        if self._version != self.graph.version:
+            csr = self.graph.freeze()
+            init = None
+            if csr.num_vertices == 0:
+                self._scores = {}
+                self._version = self.graph.version
+                return self._scores
+            if self._scores:
+                # vertices new since the last run start at the uniform share
+                uniform = 1.0 / csr.num_vertices
+                previous = self._scores
+                init = np.fromiter((previous.get(v, uniform) for v in csr.vertices()), dtype=float,
+                                   count=csr.num_vertices)
+            rank, self.last_iterations = pagerank(csr, self.damping, self.tol, init=init)
+            self._scores = dict(zip(csr.vertices(), rank.tolist()))
+            self._version = self.graph.version
+        return self._scores
+
+    def top(self, k: int = 10) -> List[Tuple[Any, float]]:
+        scores = self.scores()
+        return sorted(scores.items(), key=lambda item: -item[1])[:k]
+
+
+# --- benchmark ---
+
+def _perturb(csr: CSRGraph, changes: int, seed: int) -> CSRGraph:
+    # rewire `changes` random edges to random new targets
+    rnd = random.Random(seed)
+    n = csr.num_vertices
+    offsets = csr.offsets
+    sources = array(csr.targets.typecode, bytes(csr.targets.itemsize * csr.num_edges))
+    for u in range(n):
+        for k in range(offsets[u], offsets[u + 1]):
+            sources[k] = u
+    targets = array(csr.targets.typecode, csr.targets)
+    for _ in range(changes):
+        targets[rnd.randrange(len(targets))] = rnd.randrange(n)
+    return CSRGraph.from_edges(csr.vertices(), sources, targets)
+
+
+def run_benchmark(n_vertices: int, avg_degree: int, seed: int, reference: bool) -> None:
+    _require_numpy()
+    csr = random_csr(n_vertices, avg_degree, seed)
+    print(f"Graph: V={n_vertices:,}, E={csr.num_edges:,}")
+
+    start = perf_counter()
+    rank, iterations = pagerank(csr)
+    vec_secs = perf_counter() - start
+    print(f"  PageRank (numpy)       {vec_secs:8.3f} s  {iterations} iterations")
+    if reference:
+        start = perf_counter()
+        ref, ref_iterations = pagerank_reference(csr)
+        ref_secs = perf_counter() - start
+        print(f"  PageRank (pure Python) {ref_secs:8.3f} s  {ref_iterations} iterations  "
+              f"-> {ref_secs / vec_secs:.0f}x slower, max |diff| {np.abs(rank - np.array(ref)).max():.1e}")
+
+    changed = _perturb(csr, max(1, csr.num_edges // 1000), seed + 1)
+    start = perf_counter()
+    _, cold = pagerank(changed)
+    cold_secs = perf_counter() - start
+    start = perf_counter()
+    _, warm = pagerank(changed, init=rank)
+    warm_secs = perf_counter() - start
+    print(f"  after rewiring 0.1% of edges: cold {cold} iterations ({cold_secs:.3f} s), "
+          f"warm start {warm} iterations ({warm_secs:.3f} s)")
+
+    start = perf_counter()
+    _, _, hits_iterations = hits(csr)
+    print(f"  HITS (numpy)           {perf_counter() - start:8.3f} s  {hits_iterations} iterations")
+    start = perf_counter()
+    degree_centrality(csr)
+    print(f"  degree centrality      {perf_counter() - start:8.3f} s")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Influence ranking demo and benchmark.")
+    parser.add_argument("--bench", action="store_true", help="run the synthetic benchmark instead of the demo")
+    parser.add_argument("-n", "--vertices", type=int, default=200_000)
+    parser.add_argument("-d", "--degree", type=int, default=10, help="follows per vertex")
+    parser.add_argument("--no-reference", action="store_true", help="skip the slow pure-Python PageRank")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.bench:
+        run_benchmark(args.vertices, args.degree, args.seed, not args.no_reference)
+        return 0
+    graph, people = create_sample_graph()
+    ranker = InfluenceRanker(graph)
+    print("Most influential (PageRank):")
+    for person, score in ranker.top(5):
+        print(f"  {person.name:<8} {score:.4f}")
+    graph.addEdge(people[6], people[0])
+    ranker.scores()
+    print(f"\nAfter George follows Alice, warm-started re-rank took {ranker.last_iterations} iterations:")
+    for person, score in ranker.top(5):
+        print(f"  {person.name:<8} {score:.4f}")
+    csr = graph.freeze()
+    hub, authority, _ = hits(csr)
+    print("\nTop hub:", csr.vertex(int(hub.argmax())).name, " top authority:", csr.vertex(int(authority.argmax())).name)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
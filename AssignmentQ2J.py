@@ -0,0 +1,257 @@
+# streaming loader for follow graphs: edge-list files and JSONL profiles (Q2 social graph)
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+from array import array
+from itertools import islice
+from time import perf_counter
+from typing import Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from AssignmentQ2E import Person, SocialGraph
+from AssignmentQ2F import CSRGraph
+
+# rows parsed per chunk; ids are interned and appended to the edge arrays one chunk at a time
+CHUNK_SIZE = 100_000
+# a first row made of these names is a header, not an edge
+HEADER_NAMES = {"src", "dst", "source", "target", "from", "to", "follower", "followee", "user_id", "follows"}
+
+
+class LoadStats(NamedTuple):
+    lines: int
+    edges_read: int
+    edges: int
+    vertices: int
+    skipped: int
+    seconds: float
+    # users indexed by user_id only because another profile already has their name
+    duplicate_names: int = 0
+
+    @property
+    def edges_per_sec(self) -> float:
+        return self.edges_read / self.seconds if self.seconds else 0.0
+
+
+class IdInterner:
+    """user_id string -> dense vertex id, handed out in first-seen order."""
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def intern(self, user_id: str) -> int:
+        i = self.ids.get(user_id)
+        if i is None:
+            i = self.ids[user_id] = len(self.names)
+            self.names.append(user_id)
+        return i
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def _delimiter_for(path: str) -> str:
+    return "\t" if path.endswith((".tsv", ".tab", ".txt")) else ","
+
+
+def _rows(stream: TextIO, delimiter: str) -> Iterator[List[str]]:
+    # '#' comment lines (SNAP-style edge lists) and blank lines are skipped
+    for row in csv.reader(stream, delimiter=delimiter):
+        if row and not row[0].startswith("#"):
+            yield row
+
+
+def read_edges(stream: TextIO, interner: IdInterner, delimiter: str = ",",
+               chunk_size: int = CHUNK_SIZE) -> Tuple[array, array, int, int]:
+    """Stream (follower, followee) rows into two id arrays; returns (sources, targets, lines, skipped).
+
+    Only the two flat arrays and the id table grow with the file, never a Python
+    object per edge; a first row of column names is recognised and ignored.
+    """
+    sources = array("q")
+    targets = array("q")
+    lines = skipped = 0
+    intern = interner.intern
+    rows = _rows(stream, delimiter)
+    first = True
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        lines += len(chunk)
+        if first:
+            first = False
+            if {c.strip().lower() for c in chunk[0][:2]} <= HEADER_NAMES:
+                chunk = chunk[1:]
+                skipped += 1
+        src_ids = []
+        dst_ids = []
+        for row in chunk:
+            if len(row) < 2:
+                skipped += 1
+                continue
+            src_ids.append(intern(row[0].strip()))
+            dst_ids.append(intern(row[1].strip()))
+        sources.extend(src_ids)
+        targets.extend(dst_ids)
+    return sources, targets, lines, skipped
+
+
+def read_profiles(stream: TextIO) -> Tuple[Dict[str, Person], int]:
+    """JSONL user profiles -> {user_id: Person}; returns (profiles, skipped lines)."""
+    profiles: Dict[str, Person] = {}
+    skipped = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+            person = Person(str(record["user_id"]), record.get("name", str(record["user_id"])),
+                            record.get("gender", ""), record.get("bio", ""), record.get("privacy", "public"))
+        except (ValueError, KeyError, TypeError):
+            skipped += 1
+            continue
+        profiles[person.user_id] = person
+    return profiles, skipped
+
+
+def _vertices(interner: IdInterner, profiles: Optional[Dict[str, Person]]) -> list:
+    # plain user_id strings without a profile file; Person objects with one
+    # (an id that only appears in the edge list gets a minimal placeholder profile)
+    if profiles is None:
+        return interner.names
+    return [profiles.get(uid) or Person(uid, uid) for uid in interner.names]
+
+
+def load_csr(edges_path: str, profiles_path: Optional[str] = None, delimiter: Optional[str] = None,
+             chunk_size: int = CHUNK_SIZE) -> Tuple[CSRGraph, LoadStats]:
+    """Load a (possibly huge) edge list straight into a deduplicated CSRGraph."""
+    start = perf_counter()
+    interner = IdInterner()
+    profiles = None
+    skipped = 0
+    if profiles_path:
+        with open(profiles_path, encoding="utf-8") as f:
+            profiles, skipped = read_profiles(f)
+        # profiled users keep their file order as vertex ids, even without edges
+        for uid in profiles:
+            interner.intern(uid)
+    with open(edges_path, newline="", encoding="utf-8") as f:
+        sources, targets, lines, bad = read_edges(f, interner, delimiter or _delimiter_for(edges_path), chunk_size)
+    graph = CSRGraph.from_edges(_vertices(interner, profiles), sources, targets, dedup=True)
+    stats = LoadStats(lines, len(sources), graph.num_edges, graph.num_vertices, skipped + bad,
+                      perf_counter() - start)
+    return graph, stats
+
+
+def load_social_graph(edges_path: str, profiles_path: Optional[str] = None,
+                      delimiter: Optional[str] = None) -> Tuple[SocialGraph, LoadStats]:
+    """Same input as load_csr, but into the mutable SocialGraph the menu uses.
+
+    Display names are not unique in real data: a user whose name is already
+    taken is still loaded, findable by user_id, and counted in
+    stats.duplicate_names instead of aborting the load.
+    """
+    csr, stats = load_csr(edges_path, profiles_path, delimiter)
+    graph = SocialGraph()
+    people = [v if isinstance(v, Person) else Person(v, v) for v in csr.vertices()]
+    # rows are already deduplicated and id-sorted, so fill the adjacency sets directly
+    adj = graph._adj
+    radj = graph._radj
+    duplicates = 0
+    for p in people:
+        if not graph.users.add(p, unique_name=False):
+            duplicates += 1
+        p.store_bio()
+        adj[p] = set()
+        radj[p] = set()
+    for i, p in enumerate(people):
+        followed = [people[j] for j in csr.neighbors(i)]
+        adj[p].update(followed)
+        for q in followed:
+            radj[q].add(p)
+    graph.version += 1
+    return graph, stats._replace(duplicate_names=duplicates)
+
+
+# --- synthetic input for the benchmark ---
+
+def write_random_edge_list(path: str, n_users: int, avg_follows: int, seed: int = 42,
+                           duplicate_rate: float = 0.05) -> int:
+    rnd = random.Random(seed)
+    written = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        f.write("follower\tfollowee\n")
+        for u in range(n_users):
+            follows = [rnd.randrange(n_users) for _ in range(avg_follows)]
+            # some repeated rows, like a log of follow events would have
+            follows += [v for v in follows if rnd.random() < duplicate_rate]
+            f.write("".join(f"user{u}\tuser{v}\n" for v in follows))
+            written += len(follows)
+    return written
+
+
+def print_stats(stats: LoadStats, out: TextIO = sys.stdout) -> None:
+    print(f"  lines read     {stats.lines:>14,}", file=out)
+    print(f"  edges read     {stats.edges_read:>14,}", file=out)
+    print(f"  unique edges   {stats.edges:>14,}", file=out)
+    print(f"  vertices       {stats.vertices:>14,}", file=out)
+    print(f"  skipped lines  {stats.skipped:>14,}", file=out)
+    if stats.duplicate_names:
+        print(f"  duplicate names{stats.duplicate_names:>14,}  (findable by user_id only)", file=out)
+    print(f"  time           {stats.seconds:>14.2f} s  ({stats.edges_per_sec:,.0f} edges/s)", file=out)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load a follow graph from an edge list (and JSONL profiles).")
+    parser.add_argument("edges", nargs="?", help="CSV/TSV edge list: follower,followee per line")
+    parser.add_argument("--profiles", help="JSONL file with one user profile per line")
+    parser.add_argument("--delimiter", help="field separator (default: tab for .tsv/.txt, else comma)")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="rows parsed per chunk")
+    parser.add_argument("--generate", type=int, metavar="N",
+                        help="write a random N-user edge list to a temp file and load that")
+    parser.add_argument("--degree", type=int, default=10, help="follows per user for --generate")
+    args = parser.parse_args(argv)
+    if not args.edges and not args.generate:
+        parser.error("give an edge list file or --generate N")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    path = args.edges
+    tmp = None
+    if args.generate:
+        fd, tmp = tempfile.mkstemp(suffix=".tsv")
+        os.close(fd)
+        start = perf_counter()
+        rows = write_random_edge_list(tmp, args.generate, args.degree)
+        print(f"Generated {rows:,} rows in {perf_counter() - start:.1f} s ({os.path.getsize(tmp) / 2 ** 20:.0f} MiB)")
+        path = tmp
+    try:
+        graph, stats = load_csr(path, args.profiles, args.delimiter, args.chunk)
+    finally:
+        if tmp:
+            os.remove(tmp)
+    print(f"Loaded {path}:")
+    print_stats(stats)
+    peak = _peak_rss_mb()
+    if peak is not None:
+        print(f"  peak RSS       {peak:>14,.0f} MiB  (CSR itself {graph.nbytes() / 2 ** 20:,.0f} MiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
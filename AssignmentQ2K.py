@@ -0,0 +1,472 @@
+# binary follow-graph snapshot, queried in place through mmap (Q2 social graph)
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Set as AbstractSet
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from AssignmentQ2E import DirectedGraph, Person, SocialGraph, create_sample_graph, normalize_name
+from AssignmentQ2F import CSRGraph
+
+# snapshot layout (little-endian, every section starts on an 8-byte boundary):
+#   header      magic, V, E, target width (4 or 8), then the offset of each section below
+#   out_offsets (V + 1) int64   CSR of who each vertex follows
+#   out_targets E int32/int64
+#   in_offsets  (V + 1) int64   CSR of each vertex's followers (the transpose)
+#   in_targets  E int32/int64
+#   people      V fixed-width records: user_id/name/gender/bio offsets into the
+#               string table, their lengths, privacy code
+#   by_id       V int32/int64   vertex ids sorted by user_id bytes, for lookups
+#   by_name     V int32/int64   vertex ids sorted by normalized name (ties by id), for
+#               name lookups and prefix search
+#   strings     utf-8 bytes; each distinct gender is written once and shared
+GRAPH_MAGIC = b"BBGRF02\0"
+_HEADER = struct.Struct("<8sQQQQQQQQQQQ")
+_PERSON = struct.Struct("<QQQQIIIIB7x")
+PRIVACY_CODES = ("public", "private")
+
+
+def _align(buf: bytearray) -> None:
+    buf.extend(bytes(-len(buf) % 8))
+
+
+def _as_person(v) -> Person:
+    # vertices loaded without profiles are bare user_id strings; checked by attribute
+    # because the menu's Person may be __main__.Person rather than AssignmentQ2E.Person
+    return v if hasattr(v, "user_id") else Person(str(v), str(v))
+
+
+def _write_file(path: str, *parts: bytes) -> None:
+    # written next to path and renamed over it, so a crash never leaves half a snapshot
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        for part in parts:
+            f.write(part)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def save_graph(path: str, graph: DirectedGraph) -> Tuple[int, int]:
+    """Write graph (vertices + follows) to path atomically. Returns (vertices, edges)."""
+    if isinstance(graph, GraphSnapshot):
+        # already in this format: copy the mapped bytes as they are
+        _write_file(path, graph._buf)
+        return graph.num_vertices, graph.num_edges
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    rev = csr.transpose()
+    people = [_as_person(v) for v in csr.vertices()]
+    n = len(people)
+    wide = csr.targets.typecode != "i"
+
+    strings = bytearray()
+    shared: Dict[str, Tuple[int, int]] = {}
+
+    def add_string(text: str, share: bool = False) -> Tuple[int, int]:
+        if share and text in shared:
+            return shared[text]
+        data = text.encode("utf-8")
+        ref = (len(strings), len(data))
+        strings.extend(data)
+        if share:
+            shared[text] = ref
+        return ref
+
+    records = bytearray(_PERSON.size * n)
+    for i, p in enumerate(people):
+        id_off, id_len = add_string(p.user_id)
+        name_off, name_len = add_string(p.name)
+        gender_off, gender_len = add_string(p.gender, share=True)
+        bio_off, bio_len = add_string(p.bio)
+        _PERSON.pack_into(records, i * _PERSON.size, id_off, name_off, gender_off, bio_off,
+                          id_len, name_len, gender_len, bio_len, PRIVACY_CODES.index(p.privacy))
+    id_keys = [p.user_id.encode("utf-8") for p in people]
+    by_id = array("q" if wide else "i", sorted(range(n), key=id_keys.__getitem__))
+    # a stable sort, so among equal names the first vertex saved comes first
+    name_keys = [normalize_name(p.name) for p in people]
+    by_name = array("q" if wide else "i", sorted(range(n), key=name_keys.__getitem__))
+
+    body = bytearray()
+    sections = []
+    for part in (csr.offsets, csr.targets, rev.offsets, rev.targets, records, by_id, by_name, strings):
+        _align(body)
+        sections.append(_HEADER.size + len(body))
+        body.extend(part if isinstance(part, bytearray) else part.tobytes())
+    _write_file(path, _HEADER.pack(GRAPH_MAGIC, n, csr.num_edges, 8 if wide else 4, *sections), body)
+    return n, csr.num_edges
+
+
+class GraphSnapshot:
+    """Read-only follow graph served straight from a mapped snapshot file.
+
+    Opening only reads the header: the CSR arrays are memoryviews cast over the
+    mapping, so neighbour/follower queries touch just the pages they need and no
+    Python set is ever built. Person objects are decoded one at a time on request.
+
+    It answers the read-only side of SocialGraph as well: users (lookups by
+    user_id or name, prefix search), the traversals in AssignmentQ2G through
+    freeze(), and the Recommender through read-only _adj/_radj views. Call
+    to_social_graph() for a copy that can be edited.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._map)
+        fields = _HEADER.unpack_from(self._buf, 0)
+        if fields[0] != GRAPH_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a graph snapshot")
+        _, n, m, width, out_off, out_tgt, in_off, in_tgt, people, by_id, by_name, strings = fields
+        fmt = "q" if width == 8 else "i"
+        self.num_vertices = n
+        self.num_edges = m
+        self.out_offsets = self._view(out_off, n + 1, "q")
+        self.out_targets = self._view(out_tgt, m, fmt)
+        self.in_offsets = self._view(in_off, n + 1, "q")
+        self.in_targets = self._view(in_tgt, m, fmt)
+        self.by_id = self._view(by_id, n, fmt)
+        self.by_name = self._view(by_name, n, fmt)
+        self._people = people
+        self._strings = strings
+        self.users = SnapshotUsers(self)
+
+    def _view(self, offset: int, count: int, fmt: str) -> memoryview:
+        size = struct.calcsize(fmt)
+        return self._buf[offset:offset + count * size].cast(fmt)
+
+    # --- people ---
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings + offset
+        return str(self._buf[start:start + length], "utf-8")
+
+    def user_id(self, i: int) -> str:
+        id_off, _, _, _, id_len, _, _, _, _ = _PERSON.unpack_from(self._buf, self._people + i * _PERSON.size)
+        return self._string(id_off, id_len)
+
+    def name_key(self, i: int) -> str:
+        # the normalized name by_name is sorted on
+        _, name_off, _, _, _, name_len, _, _, _ = _PERSON.unpack_from(self._buf, self._people + i * _PERSON.size)
+        return normalize_name(self._string(name_off, name_len))
+
+    def person(self, i: int, with_bio: bool = False) -> Person:
+        # bios stay in the file unless asked for, so a neighbour listing decodes none;
+        # with_bio gives the Person its bio as pending text, stored only if it joins a graph
+        id_off, name_off, gender_off, bio_off, id_len, name_len, gender_len, bio_len, privacy = _PERSON.unpack_from(
+            self._buf, self._people + i * _PERSON.size)
+        return Person(self._string(id_off, id_len), self._string(name_off, name_len),
+                      self._string(gender_off, gender_len), self._string(bio_off, bio_len) if with_bio else "",
+                      PRIVACY_CODES[privacy])
+
+    def bio(self, i: int) -> str:
+        _, _, _, bio_off, _, _, _, bio_len, _ = _PERSON.unpack_from(self._buf, self._people + i * _PERSON.size)
+        return self._string(bio_off, bio_len)
+
+    def index_of(self, v) -> int:
+        """Vertex id for a Person or user_id (binary search over the sorted id table), or -1."""
+        user_id = getattr(v, "user_id", v)
+        by_id = self.by_id
+        lo, hi = 0, self.num_vertices
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.user_id(by_id[mid]) < user_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.num_vertices and self.user_id(by_id[lo]) == user_id:
+            return by_id[lo]
+        return -1
+
+    # --- adjacency on vertex ids ---
+    def neighbors(self, i: int) -> memoryview:
+        return self.out_targets[self.out_offsets[i]:self.out_offsets[i + 1]]
+
+    def followers(self, i: int) -> memoryview:
+        return self.in_targets[self.in_offsets[i]:self.in_offsets[i + 1]]
+
+    def has_edge_ids(self, i: int, j: int) -> bool:
+        lo, hi = self.out_offsets[i], self.out_offsets[i + 1]
+        k = bisect_left(self.out_targets, j, lo, hi)
+        return k < hi and self.out_targets[k] == j
+
+    # --- same lookups as DirectedGraph, keyed by Person (or user_id) ---
+    def hasVertex(self, v) -> bool:
+        return self.index_of(v) >= 0
+
+    def listOutgoingAdjacentVertex(self, v) -> List[Person]:
+        i = self.index_of(v)
+        return [] if i < 0 else [self.person(j) for j in self.neighbors(i)]
+
+    def listIncomingAdjacentVertex(self, v) -> List[Person]:
+        i = self.index_of(v)
+        return [] if i < 0 else [self.person(j) for j in self.followers(i)]
+
+    def out_degree(self, v) -> int:
+        i = self.index_of(v)
+        return 0 if i < 0 else self.out_offsets[i + 1] - self.out_offsets[i]
+
+    def in_degree(self, v) -> int:
+        i = self.index_of(v)
+        return 0 if i < 0 else self.in_offsets[i + 1] - self.in_offsets[i]
+
+    def vertices(self) -> Iterator[Person]:
+        for i in range(self.num_vertices):
+            yield self.person(i)
+
+    def __len__(self) -> int:
+        return self.num_vertices
+
+    def __str__(self) -> str:
+        return "\n".join(f"{self.person(i)} -> {[str(self.person(j)) for j in self.neighbors(i)]}"
+                         for i in range(self.num_vertices))
+
+    # a snapshot never changes, so edge listeners (the Recommender's cache) are never called
+    def add_listener(self, listener) -> None:
+        pass
+
+    def remove_listener(self, listener) -> None:
+        pass
+
+    @property
+    def _adj(self) -> "_Rows":
+        # read-only stand-ins for DirectedGraph._adj / _radj
+        return _Rows(self, self.out_offsets, self.out_targets)
+
+    @property
+    def _radj(self) -> "_Rows":
+        return _Rows(self, self.in_offsets, self.in_targets)
+
+    # --- same id-level shape as CSRGraph, for the traversals in AssignmentQ2G ---
+    @property
+    def offsets(self) -> memoryview:
+        return self.out_offsets
+
+    @property
+    def targets(self) -> memoryview:
+        return self.out_targets
+
+    def vertex(self, i: int) -> Person:
+        return self.person(i)
+
+    def freeze(self) -> "GraphSnapshot":
+        # already a read-only compact graph
+        return self
+
+    def transpose(self) -> "_Transposed":
+        return _Transposed(self)
+
+    # --- materializing ---
+    def to_social_graph(self) -> SocialGraph:
+        """Rebuild the mutable SocialGraph (e.g. to edit it in the menu)."""
+        graph = SocialGraph()
+        people = [self.person(i, with_bio=True) for i in range(self.num_vertices)]
+        # rows are already deduplicated, so fill the adjacency sets directly; a name saved
+        # twice is registered by user_id only, as load_social_graph does
+        adj = graph._adj
+        radj = graph._radj
+        for p in people:
+            graph.users.add(p, unique_name=False)
+            p.store_bio()
+            adj[p] = set()
+            radj[p] = set()
+        for i, p in enumerate(people):
+            adj[p].update(people[j] for j in self.neighbors(i))
+            radj[p].update(people[j] for j in self.followers(i))
+        graph.version += 1
+        return graph
+
+    def close(self) -> None:
+        # the cast views hold exports of the mapping, so release them before closing it
+        for view in (self.out_offsets, self.out_targets, self.in_offsets, self.in_targets, self.by_id,
+                     self.by_name):
+            view.release()
+        self._buf.release()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "GraphSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _Row(AbstractSet):
+    # one vertex's follows (or followers): sized and searched on the ids in the
+    # mapping, decoded into Person objects only while iterated
+    __slots__ = ("_snap", "_targets", "_lo", "_hi")
+
+    def __init__(self, snap: GraphSnapshot, targets: memoryview, lo: int, hi: int):
+        self._snap = snap
+        self._targets = targets
+        self._lo = lo
+        self._hi = hi
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def __iter__(self) -> Iterator[Person]:
+        person = self._snap.person
+        for j in self._targets[self._lo:self._hi]:
+            yield person(j)
+
+    def __contains__(self, v: object) -> bool:
+        # rows are sorted by id
+        j = self._snap.index_of(v)
+        if j < 0:
+            return False
+        k = bisect_left(self._targets, j, self._lo, self._hi)
+        return k < self._hi and self._targets[k] == j
+
+
+class _Rows(Mapping):
+    # Person -> _Row over one direction of the snapshot's CSR
+    def __init__(self, snap: GraphSnapshot, offsets: memoryview, targets: memoryview):
+        self._snap = snap
+        self._offsets = offsets
+        self._targets = targets
+
+    def __getitem__(self, v) -> _Row:
+        i = self._snap.index_of(v)
+        if i < 0:
+            raise KeyError(v)
+        return _Row(self._snap, self._targets, self._offsets[i], self._offsets[i + 1])
+
+    def __iter__(self) -> Iterator[Person]:
+        return self._snap.vertices()
+
+    def __len__(self) -> int:
+        return self._snap.num_vertices
+
+
+class _Transposed:
+    # a snapshot's follower arrays in the shape of CSRGraph.transpose()
+    def __init__(self, snap: GraphSnapshot):
+        self.offsets = snap.in_offsets
+        self.targets = snap.in_targets
+        self.num_vertices = snap.num_vertices
+        self._snap = snap
+
+    def transpose(self) -> GraphSnapshot:
+        return self._snap
+
+
+class SnapshotUsers:
+    """UserRegistry's lookups, answered from a snapshot's sorted id and name tables.
+
+    Every lookup is a binary search that decodes O(log V) records, so nothing is
+    indexed in memory. As in UserRegistry a name belongs to the first user saved
+    with it; later users with the same name are found by user_id only.
+    """
+
+    def __init__(self, snap: GraphSnapshot):
+        self._snap = snap
+
+    def _name_position(self, key: str) -> int:
+        # first position in by_name whose name is >= key
+        snap = self._snap
+        by_name = snap.by_name
+        lo, hi = 0, snap.num_vertices
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if snap.name_key(by_name[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def get(self, user_id: str) -> Optional[Person]:
+        i = self._snap.index_of(user_id)
+        return None if i < 0 else self._snap.person(i, with_bio=True)
+
+    def by_name(self, name: str) -> Optional[Person]:
+        snap = self._snap
+        key = normalize_name(name)
+        k = self._name_position(key)
+        if k < snap.num_vertices and snap.name_key(snap.by_name[k]) == key:
+            return snap.person(snap.by_name[k], with_bio=True)
+        return None
+
+    def find(self, query: str) -> Optional[Person]:
+        # a user_id or a name, like UserRegistry.find
+        query = query.strip()
+        return self.get(query) or self.by_name(query)
+
+    def has_id(self, user_id: str) -> bool:
+        return self._snap.index_of(user_id) >= 0
+
+    def has_name(self, name: str) -> bool:
+        return self.by_name(name) is not None
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> List[Person]:
+        """Up to limit people whose name starts with prefix, in name order."""
+        snap = self._snap
+        key = normalize_name(prefix)
+        found: List[Person] = []
+        previous = None
+        for k in range(self._name_position(key), snap.num_vertices):
+            if len(found) >= limit:
+                break
+            i = snap.by_name[k]
+            name = snap.name_key(i)
+            if not name.startswith(key):
+                break
+            # only the first holder of a name, as in the registry's trie
+            if name != previous:
+                found.append(snap.person(i))
+                previous = name
+        return found
+
+    def __contains__(self, person: object) -> bool:
+        return hasattr(person, "user_id") and self._snap.index_of(person) >= 0
+
+    def __iter__(self) -> Iterator[Person]:
+        # vertex order, the order the users were registered in when saved
+        return self._snap.vertices()
+
+    def __len__(self) -> int:
+        return self._snap.num_vertices
+
+
+def load_graph(path: str) -> SocialGraph:
+    with GraphSnapshot(path) as snap:
+        return snap.to_social_graph()
+
+
+def run_benchmark(path: str, n_vertices: int, avg_degree: int) -> None:
+    # imported here: only the benchmark needs the synthetic generator
+    from AssignmentQ2F import random_csr
+    csr = random_csr(n_vertices, avg_degree)
+    csr = CSRGraph([Person(f"u{i:07d}", f"User {i}", "", "", "public") for i in range(n_vertices)],
+                   csr.offsets, csr.targets)
+    start = perf_counter()
+    save_graph(path, csr)
+    print(f"save  {perf_counter() - start:8.2f} s  {os.path.getsize(path) / 2 ** 20:,.1f} MiB")
+    start = perf_counter()
+    snap = GraphSnapshot(path)
+    print(f"open  {(perf_counter() - start) * 1e3:8.2f} ms")
+    start = perf_counter()
+    total = 0
+    for k in range(1000):
+        i = snap.index_of(f"u{(k * 7919) % n_vertices:07d}")
+        total += len(snap.neighbors(i)) + len(snap.followers(i))
+    print(f"1000 lookups by user_id + neighbours + followers: {(perf_counter() - start) * 1e3:.1f} ms")
+    snap.close()
+
+
+if __name__ == "__main__":
+    target = sys.argv[1] if len(sys.argv) > 1 else "social.graph"
+    if len(sys.argv) > 2:
+        run_benchmark(target, int(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) > 3 else 10)
+    else:
+        g, people = create_sample_graph()
+        print("saved %d vertices, %d edges to %s" % (save_graph(target, g) + (target,)))
+        with GraphSnapshot(target) as snapshot:
+            alice = snapshot.index_of("u001")
+            print("Alice follows:", [p.name for p in snapshot.listOutgoingAdjacentVertex("u001")])
+            print("Bob's followers:", [p.name for p in snapshot.listIncomingAdjacentVertex("u002")])
+            print("Alice's full profile:", repr(snapshot.person(alice)), snapshot.bio(alice))
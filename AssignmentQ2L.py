@@ -0,0 +1,353 @@
+# parallel whole-graph analytics: a process pool over a shared-memory CSR (Q2 social graph)
+import argparse
+import multiprocessing as mp
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from multiprocessing import resource_tracker, util
+from multiprocessing.shared_memory import SharedMemory
+from time import perf_counter
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from AssignmentQ2E import DirectedGraph
+from AssignmentQ2F import CSRGraph, random_csr
+from AssignmentQ2G import bfs_ids
+
+# ranges handed out per worker; more, smaller ranges even out hub-heavy parts of the graph
+CHUNKS_PER_WORKER = 4
+
+
+class CSRView:
+    """offsets/targets of a CSR (and of its transpose) without the vertex table.
+
+    The buffers are either the CSRGraph's own arrays or memoryviews cast over a
+    shared-memory block; the id-level traversals in AssignmentQ2G only need
+    num_vertices, offsets and targets, so they run on either.
+    """
+
+    def __init__(self, num_vertices: int, offsets: Sequence[int], targets: Sequence[int],
+                 in_offsets: Sequence[int], in_targets: Sequence[int]):
+        self.num_vertices = num_vertices
+        self.offsets = offsets
+        self.targets = targets
+        self.in_offsets = in_offsets
+        self.in_targets = in_targets
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    @classmethod
+    def of(cls, csr: CSRGraph) -> "CSRView":
+        rev = csr.transpose()
+        return cls(csr.num_vertices, csr.offsets, csr.targets, rev.offsets, rev.targets)
+
+
+class SharedSpec(NamedTuple):
+    # everything a worker needs to attach: block name, sizes and where each array starts
+    name: str
+    num_vertices: int
+    num_edges: int
+    typecode: str
+    sections: Tuple[int, int, int, int]
+
+
+def _views(buf: memoryview, spec: SharedSpec) -> CSRView:
+    n, m = spec.num_vertices, spec.num_edges
+    width = array(spec.typecode).itemsize
+    out_off, out_tgt, in_off, in_tgt = spec.sections
+    return CSRView(n,
+                   buf[out_off:out_off + 8 * (n + 1)].cast("q"),
+                   buf[out_tgt:out_tgt + width * m].cast(spec.typecode),
+                   buf[in_off:in_off + 8 * (n + 1)].cast("q"),
+                   buf[in_tgt:in_tgt + width * m].cast(spec.typecode))
+
+
+def _release(view: CSRView) -> None:
+    for part in (view.offsets, view.targets, view.in_offsets, view.in_targets):
+        part.release()
+
+
+class SharedCSR:
+    """The out- and in-CSR of a graph copied once into a single SharedMemory block.
+
+    Workers attach by name (see spec) and cast memoryviews over it, so the edge
+    arrays exist once in physical memory however many processes read them.
+    Only the creating process unlinks the block, in close().
+    """
+
+    def __init__(self, csr: CSRGraph):
+        rev = csr.transpose()
+        parts = (csr.offsets, csr.targets, rev.offsets, rev.targets)
+        sections = []
+        size = 0
+        for part in parts:
+            sections.append(size)
+            size += len(part) * part.itemsize
+            size += -size % 8
+        self._shm = SharedMemory(create=True, size=max(size, 8))
+        for start, part in zip(sections, parts):
+            raw = memoryview(part).cast("B")
+            self._shm.buf[start:start + len(raw)] = raw
+            raw.release()
+        self.spec = SharedSpec(self._shm.name, csr.num_vertices, csr.num_edges, csr.targets.typecode,
+                               tuple(sections))
+        self.view = _views(self._shm.buf, self.spec)
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        # the cast views are exports of the block's buffer: release them before closing it
+        _release(self.view)
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+
+# --- the per-range work; runs in a worker, or in-process for the serial baseline ---
+
+def degree_histograms(view: CSRView, lo: int, hi: int) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """({out-degree: how many vertices}, {in-degree: how many vertices}) over vertex ids lo..hi-1."""
+    offsets = view.offsets
+    in_offsets = view.in_offsets
+    out_hist = Counter(offsets[i + 1] - offsets[i] for i in range(lo, hi))
+    in_hist = Counter(in_offsets[i + 1] - in_offsets[i] for i in range(lo, hi))
+    return dict(out_hist), dict(in_hist)
+
+
+def reach_counts_of(view: CSRView, sources: Sequence[int], max_depth: int = -1) -> array:
+    """How many accounts each source reaches (itself excluded), optionally within max_depth hops."""
+    return array("q", [len(bfs_ids(view, s, max_depth)) - 1 for s in sources])
+
+
+def recommend_range(view: CSRView, lo: int, hi: int, k: int, max_fanout: int) -> Tuple[array, array]:
+    """Top-k friend-of-friend candidates by mutual-follow count for vertex ids lo..hi-1.
+
+    Row u - lo of the two returned arrays holds u's k candidate ids and their mutual
+    counts, best first (ties by lower id), padded with -1/0 when u has fewer.
+    """
+    offsets = view.offsets
+    targets = view.targets
+    candidates = array("q", [-1]) * ((hi - lo) * k)
+    scores = array("q", [0]) * ((hi - lo) * k)
+    for u in range(lo, hi):
+        following = targets[offsets[u]:offsets[u + 1]]
+        excluded = set(following)
+        excluded.add(u)
+        mutual: Dict[int, int] = {}
+        for z in following:
+            start = offsets[z]
+            # targets are id-sorted, so the fanout cap keeps the lowest ids: deterministic
+            for c in targets[start:min(offsets[z + 1], start + max_fanout)]:
+                if c not in excluded:
+                    mutual[c] = mutual.get(c, 0) + 1
+        best = sorted(mutual.items(), key=lambda item: (-item[1], item[0]))[:k]
+        row = (u - lo) * k
+        for j, (c, score) in enumerate(best):
+            candidates[row + j] = c
+            scores[row + j] = score
+    return candidates, scores
+
+
+_TASKS = {
+    "degrees": degree_histograms,
+    "reach": reach_counts_of,
+    "recommend": recommend_range,
+}
+
+# per-worker state, set by _attach_worker when the pool starts the process
+_worker_shm: Optional[SharedMemory] = None
+_worker_view: Optional[CSRView] = None
+
+
+def _attach_worker(spec: SharedSpec) -> None:
+    global _worker_shm, _worker_view
+    # workers share the parent's resource tracker, so attaching here does not
+    # take ownership: the parent alone unlinks the block
+    _worker_shm = SharedMemory(name=spec.name)
+    _worker_view = _views(_worker_shm.buf, spec)
+    util.Finalize(None, _detach_worker, exitpriority=10)
+
+
+def _detach_worker() -> None:
+    global _worker_shm, _worker_view
+    if _worker_shm is not None:
+        _release(_worker_view)
+        _worker_shm.close()
+        _worker_shm = _worker_view = None
+
+
+def _run_task(task: str, args: tuple) -> Any:
+    return _TASKS[task](_worker_view, *args)
+
+
+def partition(offsets: Sequence[int], parts: int) -> List[Tuple[int, int]]:
+    """Split vertex ids into at most `parts` contiguous ranges holding about the same number of edges."""
+    n = len(offsets) - 1
+    m = offsets[n] if n > 0 else 0
+    cuts = {0, n}
+    for j in range(1, parts):
+        cuts.add(bisect_left(offsets, m * j // parts, 0, n))
+    bounds = sorted(cuts)
+    return [(lo, hi) for lo, hi in zip(bounds, bounds[1:]) if lo < hi]
+
+
+class ParallelAnalytics:
+    """Whole-graph analytics split across a process pool reading one shared CSR.
+
+    The graph is frozen to CSR (out- and in-edges), copied once into shared
+    memory, and each analysis is cut into contiguous vertex ranges of about equal
+    edge count; the ranges go to the pool and the partial results are merged here.
+    Results are keyed by CSR vertex id (csr.vertex(i) gives the account).
+    workers=0 runs the same range functions in this process, without a pool or
+    shared memory, which is the serial baseline the benchmark compares against.
+    """
+
+    def __init__(self, graph: Union[DirectedGraph, CSRGraph], workers: Optional[int] = None,
+                 chunks_per_worker: int = CHUNKS_PER_WORKER):
+        self.csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunks = max(1, self.workers) * chunks_per_worker
+        self._shared: Optional[SharedCSR] = None
+        self._pool = None
+        if self.workers == 0:
+            self.view = CSRView.of(self.csr)
+            return
+        self._shared = SharedCSR(self.csr)
+        self.view = self._shared.view
+        ctx = mp.get_context()
+        # start the tracker before the workers so they inherit it instead of each
+        # launching their own, which would unlink the shared block when a worker exits
+        resource_tracker.ensure_running()
+        self._pool = ctx.Pool(self.workers, initializer=_attach_worker, initargs=(self._shared.spec,))
+
+    def _map(self, task: str, jobs: List[tuple]) -> List[Any]:
+        if self._pool is None:
+            return [_TASKS[task](self.view, *args) for args in jobs]
+        # chunksize=1: a worker takes the next range as soon as it finishes one
+        return self._pool.starmap(_run_task, [(task, args) for args in jobs], chunksize=1)
+
+    def _ranges(self) -> List[Tuple[int, int]]:
+        return partition(self.view.offsets, self.chunks)
+
+    def degree_distribution(self) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """({out-degree: count}, {in-degree: count}) over every vertex."""
+        out_hist: Counter = Counter()
+        in_hist: Counter = Counter()
+        for out_part, in_part in self._map("degrees", self._ranges()):
+            out_hist.update(out_part)
+            in_hist.update(in_part)
+        return dict(sorted(out_hist.items())), dict(sorted(in_hist.items()))
+
+    def reach_counts(self, sources: Optional[Sequence[int]] = None, max_depth: int = -1) -> array:
+        """Accounts reachable from each source (default: every vertex), in the order of sources.
+
+        A full BFS costs O(V + E) per source, so on big graphs pass a sample of
+        sources or a max_depth.
+        """
+        if sources is None:
+            sources = range(self.csr.num_vertices)
+        sources = list(sources)
+        step = -(-len(sources) // self.chunks) or 1
+        jobs = [(sources[i:i + step], max_depth) for i in range(0, len(sources), step)]
+        counts = array("q")
+        for part in self._map("reach", jobs):
+            counts.extend(part)
+        return counts
+
+    def recommend_all(self, k: int = 10, max_fanout: int = 500) -> Tuple[array, array]:
+        """Mutual-follow top-k for every vertex: (candidates, scores), row u at [u * k:(u + 1) * k].
+
+        Works on ids only, so unlike AssignmentQ2H.Recommender it does not skip private
+        accounts; it is the bulk precompute, not the cached per-user lookup.
+        """
+        candidates = array("q")
+        scores = array("q")
+        for part_candidates, part_scores in self._map("recommend", [(lo, hi, k, max_fanout)
+                                                                     for lo, hi in self._ranges()]):
+            candidates.extend(part_candidates)
+            scores.extend(part_scores)
+        return candidates, scores
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def __enter__(self) -> "ParallelAnalytics":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# --- speedup vs number of worker processes ---
+
+def run_benchmark(n_vertices: int, avg_degree: int, reach_sources: int, reach_depth: int, k: int,
+                  worker_counts: Optional[List[int]] = None, seed: int = 42) -> List[Dict[str, object]]:
+    cores = os.cpu_count() or 1
+    if worker_counts is None:
+        worker_counts = sorted({1, 2, 4, cores} | {c for c in (8, 16) if c <= cores})
+    start = perf_counter()
+    csr = random_csr(n_vertices, avg_degree, seed)
+    print(f"Graph: V={n_vertices:,}, E={csr.num_edges:,} (built in {perf_counter() - start:.1f} s), "
+          f"cores={cores}")
+    sources = list(range(0, n_vertices, max(1, n_vertices // reach_sources)))[:reach_sources]
+    analyses = (
+        ("degree distribution", lambda pa: pa.degree_distribution()),
+        (f"reach, {len(sources)} sources, depth {reach_depth}", lambda pa: pa.reach_counts(sources, reach_depth)),
+        (f"top-{k} for every user", lambda pa: pa.recommend_all(k)),
+    )
+    results = []
+    baseline: Dict[str, float] = {}
+    expected: Dict[str, Any] = {}
+    # workers=0 is the in-process serial run the pool has to beat
+    for workers in [0] + list(worker_counts):
+        start = perf_counter()
+        with ParallelAnalytics(csr, workers=workers) as pa:
+            setup = perf_counter() - start
+            for label, analysis in analyses:
+                start = perf_counter()
+                result = analysis(pa)
+                secs = perf_counter() - start
+                if workers == 0:
+                    baseline[label] = secs
+                    expected[label] = result
+                elif result != expected[label]:
+                    raise AssertionError(f"{label}: {workers} workers disagree with the serial run")
+                results.append({"workers": workers, "analysis": label, "seconds": secs,
+                                "speedup": baseline[label] / secs if secs else 0.0, "setup": setup})
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Parallel graph analytics benchmark (speedup vs worker processes).")
+    parser.add_argument("-n", "--vertices", type=int, default=1_000_000)
+    parser.add_argument("-d", "--degree", type=int, default=5, help="follows per vertex")
+    parser.add_argument("-w", "--workers", help="comma-separated worker counts (default: 1,2,4,... up to the cores)")
+    parser.add_argument("--sources", type=int, default=2000, help="BFS sources for the reach counts")
+    parser.add_argument("--depth", type=int, default=3, help="BFS depth for the reach counts (-1: unbounded)")
+    parser.add_argument("-k", type=int, default=10, help="recommendations per user")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    worker_counts = [int(w) for w in args.workers.split(",")] if args.workers else None
+    rows = run_benchmark(args.vertices, args.degree, args.sources, args.depth, args.k, worker_counts, args.seed)
+    for row in rows:
+        label = "serial" if row["workers"] == 0 else f"{row['workers']} worker(s)"
+        print(f"  {label:<12} {row['analysis']:<32} {row['seconds']:8.2f} s  x{row['speedup']:.2f}"
+              f"  (setup {row['setup']:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+# loader regression tests: a name shared by two profiles must not abort the load (Q2 social graph)
+import json
+
+from AssignmentQ2J import load_social_graph
+
+
+def _write(tmp_path, edges, profiles):
+    edges_path = tmp_path / "edges.csv"
+    edges_path.write_text("follower,followee\n" + "".join(f"{a},{b}\n" for a, b in edges), encoding="utf-8")
+    profiles_path = tmp_path / "profiles.jsonl"
+    profiles_path.write_text("".join(json.dumps(p) + "\n" for p in profiles), encoding="utf-8")
+    return str(edges_path), str(profiles_path)
+
+
+def test_duplicate_display_names_are_loaded(tmp_path):
+    edges, profiles = _write(tmp_path, [("u1", "u2"), ("u2", "u3"), ("u3", "u1"), ("u4", "u1")], [
+        {"user_id": "u1", "name": "Alex"},
+        {"user_id": "u2", "name": "alex "},
+        {"user_id": "u3", "name": "Sam"},
+    ])
+    graph, stats = load_social_graph(edges, profiles)
+    assert len(graph.vertices()) == 4
+    assert stats.duplicate_names == 1
+    first, second = graph.users.get("u1"), graph.users.get("u2")
+    assert graph.users.find("Alex") is first
+    assert graph.users.find("u2") is second
+    assert graph.listOutgoingAdjacentVertex(second) == [graph.users.get("u3")]
+    # removing the user indexed by id only leaves the other holder of the name in place
+    assert graph.removeVertex(second)
+    assert graph.users.find("alex") is first
+    assert graph.users.search_prefix("al") == [first]
+
+
+def test_placeholder_named_like_another_profile(tmp_path):
+    # u9 has no profile, so its placeholder is named "u9" - which a profile already uses
+    edges, profiles = _write(tmp_path, [("u1", "u9")], [{"user_id": "u1", "name": "u9"}])
+    graph, stats = load_social_graph(edges, profiles)
+    assert stats.duplicate_names == 1
+    assert graph.users.get("u9") is not None
+    assert graph.in_degree(graph.users.get("u9")) == 1